@@ -60,6 +60,20 @@ class ChatCompletionRequest(BaseModel):
     metadata: Optional[Dict[str, str]] = None
 
 
+def _invalid_ark_metadata_response(reason: str) -> JSONResponse:
+    """Build the 400 response returned for unusable Ark metadata."""
+    return JSONResponse(
+        status_code=400,
+        content={
+            "error": {
+                "message": f"Invalid Ark metadata: {reason}",
+                "type": "invalid_request_error",
+                "code": "invalid_ark_metadata",
+            }
+        },
+    )
+
+
 def process_request_metadata(
     request_metadata: Optional[Dict[str, str]], base_metadata: Dict[str, any]
 ) -> Optional[JSONResponse]:
@@ -72,25 +86,18 @@ def process_request_metadata(
 
     # Handle Ark-specific metadata
     if "ark" in request_metadata:
+        raw_ark_metadata = request_metadata["ark"]
+        # The metadata is a JSON object; reject anything else without running the parser
+        if not raw_ark_metadata.lstrip().startswith("{"):
+            return _invalid_ark_metadata_response("expected a JSON object")
         try:
-            ark_metadata = ArkOpenAICompletionsMetadata.model_validate_json(
-                request_metadata["ark"]
-            )
+            ark_metadata = ArkOpenAICompletionsMetadata.model_validate_json(raw_ark_metadata)
             if ark_metadata.annotations:
                 if "annotations" not in base_metadata:
                     base_metadata["annotations"] = {}
                 base_metadata["annotations"].update(ark_metadata.annotations)
         except ValidationError as e:
-            return JSONResponse(
-                status_code=400,
-                content={
-                    "error": {
-                        "message": f"Invalid Ark metadata: {str(e)}",
-                        "type": "invalid_request_error",
-                        "code": "invalid_ark_metadata",
-                    }
-                },
-            )
+            return _invalid_ark_metadata_response(str(e))
     # Ignore other metadata keys per OpenAI SDK pattern
     return None
 
@@ -107,7 +114,7 @@ async def proxy_streaming_response(streaming_url: str):
                 # We control the error format, so read it directly and fail if invalid
                 try:
                     response_text = await response.aread()
-                    response_json = json.loads(response_text.decode("utf-8"))
+                    response_json = json.loads(response_text)
                     
                     # Expected structure: {"error": {"message": "...", "type": "...", "code": "..."}}
                     if not isinstance(response_json, dict) or "error" not in response_json:
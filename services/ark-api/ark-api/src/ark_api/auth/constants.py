@@ -19,6 +19,11 @@ class AuthMode(StrEnum):
     OPEN = "open"
 
 
+VALID_AUTH_MODES = frozenset(AuthMode)
+JWT_AUTH_MODES = frozenset({AuthMode.SSO, AuthMode.HYBRID})
+BASIC_AUTH_MODES = frozenset({AuthMode.BASIC, AuthMode.HYBRID})
+
+
 class AuthHeader(StrEnum):
     """Authorization header prefixes."""
     BEARER = "Bearer "
@@ -19,7 +19,7 @@ from fastapi.responses import JSONResponse
 from starlette.middleware.base import BaseHTTPMiddleware
 
 from .config import is_route_authenticated
-from .constants import AuthMode, AuthHeader
+from .constants import AuthMode, AuthHeader, VALID_AUTH_MODES, JWT_AUTH_MODES, BASIC_AUTH_MODES
 
 # Import from ark_sdk
 from ark_sdk.auth.exceptions import TokenValidationError
@@ -63,15 +63,14 @@ class AuthMiddleware(BaseHTTPMiddleware):
         oidc_app_id = os.getenv("OIDC_APPLICATION_ID", "")
         
         # Validate auth mode
-        valid_auth_modes = [AuthMode.SSO, AuthMode.BASIC, AuthMode.HYBRID, AuthMode.OPEN]
-        if auth_mode and auth_mode not in valid_auth_modes:
+        if auth_mode and auth_mode not in VALID_AUTH_MODES:
             raise ValueError(
                 f"Invalid AUTH_MODE '{auth_mode}'. "
-                f"Valid values are: {', '.join(valid_auth_modes)}"
+                f"Valid values are: {', '.join(AuthMode)}"
             )
         
         # If SSO or HYBRID mode, require OIDC configuration
-        if auth_mode in [AuthMode.SSO, AuthMode.HYBRID]:
+        if auth_mode in JWT_AUTH_MODES:
             missing_params = []
             if not oidc_issuer:
                 missing_params.append("OIDC_ISSUER_URL")
@@ -98,8 +97,8 @@ class AuthMiddleware(BaseHTTPMiddleware):
         logger.debug(f"Auth mode: {auth_mode}, Path: {path}")
         
         # Determine which auth methods are enabled
-        jwt_enabled = auth_mode in [AuthMode.SSO, AuthMode.HYBRID]
-        basic_enabled = auth_mode in [AuthMode.BASIC, AuthMode.HYBRID]
+        jwt_enabled = auth_mode in JWT_AUTH_MODES
+        basic_enabled = auth_mode in BASIC_AUTH_MODES
         auth_disabled = auth_mode == AuthMode.OPEN
         
         if auth_disabled:
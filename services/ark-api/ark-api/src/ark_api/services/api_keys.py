@@ -35,6 +35,9 @@ API_KEY_ANNOTATION = ARK_PREFIX + "api-key-metadata"  # JSON annotation with all
 PUBLIC_KEY_TOKEN_LENGTH = 32  # bytes for public key token generation
 SECRET_KEY_TOKEN_LENGTH = 48  # bytes for secret key token generation
 
+# bcrypt work factor used when hashing secret keys
+BCRYPT_ROUNDS = 12
+
 
 class APIKeyService:
     """Service for managing API keys stored as Kubernetes secrets."""
@@ -65,7 +68,7 @@ class APIKeyService:
         Returns:
             Base64-encoded bcrypt hash
         """
-        salt = bcrypt.gensalt()
+        salt = bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
         hashed = bcrypt.hashpw(secret_key.encode('utf-8'), salt)
         return base64.b64encode(hashed).decode('utf-8')
     
@@ -174,7 +177,7 @@ class APIKeyService:
         if deleted_at:
             metadata["deletedAt"] = self._format_datetime(deleted_at)
         
-        return json.dumps(metadata)
+        return json.dumps(metadata, separators=(",", ":"))
     
     def _parse_api_key_annotation(self, annotation_json: str) -> Dict[str, Any]:
         """Parse JSON annotation to extract API key metadata.
@@ -2,12 +2,91 @@
 import os
 import unittest
 import unittest.mock
-from unittest.mock import Mock, patch, AsyncMock
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
+from fastapi import HTTPException
 from fastapi.testclient import TestClient
+from kubernetes.client.exceptions import ApiException as SyncApiException
 
 # Set environment variable to skip authentication before importing the app
 os.environ["AUTH_MODE"] = "open"
 
+from ark_api.api.v1 import queries as queries_mod, teams as teams_mod, models as models_mod
+from ark_api.models.teams import TeamCreateRequest, TeamUpdateRequest
+
+EXPECTED_QUERIES_LIST = {
+    "count": 2,
+    "items": [
+        {
+            "name": "test-query",
+            "namespace": "default",
+            "type": "user",
+            "input": "What is the weather today?",
+            "memory": None,
+            "sessionId": None,
+            "status": {
+                "phase": "done",
+                "response": "It's sunny and 72°F",
+                "conditions": [
+                    {
+                        "type": "Completed",
+                        "status": "True",
+                        "reason": "QuerySucceeded",
+                        "message": "Query completed successfully",
+                        "lastTransitionTime": "2025-01-15T10:30:00Z",
+                        "observedGeneration": 1
+                    }
+                ]
+            },
+            "creationTimestamp": None
+        },
+        {
+            "name": "another-query",
+            "namespace": "default",
+            "type": "user",
+            "input": "Tell me a joke",
+            "memory": None,
+            "sessionId": None,
+            "status": {
+                "phase": "running",
+                "conditions": [
+                    {
+                        "type": "Completed",
+                        "status": "False",
+                        "reason": "QueryRunning",
+                        "message": "Query is currently running",
+                        "lastTransitionTime": "2025-01-15T10:25:00Z",
+                        "observedGeneration": 1
+                    }
+                ]
+            },
+            "creationTimestamp": None
+        }
+    ]
+}
+
+BASE_TEAM = {
+    "metadata": {"name": "test-team", "namespace": "default"},
+    "spec": {
+        "description": "Original description",
+        "members": [{"name": "agent1", "type": "agent"}],
+        "strategy": "sequential",
+        "maxTurns": 5
+    },
+    "status": {"phase": "Ready"}
+}
+
+GRAPH_TEAM_WITHOUT_MAX_TURNS = {
+    "name": "invalid-graph-team",
+    "members": [
+        {"name": "agent1", "type": "agent"},
+        {"name": "agent2", "type": "agent"}
+    ],
+    "strategy": "graph",
+    "graph": {
+        "edges": [{"from": "agent1", "to": "agent2"}]
+    }
+}
+
 
 class TestNamespacesEndpoint(unittest.TestCase):
     """Test cases for the /namespaces endpoint."""
@@ -87,7 +166,7 @@ class TestDeleteEndpoints(unittest.TestCase):
         # Assert response
         self.assertEqual(response.status_code, 500)
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_delete_model_success(self, mock_with_ark_client):
         """Test successful model deletion."""
         # Setup mock
@@ -117,7 +196,7 @@ class TestDeleteEndpoints(unittest.TestCase):
         self.assertEqual(response.status_code, 204)
         mock_client.tools.a_delete.assert_called_once_with("test-tool")
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
+    @patch.object(teams_mod, 'with_ark_client')
     def test_delete_team_success(self, mock_with_ark_client):
         """Test successful team deletion."""
         # Setup mock
@@ -130,9 +209,10 @@ class TestDeleteEndpoints(unittest.TestCase):
         
         # Assert response
         self.assertEqual(response.status_code, 204)
-        mock_client.teams.a_delete.assert_called_once_with("test-team")
+        self.assertEqual(mock_client.teams.a_delete.call_count, 1)
+        self.assertEqual(mock_client.teams.a_delete.call_args.args, ("test-team",))
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_delete_query_success(self, mock_with_ark_client):
         """Test successful query deletion."""
         # Setup mock
@@ -1055,7 +1135,7 @@ class TestModelsEndpoint(unittest.TestCase):
         from ark_api.main import app
         self.client = TestClient(app)
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_list_models_success(self, mock_ark_client):
         """Test successful model listing."""
         # Setup async context manager mock
@@ -1111,7 +1191,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["items"][1]["model"], "anthropic.claude-v2")
         self.assertEqual(data["items"][1]["available"], "False")
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_list_models_empty(self, mock_ark_client):
         """Test listing models when none exist in the namespace."""
         # Setup async context manager mock
@@ -1130,7 +1210,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["count"], 0)
         self.assertEqual(data["items"], [])
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_create_model_openai_success(self, mock_ark_client):
         """Test successful OpenAI model creation."""
         # Setup async context manager mock
@@ -1178,7 +1258,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["config"]["openai"]["apiKey"]["value"], "sk-test")
         self.assertEqual(data["config"]["openai"]["baseUrl"]["value"], "https://api.openai.com/v1")
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_create_model_azure_success(self, mock_ark_client):
         """Test successful Azure model creation."""
         # Setup async context manager mock
@@ -1226,7 +1306,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["type"], "azure")
         self.assertEqual(data["config"]["azure"]["apiVersion"]["value"], "2023-05-15")
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_create_model_bedrock_success(self, mock_ark_client):
         """Test successful Bedrock model creation."""
         # Setup async context manager mock
@@ -1280,7 +1360,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["config"]["bedrock"]["maxTokens"]["value"], "1000")
         self.assertEqual(data["config"]["bedrock"]["temperature"]["value"], "0.7")
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_get_model_success(self, mock_ark_client):
         """Test successfully retrieving a model."""
         # Setup async context manager mock
@@ -1324,7 +1404,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["resolved_address"], "https://api.openai.com/v1")
         self.assertIn("valueFrom", data["config"]["openai"]["apiKey"])
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_update_model_success(self, mock_ark_client):
         """Test successful model update."""
         # Setup async context manager mock
@@ -1385,7 +1465,7 @@ class TestModelsEndpoint(unittest.TestCase):
         self.assertEqual(data["model"], "gpt-4")
         self.assertEqual(data["config"]["openai"]["apiKey"]["value"], "new-key")
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_update_model_partial(self, mock_ark_client):
         """Test partial model update."""
         # Setup async context manager mock
@@ -1438,7 +1518,7 @@ class TestModelsEndpoint(unittest.TestCase):
         # Config should remain unchanged
         self.assertEqual(data["config"]["openai"]["apiKey"]["value"], "test-key")
     
-    @patch('ark_api.api.v1.models.with_ark_client')
+    @patch.object(models_mod, 'with_ark_client')
     def test_delete_model_success(self, mock_ark_client):
         """Test successful model deletion."""
         # Setup async context manager mock
@@ -1466,7 +1546,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         from ark_api.main import app
         self.client = TestClient(app)
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_list_queries_success(self, mock_ark_client):
         """Test successful query listing."""
         # Setup async context manager mock
@@ -1525,33 +1605,9 @@ class TestQueriesEndpoint(unittest.TestCase):
         
         # Assert response
         self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertEqual(data["count"], 2)
-        self.assertEqual(len(data["items"]), 2)
-        
-        # Check first query
-        self.assertEqual(data["items"][0]["name"], "test-query")
-        self.assertEqual(data["items"][0]["input"], "What is the weather today?")
-        self.assertEqual(data["items"][0]["status"]["phase"], "done")
-        # Check conditions field
-        self.assertIn("conditions", data["items"][0]["status"])
-        self.assertEqual(len(data["items"][0]["status"]["conditions"]), 1)
-        self.assertEqual(data["items"][0]["status"]["conditions"][0]["type"], "Completed")
-        self.assertEqual(data["items"][0]["status"]["conditions"][0]["status"], "True")
-        self.assertEqual(data["items"][0]["status"]["conditions"][0]["reason"], "QuerySucceeded")
-        
-        # Check second query
-        self.assertEqual(data["items"][1]["name"], "another-query")
-        self.assertEqual(data["items"][1]["input"], "Tell me a joke")
-        self.assertEqual(data["items"][1]["status"]["phase"], "running")
-        # Check conditions field
-        self.assertIn("conditions", data["items"][1]["status"])
-        self.assertEqual(len(data["items"][1]["status"]["conditions"]), 1)
-        self.assertEqual(data["items"][1]["status"]["conditions"][0]["type"], "Completed")
-        self.assertEqual(data["items"][1]["status"]["conditions"][0]["status"], "False")
-        self.assertEqual(data["items"][1]["status"]["conditions"][0]["reason"], "QueryRunning")
+        self.assertEqual(response.json(), EXPECTED_QUERIES_LIST)
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_list_queries_empty(self, mock_ark_client):
         """Test listing queries when none exist in the namespace."""
         # Setup async context manager mock
@@ -1570,7 +1626,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["count"], 0)
         self.assertEqual(data["items"], [])
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_create_query_simple(self, mock_ark_client):
         """Test creating a simple query."""
         # Setup async context manager mock
@@ -1602,7 +1658,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["name"], "simple-query")
         self.assertEqual(data["input"], "What is 2+2?")
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_create_query_with_targets(self, mock_ark_client):
         """Test creating a query with targets."""
         # Setup async context manager mock
@@ -1644,7 +1700,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["targets"][0]["name"], "code-analyzer")
         self.assertEqual(data["targets"][0]["type"], "agent")
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_create_query_with_all_fields(self, mock_ark_client):
         """Test creating a query with all optional fields."""
         # Setup async context manager mock
@@ -1692,7 +1748,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["serviceAccount"], "query-runner")
         self.assertEqual(data["sessionId"], "session-123")
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_get_query_success(self, mock_ark_client):
         """Test successfully retrieving a query."""
         # Setup async context manager mock
@@ -1742,7 +1798,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["status"]["conditions"][0]["status"], "True")
         self.assertEqual(data["status"]["conditions"][0]["reason"], "QuerySucceeded")
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_update_query_success(self, mock_ark_client):
         """Test successful query update."""
         # Setup async context manager mock
@@ -1790,7 +1846,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["input"], "New question")
         self.assertEqual(data["sessionId"], "new-session")
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_update_query_partial(self, mock_ark_client):
         """Test partial query update."""
         # Setup async context manager mock
@@ -1838,7 +1894,7 @@ class TestQueriesEndpoint(unittest.TestCase):
         self.assertEqual(data["memory"]["name"], "new-memory")  # Updated
         self.assertEqual(data["sessionId"], "old-session")  # Unchanged
     
-    @patch('ark_api.api.v1.queries.with_ark_client')
+    @patch.object(queries_mod, 'with_ark_client')
     def test_delete_query_success(self, mock_ark_client):
         """Test successful query deletion."""
         # Setup async context manager mock
@@ -1858,20 +1914,34 @@ class TestQueriesEndpoint(unittest.TestCase):
         mock_client.queries.a_delete.assert_called_once_with("test-query")
 
 
+def mock_team_client(test_case):
+    """Replace teams.with_ark_client for one test and return the ark client it yields."""
+    mock_client = AsyncMock()
+    client_context = MagicMock()
+    client_context.__aenter__ = AsyncMock(return_value=mock_client)
+    client_context.__aexit__ = AsyncMock(return_value=None)
+    original = teams_mod.with_ark_client
+    teams_mod.with_ark_client = MagicMock(return_value=client_context)
+    test_case.addCleanup(setattr, teams_mod, 'with_ark_client', original)
+    return mock_client
+
+
 class TestTeamsEndpoint(unittest.TestCase):
     """Test cases for the /namespaces/{namespace}/teams endpoint."""
     
-    def setUp(self):
-        """Set up test client."""
+    @classmethod
+    def setUpClass(cls):
+        """Set up a test client shared by all team tests."""
         from ark_api.main import app
-        self.client = TestClient(app)
+        cls.client = TestClient(app)
+    
+    def setUp(self):
+        """Point the teams router at a mocked ark client."""
+        self.mock_client = mock_team_client(self)
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_list_teams_success(self, mock_ark_client):
+    def test_list_teams_success(self):
         """Test successful team listing."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock team objects
         mock_team1 = Mock()
@@ -1923,12 +1993,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["items"][1]["members_count"], 1)
         self.assertEqual(data["items"][1]["status"], "pending")
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_list_teams_empty(self, mock_ark_client):
+    def test_list_teams_empty(self):
         """Test listing teams when none exist in the namespace."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock empty response
         mock_client.teams.a_list = AsyncMock(return_value=[])
@@ -1942,12 +2009,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["count"], 0)
         self.assertEqual(data["items"], [])
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_create_team_simple(self, mock_ark_client):
+    def test_create_team_simple(self):
         """Test creating a simple team."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock the created team response
         mock_team = Mock()
@@ -1984,12 +2048,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["strategy"], "sequential")
     
     @unittest.skip("Skip due to SDK model issue with 'from' field aliasing")
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_create_team_with_graph(self, mock_ark_client):
+    def test_create_team_with_graph(self):
         """Test creating a team with graph workflow."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock the created team response
         mock_team = Mock()
@@ -2043,12 +2104,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["graph"]["edges"][0]["from"], "planner")
         self.assertEqual(data["graph"]["edges"][0]["to"], "executor")
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_create_team_with_all_fields(self, mock_ark_client):
+    def test_create_team_with_all_fields(self):
         """Test creating a team with all optional fields."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock the created team response
         mock_team = Mock()
@@ -2091,12 +2149,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["selector"]["agent"], "selector-agent")
         self.assertEqual(data["selector"]["selectorPrompt"], "Choose the best agent for the task")
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_create_team_with_selector_and_graph(self, mock_ark_client):
+    def test_create_team_with_selector_and_graph(self):
         """Test creating a team with selector strategy and graph constraints."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock the created team response
         mock_team = Mock()
@@ -2162,12 +2217,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["graph"]["edges"][0]["to"], "analyzer")
         self.assertEqual(data["maxTurns"], 10)
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_get_team_success(self, mock_ark_client):
+    def test_get_team_success(self):
         """Test successfully retrieving a team."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock the team response
         mock_team = Mock()
@@ -2201,12 +2253,9 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(data["strategy"], "parallel")
         self.assertEqual(data["status"]["phase"], "Ready")
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_update_team_success(self, mock_ark_client):
+    def test_update_team_success(self):
         """Test successful team update."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock existing team
         existing_team = Mock()
@@ -2257,80 +2306,61 @@ class TestTeamsEndpoint(unittest.TestCase):
         self.assertEqual(len(data["members"]), 2)
         self.assertEqual(data["strategy"], "parallel")
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_update_team_partial(self, mock_ark_client):
+    def test_delete_team_success(self):
+        """Test successful team deletion."""
+        mock_client = self.mock_client
+        
+        # Mock successful deletion (no return value)
+        mock_client.teams.a_delete = AsyncMock(return_value=None)
+        
+        # Make the request
+        response = self.client.delete("/v1/teams/test-team?namespace=default")
+        
+        # Assert response
+        self.assertEqual(response.status_code, 204)
+        
+        # Verify the delete was called correctly
+        self.assertEqual(mock_client.teams.a_delete.call_count, 1)
+        self.assertEqual(mock_client.teams.a_delete.call_args.args, ("test-team",))
+
+
+class TestTeamsRouteHandlers(unittest.IsolatedAsyncioTestCase):
+    """Test cases that call the team route handlers directly, without an HTTP round trip."""
+    
+    def setUp(self):
+        """Point the teams router at a mocked ark client."""
+        self.mock_client = mock_team_client(self)
+    
+    async def test_update_team_partial(self):
         """Test partial team update."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Mock existing team
         existing_team = Mock()
-        existing_team.to_dict.return_value = {
-            "metadata": {"name": "test-team", "namespace": "default"},
-            "spec": {
-                "description": "Original description",
-                "members": [{"name": "agent1", "type": "agent"}],
-                "strategy": "sequential",
-                "maxTurns": 5
-            },
-            "status": {"phase": "Ready"}
-        }
+        existing_team.to_dict.return_value = {**BASE_TEAM, "spec": dict(BASE_TEAM["spec"])}
         
         # Mock updated team
         updated_team = Mock()
-        updated_team.to_dict.return_value = {
-            "metadata": {"name": "test-team", "namespace": "default"},
-            "spec": {
-                "description": "Original description",
-                "members": [{"name": "agent1", "type": "agent"}],
-                "strategy": "sequential",
-                "maxTurns": 10
-            },
-            "status": {"phase": "Ready"}
-        }
+        updated_team.to_dict.return_value = {**BASE_TEAM, "spec": {**BASE_TEAM["spec"], "maxTurns": 10}}
         
         mock_client.teams.a_get = AsyncMock(return_value=existing_team)
         mock_client.teams.a_update = AsyncMock(return_value=updated_team)
         
-        # Make the request - only update maxTurns
-        request_data = {"maxTurns": 10}
-        response = self.client.put("/v1/teams/test-team?namespace=default", json=request_data)
+        # Call the handler - only update maxTurns
+        result = await teams_mod.update_team(
+            team_name="test-team",
+            body=TeamUpdateRequest(maxTurns=10),
+            namespace="default"
+        )
         
         # Assert response
-        self.assertEqual(response.status_code, 200)
-        data = response.json()
-        self.assertEqual(data["description"], "Original description")  # Unchanged
-        self.assertEqual(data["strategy"], "sequential")  # Unchanged
-        self.assertEqual(data["maxTurns"], 10)  # Updated
+        self.assertEqual(result.description, "Original description")  # Unchanged
+        self.assertEqual(result.strategy, "sequential")  # Unchanged
+        self.assertEqual(result.maxTurns, 10)  # Updated
     
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_delete_team_success(self, mock_ark_client):
-        """Test successful team deletion."""
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
-        
-        # Mock successful deletion (no return value)
-        mock_client.teams.a_delete = AsyncMock(return_value=None)
-        
-        # Make the request
-        response = self.client.delete("/v1/teams/test-team?namespace=default")
-        
-        # Assert response
-        self.assertEqual(response.status_code, 204)
-        
-        # Verify the delete was called correctly
-        mock_client.teams.a_delete.assert_called_once_with("test-team")
-    
-    @patch('ark_api.api.v1.teams.with_ark_client')
-    def test_create_team_validation_error_from_webhook(self, mock_ark_client):
+    async def test_create_team_validation_error_from_webhook(self):
         """Test that admission webhook validation errors return 403 with proper error message."""
-        from kubernetes.client.exceptions import ApiException as SyncApiException
-        
-        # Setup async context manager mock
-        mock_client = AsyncMock()
-        mock_ark_client.return_value.__aenter__.return_value = mock_client
+        mock_client = self.mock_client
         
         # Create a realistic admission webhook error (403 from Kubernetes)
         webhook_error_body = '{"kind":"Status","apiVersion":"v1","metadata":{},"status":"Failure","message":"admission webhook \\"vteam-v1.kb.io\\" denied the request: graph strategy requires maxTurns to prevent infinite execution","reason":"Forbidden","code":403}'
@@ -2344,22 +2374,11 @@ class TestTeamsEndpoint(unittest.TestCase):
         
         mock_client.teams.a_create = AsyncMock(side_effect=wrapped_exception)
         
-        # Make the request (graph team without maxTurns)
-        request_data = {
-            "name": "invalid-graph-team",
-            "members": [
-                {"name": "agent1", "type": "agent"},
-                {"name": "agent2", "type": "agent"}
-            ],
-            "strategy": "graph",
-            "graph": {
-                "edges": [{"from": "agent1", "to": "agent2"}]
-            }
-        }
-        response = self.client.post("/v1/teams?namespace=default", json=request_data)
+        # Call the handler (graph team without maxTurns)
+        with self.assertRaises(HTTPException) as context:
+            await teams_mod.create_team(body=TeamCreateRequest(**GRAPH_TEAM_WITHOUT_MAX_TURNS), namespace="default")
         
         # Assert that we get 403 (not 500) with the proper validation message
-        self.assertEqual(response.status_code, 403)
-        data = response.json()
-        self.assertIn("graph strategy requires maxTurns", data["detail"])
-        self.assertIn("admission webhook", data["detail"])
\ No newline at end of file
+        self.assertEqual(context.exception.status_code, 403)
+        self.assertIn("graph strategy requires maxTurns", context.exception.detail)
+        self.assertIn("admission webhook", context.exception.detail)
\ No newline at end of file
@@ -8,7 +8,7 @@ import unittest
 import os
 from unittest.mock import patch
 
-from ark_api.auth.constants import AuthMode
+from ark_api.auth.constants import AuthMode, VALID_AUTH_MODES
 
 
 class TestAuthConfig(unittest.TestCase):
@@ -45,32 +45,31 @@ class TestAuthConfig(unittest.TestCase):
 
     def test_auth_mode_parsing(self):
         """Test AUTH_MODE environment variable parsing."""
-        # Test SSO mode (authentication required)
-        for value in [AuthMode.SSO, 'SSO', 'Sso']:
-            with patch.dict(os.environ, {'AUTH_MODE': value}):
-                auth_mode = os.getenv("AUTH_MODE", "").lower()
-                skip_auth = auth_mode != AuthMode.SSO
-                self.assertFalse(skip_auth, f"Failed for value: {value}")
-
-        # Test non-SSO modes (authentication skipped)
-        for value in [AuthMode.OPEN, 'Open', 'OPEN', 'false', 'true', 'off', 'on', '', None]:
-            with patch.dict(os.environ, {'AUTH_MODE': value} if value is not None else {}):
+        # (AUTH_MODE value, expected skip_auth); None leaves AUTH_MODE unset.
+        # tearDown removes AUTH_MODE, so the environment is mutated directly.
+        cases = [
+            (AuthMode.SSO, False), ('SSO', False), ('Sso', False),
+            (AuthMode.OPEN, True), ('Open', True), ('OPEN', True), ('false', True),
+            ('true', True), ('off', True), ('on', True), ('', True), (None, True),
+        ]
+        for value, expected_skip_auth in cases:
+            with self.subTest(value=value):
+                if value is None:
+                    os.environ.pop('AUTH_MODE', None)
+                else:
+                    os.environ['AUTH_MODE'] = value
                 auth_mode = os.getenv("AUTH_MODE", "").lower()
                 skip_auth = auth_mode != AuthMode.SSO
-                self.assertTrue(skip_auth, f"Failed for value: {value}")
+                self.assertEqual(skip_auth, expected_skip_auth, f"Failed for value: {value}")
 
     def test_auth_mode_validation_with_invalid_values(self):
         """Test AUTH_MODE validation logic that defaults invalid values to 'open'."""
-        from ark_api.auth.constants import AuthMode
-        
         # Test valid auth modes
-        valid_auth_modes = [AuthMode.SSO, AuthMode.BASIC, AuthMode.HYBRID, AuthMode.OPEN]
-        
-        for valid_mode in valid_auth_modes:
+        for valid_mode in AuthMode:
             with self.subTest(mode=valid_mode):
                 auth_mode_raw = valid_mode.lower()
                 # Simulate the validation logic from middleware
-                if auth_mode_raw in valid_auth_modes:
+                if auth_mode_raw in VALID_AUTH_MODES:
                     auth_mode = auth_mode_raw
                 else:
                     auth_mode = AuthMode.OPEN
@@ -84,7 +83,7 @@ class TestAuthConfig(unittest.TestCase):
             with self.subTest(mode=invalid_mode):
                 auth_mode_raw = invalid_mode.lower()
                 # Simulate the validation logic from middleware
-                if auth_mode_raw in valid_auth_modes:
+                if auth_mode_raw in VALID_AUTH_MODES:
                     auth_mode = auth_mode_raw
                 else:
                     auth_mode = AuthMode.OPEN
@@ -97,7 +96,7 @@ class TestAuthConfig(unittest.TestCase):
             with self.subTest(mode=empty_value):
                 auth_mode_raw = (empty_value or "").lower()
                 # Simulate the validation logic from middleware
-                if auth_mode_raw in valid_auth_modes:
+                if auth_mode_raw in VALID_AUTH_MODES:
                     auth_mode = auth_mode_raw
                 else:
                     auth_mode = AuthMode.OPEN
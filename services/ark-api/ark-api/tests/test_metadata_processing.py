@@ -1,95 +1,131 @@
 """Tests for Ark metadata processing in OpenAI completions."""
 
 import json
+import unittest
 from fastapi.responses import JSONResponse
 
 from ark_api.api.v1.openai import process_request_metadata
 from ark_api.models.queries import ArkOpenAICompletionsMetadata
 
 
-def test_process_request_metadata_none():
-    """Test processing with no metadata."""
-    base_metadata = {"name": "test", "namespace": "default"}
-    result = process_request_metadata(None, base_metadata)
+class TestProcessRequestMetadata(unittest.TestCase):
+    """Test cases for merging Ark request metadata into query metadata."""
 
-    assert result is None
-    assert base_metadata == {"name": "test", "namespace": "default"}
+    def test_process_request_metadata_none(self):
+        """Test processing with no metadata."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        result = process_request_metadata(None, base_metadata)
 
+        self.assertIsNone(result)
+        self.assertEqual(base_metadata, {"name": "test", "namespace": "default"})
 
-def test_process_request_metadata_no_ark():
-    """Test processing with metadata but no ark key."""
-    base_metadata = {"name": "test", "namespace": "default"}
-    request_metadata = {"user_id": "123", "session": "abc"}
-    result = process_request_metadata(request_metadata, base_metadata)
+    def test_process_request_metadata_no_ark(self):
+        """Test processing with metadata but no ark key."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        request_metadata = {"user_id": "123", "session": "abc"}
+        result = process_request_metadata(request_metadata, base_metadata)
 
-    assert result is None
-    assert base_metadata == {"name": "test", "namespace": "default"}
+        self.assertIsNone(result)
+        self.assertEqual(base_metadata, {"name": "test", "namespace": "default"})
 
+    def test_process_request_metadata_with_annotations(self):
+        """Test processing with valid ark annotations."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        ark_data = {"annotations": {"ark.mckinsey.com/a2a-context-id": "abc-123"}}
+        request_metadata = {"ark": json.dumps(ark_data)}
 
-def test_process_request_metadata_with_annotations():
-    """Test processing with valid ark annotations."""
-    base_metadata = {"name": "test", "namespace": "default"}
-    ark_data = {"annotations": {"ark.mckinsey.com/a2a-context-id": "abc-123"}}
-    request_metadata = {"ark": json.dumps(ark_data)}
+        result = process_request_metadata(request_metadata, base_metadata)
 
-    result = process_request_metadata(request_metadata, base_metadata)
+        self.assertIsNone(result)
+        self.assertEqual(base_metadata["annotations"]["ark.mckinsey.com/a2a-context-id"], "abc-123")
 
-    assert result is None
-    assert base_metadata["annotations"]["ark.mckinsey.com/a2a-context-id"] == "abc-123"
+    def test_process_request_metadata_merges_annotations(self):
+        """Test that ark annotations are merged with existing annotations."""
+        base_metadata = {
+            "name": "test",
+            "namespace": "default",
+            "annotations": {"existing": "value"}
+        }
+        ark_data = {"annotations": {"ark.mckinsey.com/new": "annotation"}}
+        request_metadata = {"ark": json.dumps(ark_data)}
 
+        result = process_request_metadata(request_metadata, base_metadata)
 
-def test_process_request_metadata_merges_annotations():
-    """Test that ark annotations are merged with existing annotations."""
-    base_metadata = {
-        "name": "test",
-        "namespace": "default",
-        "annotations": {"existing": "value"}
-    }
-    ark_data = {"annotations": {"ark.mckinsey.com/new": "annotation"}}
-    request_metadata = {"ark": json.dumps(ark_data)}
+        self.assertIsNone(result)
+        self.assertEqual(base_metadata["annotations"]["existing"], "value")
+        self.assertEqual(base_metadata["annotations"]["ark.mckinsey.com/new"], "annotation")
 
-    result = process_request_metadata(request_metadata, base_metadata)
+    def test_process_request_metadata_invalid_json(self):
+        """Test processing with malformed ark JSON."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        request_metadata = {"ark": "not valid json"}
 
-    assert result is None
-    assert base_metadata["annotations"]["existing"] == "value"
-    assert base_metadata["annotations"]["ark.mckinsey.com/new"] == "annotation"
+        result = process_request_metadata(request_metadata, base_metadata)
 
+        self.assertIsInstance(result, JSONResponse)
+        self.assertEqual(result.status_code, 400)
 
-def test_process_request_metadata_invalid_json():
-    """Test processing with malformed ark JSON."""
-    base_metadata = {"name": "test", "namespace": "default"}
-    request_metadata = {"ark": "not valid json"}
+    def test_process_request_metadata_not_a_json_object(self):
+        """Test that non-object ark values are rejected before JSON parsing."""
+        for raw in ["", "   ", "[1, 2]", "42", '"text"']:
+            with self.subTest(raw=raw):
+                base_metadata = {"name": "test", "namespace": "default"}
 
-    result = process_request_metadata(request_metadata, base_metadata)
+                result = process_request_metadata({"ark": raw}, base_metadata)
 
-    assert isinstance(result, JSONResponse)
-    assert result.status_code == 400
+                self.assertIsInstance(result, JSONResponse)
+                self.assertEqual(result.status_code, 400)
+                self.assertIn(b"expected a JSON object", result.body)
+                self.assertNotIn("annotations", base_metadata)
 
+    def test_process_request_metadata_leading_whitespace(self):
+        """Test that a JSON object preceded by whitespace is still accepted."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        request_metadata = {"ark": "  \n" + json.dumps({"annotations": {"key": "value"}})}
 
-def test_process_request_metadata_empty_annotations():
-    """Test processing with ark but no annotations."""
-    base_metadata = {"name": "test", "namespace": "default"}
-    ark_data = {"annotations": None}
-    request_metadata = {"ark": json.dumps(ark_data)}
+        result = process_request_metadata(request_metadata, base_metadata)
 
-    result = process_request_metadata(request_metadata, base_metadata)
+        self.assertIsNone(result)
+        self.assertEqual(base_metadata["annotations"], {"key": "value"})
 
-    assert result is None
-    assert "annotations" not in base_metadata
+    def test_process_request_metadata_invalid_annotations(self):
+        """Test processing with well-formed JSON that does not match the metadata model."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        request_metadata = {"ark": json.dumps({"annotations": ["not", "a", "mapping"]})}
 
+        result = process_request_metadata(request_metadata, base_metadata)
 
-def test_ark_openai_completions_metadata_model():
-    """Test ArkOpenAICompletionsMetadata model validation."""
-    # Valid annotations
-    metadata = ArkOpenAICompletionsMetadata(
-        annotations={"key": "value"}
-    )
-    assert metadata.annotations == {"key": "value"}
+        self.assertIsInstance(result, JSONResponse)
+        self.assertEqual(result.status_code, 400)
+        self.assertNotIn("annotations", base_metadata)
 
-    # No annotations
-    metadata = ArkOpenAICompletionsMetadata()
-    assert metadata.annotations is None
+    def test_process_request_metadata_empty_annotations(self):
+        """Test processing with ark but no annotations."""
+        base_metadata = {"name": "test", "namespace": "default"}
+        ark_data = {"annotations": None}
+        request_metadata = {"ark": json.dumps(ark_data)}
 
-    # Empty annotations
-    metadata = ArkOpenAICompletionsMetadata(annotations={})
-    assert metadata.annotations == {}
+        result = process_request_metadata(request_metadata, base_metadata)
+
+        self.assertIsNone(result)
+        self.assertNotIn("annotations", base_metadata)
+
+    def test_ark_openai_completions_metadata_model(self):
+        """Test ArkOpenAICompletionsMetadata model validation."""
+        # Valid annotations
+        metadata = ArkOpenAICompletionsMetadata(
+            annotations={"key": "value"}
+        )
+        self.assertEqual(metadata.annotations, {"key": "value"})
+
+        # No annotations
+        metadata = ArkOpenAICompletionsMetadata()
+        self.assertIsNone(metadata.annotations)
+
+        # Empty annotations
+        metadata = ArkOpenAICompletionsMetadata(annotations={})
+        self.assertEqual(metadata.annotations, {})
+
+
+if __name__ == '__main__':
+    unittest.main()
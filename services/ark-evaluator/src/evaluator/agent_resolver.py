@@ -1,15 +1,24 @@
+import asyncio
 import logging
-from typing import Optional, Dict, Any, List
+import time
+from typing import Optional, Dict, Any, List, Tuple
 from kubernetes import client, config
 from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
 # Import the global K8s client from model_resolver to reuse the pattern
-from .model_resolver import _get_k8s_client
+from .model_resolver import _get_k8s_client, _run_k8s_call
 
+# Resolved agent instructions are cached per (namespace, agent name) across evaluations
+AGENT_INSTRUCTIONS_TTL_SECONDS = 300
+AGENT_INSTRUCTIONS_CACHE_MAXSIZE = 512
+_agent_instructions_cache: Dict[Tuple[str, str], Tuple[float, "AgentInstructions"]] = {}
+# In-flight resolutions are keyed by event loop too, since a future can only be awaited on its own loop
+_inflight_resolutions: Dict[Tuple[asyncio.AbstractEventLoop, str, str], asyncio.Future] = {}
 
-@dataclass
+
+@dataclass(slots=True, frozen=True)
 class AgentInstructions:
     """Agent instructions containing description and system prompt for scope-aware evaluation"""
     name: str
@@ -21,13 +30,36 @@ class AgentResolver:
     
     def __init__(self):
         self.k8s_client = None
-        self._initialize_client()
+        self.custom_api = None
+        self._client_inits: Dict[asyncio.AbstractEventLoop, asyncio.Task] = {}
+    
+    async def _ensure_client(self) -> asyncio.AbstractEventLoop:
+        """
+        Initialize the client once per event loop, shared by concurrent resolutions on that loop.
+        Returns the running loop, which also scopes in-flight resolutions.
+        """
+        loop = asyncio.get_running_loop()
+        # The resolver is shared process-wide, so each loop awaits its own initialization task
+        init = self._client_inits.get(loop)
+        if init is None:
+            self._client_inits = {other: task for other, task in self._client_inits.items() if not other.is_closed()}
+            init = self._client_inits[loop] = loop.create_task(self._initialize_client())
+        try:
+            await asyncio.shield(init)
+        except Exception:
+            # Let the next resolution retry instead of replaying the same failure
+            if self._client_inits.get(loop) is init and init.done():
+                del self._client_inits[loop]
+            raise
+        return loop
     
-    def _initialize_client(self):
-        """Initialize Kubernetes client using the same pattern as ModelResolver"""
-        self.k8s_client = _get_k8s_client()
+    async def _initialize_client(self):
+        """Initialize Kubernetes client using the same pattern as ModelResolver, loading config off the event loop"""
+        self.k8s_client = await _run_k8s_call(_get_k8s_client)
         if not self.k8s_client:
             logger.warning("Kubernetes client not available - agent context resolution will be limited")
+            return
+        self.custom_api = client.CustomObjectsApi(self.k8s_client)
     
     async def resolve_agent_instructions(self, agent_name: str, namespace: str = "default") -> Optional[AgentInstructions]:
         """
@@ -40,18 +72,46 @@ class AgentResolver:
         Returns:
             AgentInstructions with agent details or None if resolution fails
         """
+        loop = await self._ensure_client()
         if not self.k8s_client:
             logger.warning(f"Cannot resolve agent {agent_name}: Kubernetes client not available")
             return None
         
+        key = (namespace, agent_name)
+        cached = _agent_instructions_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            logger.info(f"Using cached agent instructions for {agent_name} in namespace: {namespace}")
+            return cached[1]
+        
+        # Concurrent resolutions of the same agent on this loop wait for the request already in flight
+        inflight_key = (loop, namespace, agent_name)
+        inflight = _inflight_resolutions.get(inflight_key)
+        if inflight:
+            return await asyncio.shield(inflight)
+        
+        future = loop.create_future()
+        _inflight_resolutions[inflight_key] = future
+        try:
+            agent_instructions = await self._fetch_agent_instructions(agent_name, namespace)
+            if agent_instructions:
+                if len(_agent_instructions_cache) >= AGENT_INSTRUCTIONS_CACHE_MAXSIZE:
+                    _agent_instructions_cache.pop(next(iter(_agent_instructions_cache)))
+                _agent_instructions_cache[key] = (time.monotonic() + AGENT_INSTRUCTIONS_TTL_SECONDS, agent_instructions)
+            future.set_result(agent_instructions)
+            return agent_instructions
+        finally:
+            if not future.done():
+                future.set_result(None)
+            _inflight_resolutions.pop(inflight_key, None)
+    
+    async def _fetch_agent_instructions(self, agent_name: str, namespace: str) -> Optional[AgentInstructions]:
+        """Fetch the Agent CRD from Kubernetes and extract its instructions"""
         try:
             logger.info(f"Resolving agent: {agent_name} in namespace: {namespace}")
             
-            # Create custom objects API client
-            custom_api = client.CustomObjectsApi(self.k8s_client)
-            
-            # Fetch Agent CRD
-            agent_resource = custom_api.get_namespaced_custom_object(
+            # Fetch Agent CRD off the event loop since the Kubernetes client is blocking
+            agent_resource = await _run_k8s_call(
+                self.custom_api.get_namespaced_custom_object,
                 group="ark.mckinsey.com",
                 version="v1alpha1",
                 namespace=namespace,
@@ -1,5 +1,8 @@
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import re
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from .types import EvaluationRequest, EvaluationResponse, EvaluationParameters, TokenUsage
 from .llm_client import LLMClient
 from .model_resolver import ModelResolver
@@ -8,11 +11,69 @@ from .prompt_builder import build_evaluation_prompt
 
 logger = logging.getLogger(__name__)
 
+# Evaluation criteria that need the agent's own instructions to be judged
+_AGENT_AWARE_CRITERIA = ("compliance", "appropriateness", "refusal_handling")
+
+# Matches "FIELD: value" lines in the LLM evaluation output, ignoring surrounding whitespace
+_RESULT_FIELD_RE = re.compile(r'^[^\S\n]*(SCORE|PASSED|REASONING|CRITERIA_SCORES):[^\S\n]*(.*?)[^\S\n]*$', re.MULTILINE)
+_SCORE_VALUE_RE = re.compile(r'[-+]?(?:\d+\.?\d*|\.\d+)')
+
+
+@lru_cache(maxsize=32)
+def _scope_requires_agent_instructions(scope: str) -> bool:
+    scope_lower = scope.lower()
+    return any(criteria in scope_lower for criteria in _AGENT_AWARE_CRITERIA)
+
+
+@lru_cache(maxsize=1024)
+def _parse_criteria_scores(criteria_str: str) -> Tuple[Tuple[str, str, float], ...]:
+    """Tokenize a CRITERIA_SCORES string; batches often repeat the same scores, so results are shared"""
+    if not criteria_str:
+        return ()
+
+    criteria_scores = []
+    for entry in criteria_str.split(','):
+        criterion_name, separator, score_str = entry.partition('=')
+        if not separator:
+            continue
+        criterion_name = criterion_name.strip()
+        score_str = score_str.strip()
+
+        try:
+            score_val = float(score_str)
+        except ValueError:
+            logger.warning("Invalid score value for %s: %s", criterion_name, score_str)
+            continue
+
+        if 0 <= score_val <= 1:
+            criteria_scores.append((criterion_name, score_str, score_val))
+        else:
+            logger.warning("Score out of range for %s: %s", criterion_name, score_val)
+
+    return tuple(criteria_scores)
+
+
+# Resolvers are shared by all evaluators so their caches stay warm across evaluations
+_shared_model_resolver: Optional[ModelResolver] = None
+_shared_agent_resolver: Optional[AgentResolver] = None
+
+
+def _get_shared_resolvers() -> Tuple[ModelResolver, AgentResolver]:
+    """Get the process-wide model and agent resolvers, creating them on first use"""
+    global _shared_model_resolver, _shared_agent_resolver
+
+    if _shared_model_resolver is None:
+        _shared_model_resolver = ModelResolver()
+    if _shared_agent_resolver is None:
+        _shared_agent_resolver = AgentResolver()
+
+    return _shared_model_resolver, _shared_agent_resolver
+
+
 class LLMEvaluator:
     def __init__(self, session=None):
         self.llm_client = LLMClient(session=session)
-        self.model_resolver = ModelResolver()
-        self.agent_resolver = AgentResolver()
+        self.model_resolver, self.agent_resolver = _get_shared_resolvers()
     
     async def evaluate(self, request: EvaluationRequest, params: EvaluationParameters = None, golden_examples=None) -> EvaluationResponse:
         """
@@ -25,30 +86,40 @@ class LLMEvaluator:
             if params is None:
                 params = EvaluationParameters()
 
-            # Resolve model configuration using the model resolver
+            # Resolve model configuration, and agent instructions when the scope includes
+            # agent-aware criteria, concurrently since the two lookups are independent
+            agent_instructions = None
+            requires_agent_instructions = self._requires_agent_instructions(params)
             logger.info(f"Resolving model configuration - modelRef: {request.modelRef}")
-            model = await self.model_resolver.resolve_model(
+            model_resolution = self.model_resolver.resolve_model(
                 model_ref=request.modelRef, 
                 query_context=request.query
             )
-            
-            # Log full model configuration for troubleshooting
-            logger.info(f"Resolved model configuration:")
-            logger.info(f"  - model: {model.model}")
-            logger.info(f"  - base_url: {model.base_url}")
-            logger.info(f"  - api_version: {model.api_version}")
-            logger.info(f"  - api_key: {model.api_key[:8] if model.api_key else 'None'}...{model.api_key[-4:] if model.api_key and len(model.api_key) > 8 else ''}")
-            
-            # Resolve agent instructions if scope includes agent-aware criteria
-            agent_instructions = None
-            if self._requires_agent_instructions(params):
+            if requires_agent_instructions:
                 logger.info("Attempting to resolve agent instructions...")
-                agent_instructions = await self._resolve_agent_instructions(request)
+                model, agent_instructions = await asyncio.gather(
+                    model_resolution,
+                    self._resolve_agent_instructions(request)
+                )
             else:
                 logger.info("Agent instructions not required for this evaluation scope")
+                model = await model_resolution
+            
+            # Log full model configuration for troubleshooting
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "Resolved model configuration:\n  - model: %s\n  - base_url: %s\n  - api_version: %s\n  - api_key: %s...%s",
+                    model.model,
+                    model.base_url,
+                    model.api_version,
+                    model.api_key[:8] if model.api_key else 'None',
+                    model.api_key[-4:] if model.api_key and len(model.api_key) > 8 else ''
+                )
             
             # Prepare evaluation prompt
-            evaluation_prompt = self._build_evaluation_prompt(request, params, golden_examples, agent_instructions)
+            evaluation_prompt = self._build_evaluation_prompt(
+                request, params, golden_examples, agent_instructions, requires_agent_instructions
+            )
             logger.info(f"Generated evaluation prompt length: {len(evaluation_prompt)} characters")
             
             # Get LLM evaluation
@@ -89,34 +160,26 @@ class LLMEvaluator:
     
     def _requires_agent_instructions(self, params: EvaluationParameters) -> bool:
         """Check if evaluation scope requires agent instructions"""
-        if not params or not params.scope:
-            logger.info(f"No agent instructions required: params={params}, scope={params.scope if params else None}")
-            return False
-        
-        scope_lower = params.scope.lower()
-        agent_aware_criteria = ["compliance", "appropriateness", "refusal_handling"]
-        
-        requires_context = any(criteria in scope_lower for criteria in agent_aware_criteria)
-        logger.info(f"Agent context required: {requires_context}, scope: {scope_lower}, criteria: {agent_aware_criteria}")
-        
-        return requires_context
+        return bool(params and params.scope and _scope_requires_agent_instructions(params.scope))
     
     async def _resolve_agent_instructions(self, request: EvaluationRequest) -> Optional[AgentInstructions]:
         """Resolve agent context from the first agent target in responses"""
         try:
-            # Find first agent response
-            agent_response = next(
-                (resp for resp in request.responses if resp.target.type == "agent"), 
-                None
-            )
+            # Find the first agent target
+            agent_name = None
+            for resp in request.responses:
+                target = resp.target
+                if target.type == "agent":
+                    agent_name = target.name
+                    break
             
-            if not agent_response:
+            if agent_name is None:
                 logger.warning("No agent response found for agent context resolution")
                 return None
             
             # Resolve agent context
             agent_instrunctions = await self.agent_resolver.resolve_agent_instructions(
-                agent_name=agent_response.target.name,
+                agent_name=agent_name,
                 namespace="default"  # Could be extracted from request metadata if needed
             )
             
@@ -129,18 +192,21 @@ class LLMEvaluator:
             logger.warning(f"Failed to resolve agent context: {str(e)}")
             return None
     
-    def _build_evaluation_prompt(self, request: EvaluationRequest, params: EvaluationParameters, golden_examples, agent_instructions: Optional[AgentInstructions] = None) -> str:
+    def _build_evaluation_prompt(self, request: EvaluationRequest, params: EvaluationParameters, golden_examples, agent_instructions: Optional[AgentInstructions] = None, requires_agent_instructions: Optional[bool] = None) -> str:
         """
         Build evaluation prompt using LLM-as-a-Judge pattern with golden dataset context.
 
         This method now delegates to the EvaluationPromptBuilder for better maintainability.
+        Pass requires_agent_instructions when it is already known to avoid re-checking the scope.
         """
+        if requires_agent_instructions is None:
+            requires_agent_instructions = self._requires_agent_instructions(params)
         return build_evaluation_prompt(
             request=request,
             params=params,
             golden_examples=golden_examples,
             agent_instructions=agent_instructions,
-            requires_agent_instructions=self._requires_agent_instructions(params)
+            requires_agent_instructions=requires_agent_instructions
         )
     
     def _get_scope_criteria_format(self, params: EvaluationParameters) -> str:
@@ -154,39 +220,37 @@ class LLMEvaluator:
         """
         Parse LLM evaluation result into structured format
         """
-        lines = result.strip().split('\n')
         score = "0"
         passed = False
         metadata = {}
+        criteria_scores = ()
 
-        for line in lines:
-            line = line.strip()
-            if line.startswith('SCORE:'):
-                score_str = line.split(':', 1)[1].strip()
-                try:
-                    score_float = float(score_str)
+        for match in _RESULT_FIELD_RE.finditer(result):
+            field, value = match.groups()
+            if field == 'SCORE':
+                if _SCORE_VALUE_RE.fullmatch(value):
+                    score_float = float(value)
 
                     if score_float > 1:
                         score_float = score_float / 100.0
 
                     score = f"{score_float:.2f}"
                     passed = score_float >= params.min_score
-                except ValueError:
+                else:
                     score = "0.0"
                     passed = False
-            elif line.startswith('PASSED:'):
-                passed_str = line.split(':', 1)[1].strip().lower()
-                passed = passed_str == 'true'
-            elif line.startswith('REASONING:'):
-                metadata['reasoning'] = line.split(':', 1)[1].strip()
-            elif line.startswith('CRITERIA_SCORES:'):
-                criteria_str = line.split(':', 1)[1].strip()
-                metadata['criteria_scores'] = criteria_str
+            elif field == 'PASSED':
+                passed = value.lower() == 'true'
+            elif field == 'REASONING':
+                metadata['reasoning'] = value
+            else:
+                metadata['criteria_scores'] = value
 
-                self._parse_individual_criteria_scores(criteria_str, metadata)
+                criteria_scores = self._parse_criteria_scores(value)
+                self._store_criteria_scores(criteria_scores, metadata)
 
+        criteria_avg = self._average_criteria_scores(criteria_scores)
         if score == "0.0" or score == "0":
-            criteria_avg = self._calculate_criteria_average(metadata.get('criteria_scores', ''))
             if criteria_avg is not None and criteria_avg > 0:
                 logger.warning(
                     f"SCORE was {'0' if score else 'missing'}, using criteria average: {criteria_avg:.2f}"
@@ -196,54 +260,30 @@ class LLMEvaluator:
                 metadata['score_adjusted'] = 'true'
                 metadata['original_score'] = '0.0'
                 metadata['adjustment_reason'] = 'zero_score_fallback'
-        else:
-            criteria_avg = self._calculate_criteria_average(metadata.get('criteria_scores', ''))
-            if criteria_avg is not None:
-                overall_score = float(score)
-                diff = abs(overall_score - criteria_avg)
-
-                if diff > 0.15:
-                    logger.warning(
-                        f"Significant mismatch between overall score ({overall_score:.2f}) "
-                        f"and criteria average ({criteria_avg:.2f}), difference: {diff:.2f}"
-                    )
-                    logger.info(f"Using criteria average as the overall score")
-                    score = f"{criteria_avg:.2f}"
-                    passed = criteria_avg >= params.min_score
-                    metadata['score_adjusted'] = 'true'
-                    metadata['original_score'] = str(overall_score)
-                    metadata['adjustment_reason'] = 'mismatch_correction'
+        elif criteria_avg is not None:
+            overall_score = float(score)
+            diff = abs(overall_score - criteria_avg)
+
+            if diff > 0.15:
+                logger.warning(
+                    f"Significant mismatch between overall score ({overall_score:.2f}) "
+                    f"and criteria average ({criteria_avg:.2f}), difference: {diff:.2f}"
+                )
+                logger.info(f"Using criteria average as the overall score")
+                score = f"{criteria_avg:.2f}"
+                passed = criteria_avg >= params.min_score
+                metadata['score_adjusted'] = 'true'
+                metadata['original_score'] = str(overall_score)
+                metadata['adjustment_reason'] = 'mismatch_correction'
 
         return score, passed, metadata
 
     def _calculate_criteria_average(self, criteria_scores_str: str) -> Optional[float]:
         """
         Calculate average score from criteria_scores string
-        Returns None if parsing fails
+        Returns None if no valid criterion scores are found
         """
-        if not criteria_scores_str:
-            return None
-
-        try:
-            scores = []
-            entries = criteria_scores_str.split(',')
-            for entry in entries:
-                entry = entry.strip()
-                if '=' in entry:
-                    _, score_str = entry.split('=', 1)
-                    score_val = float(score_str.strip())
-                    if 0 <= score_val <= 1:
-                        scores.append(score_val)
-
-            if scores:
-                avg = sum(scores) / len(scores)
-                logger.info(f"Calculated criteria average: {avg:.2f} from {len(scores)} criteria")
-                return avg
-
-        except (ValueError, AttributeError) as e:
-            logger.warning(f"Failed to calculate criteria average: {str(e)}")
-
-        return None
+        return self._average_criteria_scores(self._parse_criteria_scores(criteria_scores_str))
 
     def _parse_individual_criteria_scores(self, criteria_str: str, metadata: Dict[str, str]) -> None:
         """
@@ -255,26 +295,31 @@ class LLMEvaluator:
             criteria_str: Comma-separated criterion=score pairs
             metadata: Dictionary to populate with individual scores
         """
-        if not criteria_str:
-            return
+        self._store_criteria_scores(self._parse_criteria_scores(criteria_str), metadata)
 
-        try:
-            entries = criteria_str.split(',')
-            for entry in entries:
-                entry = entry.strip()
-                if '=' in entry:
-                    criterion_name, score_str = entry.split('=', 1)
-                    criterion_name = criterion_name.strip()
-                    score_str = score_str.strip()
-
-                    try:
-                        score_val = float(score_str)
-                        if 0 <= score_val <= 1:
-                            metadata[criterion_name] = score_str
-                            logger.debug(f"Extracted criterion score: {criterion_name}={score_str}")
-                        else:
-                            logger.warning(f"Score out of range for {criterion_name}: {score_val}")
-                    except ValueError:
-                        logger.warning(f"Invalid score value for {criterion_name}: {score_str}")
-        except Exception as e:
-            logger.error(f"Failed to parse individual criteria scores: {str(e)}")
\ No newline at end of file
+    def _parse_criteria_scores(self, criteria_str: str) -> Tuple[Tuple[str, str, float], ...]:
+        """
+        Tokenize a CRITERIA_SCORES string in a single pass
+
+        Args:
+            criteria_str: Comma-separated criterion=score pairs
+
+        Returns:
+            (criterion, score text, score value) for every numeric score within 0-1
+        """
+        return _parse_criteria_scores(criteria_str)
+
+    def _store_criteria_scores(self, criteria_scores: Tuple[Tuple[str, str, float], ...], metadata: Dict[str, str]) -> None:
+        """Record each criterion score in metadata, keeping the score text as reported"""
+        for criterion_name, score_str, _ in criteria_scores:
+            metadata[criterion_name] = score_str
+            logger.debug(f"Extracted criterion score: {criterion_name}={score_str}")
+
+    def _average_criteria_scores(self, criteria_scores: Tuple[Tuple[str, str, float], ...]) -> Optional[float]:
+        """Average the parsed criterion scores, or None when there are none"""
+        if not criteria_scores:
+            return None
+
+        avg = sum(score_val for _, _, score_val in criteria_scores) / len(criteria_scores)
+        logger.info(f"Calculated criteria average: {avg:.2f} from {len(criteria_scores)} criteria")
+        return avg
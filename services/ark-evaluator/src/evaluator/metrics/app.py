@@ -1,9 +1,11 @@
 import logging
 from fastapi import FastAPI, HTTPException
+from typing import List
 from ..types import (
-    EvaluationResponse, UnifiedEvaluationRequest, EvaluationType,
+    EvaluationResponse, UnifiedEvaluationRequest, EvaluationType, MetricEvaluationResponse,
 )
 from .evaluator import MetricEvaluator
+from .metric_types import MetricBatchRequest
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -57,7 +59,8 @@ def create_app(app: FastAPI) -> FastAPI:
                 return result
                 
             elif request.type == EvaluationType.BATCH:
-                # Batch evaluation not supported yet in metric evaluator
+                # Batch evaluation aggregates existing Evaluations and is not supported yet in metric evaluator;
+                # batches of queries are scored through /evaluate-metrics/batch
                 raise HTTPException(status_code=501, detail="Batch evaluation not yet implemented in metric evaluator")
                 
             else:
@@ -68,6 +71,18 @@ def create_app(app: FastAPI) -> FastAPI:
         except Exception as e:
             logger.error(f"Error processing evaluation request: {str(e)}")
             raise HTTPException(status_code=500, detail=str(e))
-    
 
-    return app
\ No newline at end of file
+    @app.post("/evaluate-metrics/batch", response_model=List[MetricEvaluationResponse])
+    async def evaluate_batch(request: MetricBatchRequest) -> List[MetricEvaluationResponse]:
+        """
+        Evaluate metrics for a batch of queries in one request
+        """
+        try:
+            logger.info("Received batch metric evaluation request: queries=%s", len(request.queryRefs))
+            evaluator = MetricEvaluator(request.parameters or {})
+            return await evaluator.evaluate_metrics_batch(request.queryRefs)
+        except Exception as e:
+            logger.error("Error processing batch metric evaluation request: %s", e)
+            raise HTTPException(status_code=500, detail=str(e))
+
+    return app
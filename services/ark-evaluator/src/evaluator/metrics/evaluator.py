@@ -1,5 +1,9 @@
+import asyncio
+import copy
 import logging
-from typing import Dict, Any, Optional
+import time
+from functools import lru_cache
+from typing import Dict, Any, FrozenSet, List, Optional, Tuple
 from ..types import (
     UnifiedEvaluationRequest, MetricEvaluationResponse, 
     EvaluationResponse, QueryRef,
@@ -14,28 +18,100 @@ from .metrics import MetricsCalculator
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on queries loaded and scored at the same time by a batch evaluation
+DEFAULT_BATCH_CONCURRENCY = 16
+
+# Threshold violations that fail an evaluation regardless of its overall score
+_CRITICAL_VIOLATIONS = frozenset({"maxTokens", "maxCostPerQuery", "maxDuration"})
+
+# Fields shared by every set of synthetic metrics built for a direct evaluation
+_SYNTHETIC_METRICS_TEMPLATE = {
+    "responseCount": 1,
+    "isCompleted": True,
+    "hasErrors": False,
+    "queryPhase": "direct-evaluation",
+}
+
+# Metrics extracted from a query are cached briefly per (namespace, query name) so retries and polling
+# of the same query do not reload it from Kubernetes
+QUERY_METRICS_TTL_SECONDS = 5
+QUERY_METRICS_CACHE_MAXSIZE = 512
+_query_metrics_cache: Dict[Tuple[str, str], Tuple[float, Dict[str, Any]]] = {}
+_inflight_query_loads: Dict[Tuple[str, str], asyncio.Future] = {}
+
+# Reasoning for evaluations without threshold violations, by minimum overall score
+_METRICS_REASONING = (
+    (0.8, "All metrics within acceptable thresholds with excellent performance"),
+    (0.6, "All metrics within acceptable thresholds with good performance"),
+    (float("-inf"), "Metrics within thresholds but performance could be improved"),
+)
+_PERFORMANCE_REASONING = (
+    (0.8, "All performance metrics within acceptable thresholds with excellent scores"),
+    (0.6, "All performance metrics within acceptable thresholds with good scores"),
+    (float("-inf"), "Performance metrics within thresholds but could be improved"),
+)
+
+# Individual scores copied into unified metadata, as (metrics key, metadata key)
+_SCORE_METADATA_KEYS = (
+    ("tokenScore", "token_score"),
+    ("costScore", "cost_score"),
+    ("performanceScore", "performance_score"),
+)
+
+_shared_ark_client: Optional[ArkClient] = None
+
+
+def _get_shared_ark_client() -> ArkClient:
+    """Get the process-wide ARK client, creating it on first use"""
+    global _shared_ark_client
+
+    if _shared_ark_client is None:
+        _shared_ark_client = ArkClient()
+
+    return _shared_ark_client
+
+
+@lru_cache(maxsize=64)
+def _get_cached_metrics_calculator(parameters: FrozenSet[Tuple[str, Any]]) -> MetricsCalculator:
+    """Get the calculator shared by evaluators with the same parameters"""
+    return MetricsCalculator(dict(parameters))
+
+
+def _get_metrics_calculator(parameters: Dict[str, Any]) -> MetricsCalculator:
+    """Get a calculator for the parameters, shared when they are hashable"""
+    try:
+        return _get_cached_metrics_calculator(frozenset(parameters.items()))
+    except TypeError:
+        return MetricsCalculator(parameters)
+
+
+def _reasoning_for_score(buckets, overall_score: float) -> str:
+    """Pick the reasoning for the highest bucket the score reaches"""
+    return next(reasoning for min_score, reasoning in buckets if overall_score >= min_score)
+
 
 class MetricEvaluator:
     def __init__(self, parameters: Dict[str, Any]):
         self.parameters = parameters
-        self.ark_client = ArkClient()
-        self.metrics_calculator = MetricsCalculator(parameters)
+        self.ark_client = _get_shared_ark_client()
+        self.metrics_calculator = _get_metrics_calculator(parameters)
     
     async def evaluate_metrics(self, request: MetricEvaluationRequest) -> MetricEvaluationResponse:
         """
         Evaluate query performance metrics
         """
+        # Convert queryId to QueryRef format for ARK SDK
+        return await self.evaluate_query_metrics(self._parse_query_ref_string(request.queryId))
+    
+    async def evaluate_query_metrics(self, query_ref: QueryRef) -> MetricEvaluationResponse:
+        """
+        Evaluate performance metrics of the referenced query
+        """
         try:
-            logger.info(f"Starting metric evaluation for query {request.queryId}")
-            
-            # Convert queryId to QueryRef format for ARK SDK
-            query_ref = self._parse_query_ref_string(request.queryId)
-            
-            # Load query from Kubernetes using ARK SDK
-            query_config = await self.ark_client.load_query(query_ref)
+            logger.info("Starting metric evaluation for query %s in namespace %s", query_ref.name, query_ref.namespace)
             
-            # Extract metrics from query status
-            metrics = await self.ark_client.extract_metrics(query_config)
+            # Load query from Kubernetes and extract metrics from its status
+            metrics = await self._load_query_metrics(query_ref)
             
             # Calculate scores
             overall_score = await self.metrics_calculator.calculate_overall_score(metrics)
@@ -44,7 +120,7 @@ class MetricEvaluator:
             # Build metadata
             metadata = self._build_metadata(metrics, overall_score)
             
-            logger.info(f"Metric evaluation completed for query {request.queryId}: score={overall_score:.2f}, passed={passed}")
+            logger.info("Metric evaluation completed for query %s: score=%.2f, passed=%s", query_ref.name, overall_score, passed)
             
             return MetricEvaluationResponse(
                 score=f"{overall_score:.2f}",
@@ -54,13 +130,68 @@ class MetricEvaluator:
             )
             
         except Exception as e:
-            logger.error(f"Metric evaluation failed for query {request.queryId}: {str(e)}")
+            logger.error("Metric evaluation failed for query %s: %s", query_ref.name, e)
             return MetricEvaluationResponse(
                 score="0.0",
                 passed=False,
                 error=str(e)
             )
     
+    async def evaluate_metrics_batch(self, query_refs: List[QueryRef],
+                                     max_concurrency: int = DEFAULT_BATCH_CONCURRENCY) -> List[MetricEvaluationResponse]:
+        """
+        Evaluate metrics for several queries concurrently, returning responses in request order
+        """
+        logger.info("Starting batch metric evaluation for %s queries", len(query_refs))
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def evaluate_one(query_ref: QueryRef) -> MetricEvaluationResponse:
+            async with semaphore:
+                return await self.evaluate_query_metrics(query_ref)
+
+        return await asyncio.gather(*(evaluate_one(query_ref) for query_ref in query_refs))
+    
+    async def _load_query_metrics(self, query_ref: QueryRef) -> Dict[str, Any]:
+        """
+        Load a query and extract its metrics, sharing recent and in-flight loads of the same query.
+        Callers get their own copy since scoring adds results to the metrics.
+        """
+        # A query without a namespace is read from "default", so share its cache and load with that one
+        if query_ref.namespace is None:
+            query_ref = query_ref.model_copy(update={"namespace": "default"})
+        key = (query_ref.namespace, query_ref.name)
+        cached = _query_metrics_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
+        
+        # Concurrent evaluations of the same query wait for the load already in flight
+        inflight = _inflight_query_loads.get(key)
+        if inflight:
+            return copy.deepcopy(await asyncio.shield(inflight))
+        
+        future = asyncio.get_running_loop().create_future()
+        _inflight_query_loads[key] = future
+        try:
+            query_config = await self.ark_client.load_query(query_ref)
+            metrics = await self.ark_client.extract_metrics(query_config)
+            if key not in _query_metrics_cache and len(_query_metrics_cache) >= QUERY_METRICS_CACHE_MAXSIZE:
+                _query_metrics_cache.pop(next(iter(_query_metrics_cache)))
+            _query_metrics_cache[key] = (time.monotonic() + QUERY_METRICS_TTL_SECONDS, metrics)
+            future.set_result(metrics)
+            return copy.deepcopy(metrics)
+        except Exception as e:
+            future.set_exception(e)
+            # Mark the exception retrieved so a load nobody else awaited does not log a warning
+            future.exception()
+            raise
+        finally:
+            if not future.done():
+                # The loading evaluation was cancelled; fail waiting evaluations with an error they report
+                # instead of propagating the cancellation into them
+                future.set_exception(RuntimeError(f"Loading query {query_ref.name} was cancelled"))
+                future.exception()
+            _inflight_query_loads.pop(key, None)
+    
     def _determine_pass_status(self, overall_score: float, metrics: Dict[str, Any]) -> bool:
         """
         Determine if the evaluation passes based on score and threshold violations
@@ -71,14 +202,7 @@ class MetricEvaluator:
             return False
         
         # Check for critical threshold violations
-        threshold_violations = metrics.get("threshold_violations", [])
-        critical_violations = ["maxTokens", "maxCostPerQuery", "maxDuration"]
-        
-        for violation in threshold_violations:
-            if violation in critical_violations:
-                return False
-        
-        return True
+        return _CRITICAL_VIOLATIONS.isdisjoint(metrics.get("threshold_violations", []))
     
     def _build_metadata(self, metrics: Dict[str, Any], overall_score: float) -> Dict[str, Any]:
         """
@@ -89,12 +213,8 @@ class MetricEvaluator:
         
         if threshold_violations:
             reasoning = f"Metrics evaluation failed due to threshold violations: {', '.join(threshold_violations)}"
-        elif overall_score >= 0.8:
-            reasoning = "All metrics within acceptable thresholds with excellent performance"
-        elif overall_score >= 0.6:
-            reasoning = "All metrics within acceptable thresholds with good performance"
         else:
-            reasoning = "Metrics within thresholds but performance could be improved"
+            reasoning = _reasoning_for_score(_METRICS_REASONING, overall_score)
         
         return {
             "reasoning": reasoning,
@@ -112,19 +232,22 @@ class MetricEvaluator:
         Handle direct evaluation requests from evaluation controller
         """
         try:
-            logger.info(f"Processing direct evaluation request for mode: {request.mode}")
+            logger.info("Processing direct evaluation request for mode: %s", request.mode)
             
             # For direct requests, we need to create synthetic metrics from input/output
             synthetic_metrics = self._create_synthetic_metrics_from_direct(request)
             
-            # Calculate scores using our metrics calculator
-            overall_score = await self.metrics_calculator.calculate_overall_score(synthetic_metrics)
+            # Calculate scores using our metrics calculator. Token counts are estimates with no
+            # model behind them, so price them from the default table without a Model lookup
+            overall_score = await self.metrics_calculator.calculate_overall_score(
+                synthetic_metrics, use_pricing_annotations=False
+            )
             passed = self._determine_pass_status(overall_score, synthetic_metrics)
             
             # Build metadata in the format expected by evaluation controller
             metadata = self._build_unified_metadata(synthetic_metrics, overall_score)
             
-            logger.info(f"Direct evaluation completed: score={overall_score:.2f}, passed={passed}")
+            logger.info("Direct evaluation completed: score=%.2f, passed=%s", overall_score, passed)
             
             return EvaluationResponse(
                 score=f"{overall_score:.2f}",
@@ -133,7 +256,7 @@ class MetricEvaluator:
             )
             
         except Exception as e:
-            logger.error(f"Direct evaluation failed: {str(e)}")
+            logger.error("Direct evaluation failed: %s", e)
             return EvaluationResponse(
                 score="0.0",
                 passed=False,
@@ -145,16 +268,13 @@ class MetricEvaluator:
         Handle query reference evaluation requests
         """
         try:
-            logger.info(f"Processing query-ref evaluation for: {request.queryRef.name}")
+            logger.info("Processing query-ref evaluation for: %s", request.queryRef.name)
             
             # Use the QueryRef object directly instead of parsing a string
             query_ref = request.queryRef
             
-            # Load query from Kubernetes using ARK SDK
-            query_config = await self.ark_client.load_query(query_ref)
-            
-            # Extract metrics from query status
-            metrics = await self.ark_client.extract_metrics(query_config)
+            # Load query from Kubernetes and extract metrics from its status
+            metrics = await self._load_query_metrics(query_ref)
             
             # Calculate scores
             overall_score = await self.metrics_calculator.calculate_overall_score(metrics)
@@ -163,7 +283,7 @@ class MetricEvaluator:
             # Build metadata
             metadata = self._build_unified_metadata(metrics, overall_score)
             
-            logger.info(f"Query-ref evaluation completed: score={overall_score:.2f}, passed={passed}")
+            logger.info("Query-ref evaluation completed: score=%.2f, passed=%s", overall_score, passed)
             
             return EvaluationResponse(
                 score=f"{overall_score:.2f}",
@@ -172,7 +292,7 @@ class MetricEvaluator:
             )
             
         except Exception as e:
-            logger.error(f"Query-ref evaluation failed: {str(e)}")
+            logger.error("Query-ref evaluation failed: %s", e)
             return EvaluationResponse(
                 score="0.0",
                 passed=False,
@@ -189,20 +309,14 @@ class MetricEvaluator:
         # Estimate token usage (rough approximation: 1 token ≈ 4 characters)
         estimated_prompt_tokens = input_length // 4
         estimated_completion_tokens = output_length // 4
-        estimated_total_tokens = estimated_prompt_tokens + estimated_completion_tokens
         
-        metrics = {
-            "totalTokens": estimated_total_tokens,
-            "promptTokens": estimated_prompt_tokens,  
-            "completionTokens": estimated_completion_tokens,
-            "totalResponseLength": output_length,
-            "responseCount": 1,
-            "averageResponseLength": output_length,
-            "isCompleted": True,
-            "hasErrors": False,
-            "queryPhase": "direct-evaluation",
-            "responseCompleteness": min(1.0, output_length / 50) if output_length > 0 else 0
-        }
+        metrics = _SYNTHETIC_METRICS_TEMPLATE.copy()
+        metrics["totalTokens"] = estimated_prompt_tokens + estimated_completion_tokens
+        metrics["promptTokens"] = estimated_prompt_tokens
+        metrics["completionTokens"] = estimated_completion_tokens
+        metrics["totalResponseLength"] = output_length
+        metrics["averageResponseLength"] = output_length
+        metrics["responseCompleteness"] = min(1.0, output_length / 50) if output_length > 0 else 0
         
         # Calculate token efficiency
         if estimated_prompt_tokens > 0:
@@ -217,11 +331,9 @@ class MetricEvaluator:
         Parse query reference string into QueryRef object
         Expects format like "namespace/query-name" or just "query-name"
         """
-        if "/" in query_ref_str:
-            namespace, name = query_ref_str.split("/", 1)
-        else:
-            namespace = "default"
-            name = query_ref_str
+        namespace, separator, name = query_ref_str.partition("/")
+        if not separator:
+            return QueryRef(name=namespace, namespace="default")
         
         return QueryRef(name=name, namespace=namespace)
     
@@ -234,12 +346,8 @@ class MetricEvaluator:
         
         if threshold_violations:
             reasoning = f"Performance metrics evaluation failed due to threshold violations: {', '.join(threshold_violations)}"
-        elif overall_score >= 0.8:
-            reasoning = "All performance metrics within acceptable thresholds with excellent scores"
-        elif overall_score >= 0.6:
-            reasoning = "All performance metrics within acceptable thresholds with good scores"
         else:
-            reasoning = "Performance metrics within thresholds but could be improved"
+            reasoning = _reasoning_for_score(_PERFORMANCE_REASONING, overall_score)
         
         metadata = {
             "reasoning": reasoning,
@@ -250,11 +358,8 @@ class MetricEvaluator:
         }
         
         # Add individual scores if available
-        if "tokenScore" in metrics:
-            metadata["token_score"] = f"{metrics['tokenScore']:.2f}"
-        if "costScore" in metrics:
-            metadata["cost_score"] = f"{metrics['costScore']:.2f}"
-        if "performanceScore" in metrics:
-            metadata["performance_score"] = f"{metrics['performanceScore']:.2f}"
+        for metric_key, metadata_key in _SCORE_METADATA_KEYS:
+            if metric_key in metrics:
+                metadata[metadata_key] = format(metrics[metric_key], ".2f")
 
         return metadata
\ No newline at end of file
@@ -1,4 +1,4 @@
-from typing import Dict, Optional
+from typing import Dict, List, Optional
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
 from ..types import QueryRef, Model
@@ -16,4 +16,12 @@ class QueryRefRequest(BaseModel):
     """Compatibility wrapper for query reference evaluation requests"""
     queryRef: QueryRef
     model: Optional[Model] = None
-    parameters: Optional[Dict[str, str]] = Field(default_factory=dict)
\ No newline at end of file
+    parameters: Optional[Dict[str, str]] = Field(default_factory=dict)
+
+# Upper bound on queries accepted by one batch metric evaluation request
+MAX_BATCH_QUERIES = 100
+
+class MetricBatchRequest(BaseModel):
+    """Batch of queries scored with shared parameters"""
+    queryRefs: List[QueryRef] = Field(max_length=MAX_BATCH_QUERIES)
+    parameters: Optional[Dict[str, str]] = Field(default_factory=dict)
@@ -1,13 +1,49 @@
 """
 Metrics calculation logic
 """
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Tuple
 from enum import Enum
 from kubernetes import client
+from ..model_resolver import _get_k8s_client, _run_k8s_call
 
 logger = logging.getLogger(__name__)
 
+# Model pricing annotations are cached per (namespace, model name), including models without pricing
+MODEL_PRICING_TTL_SECONDS = 300
+MODEL_PRICING_CACHE_MAXSIZE = 512
+_model_pricing_cache: Dict[Tuple[str, str], Tuple[float, Optional[Dict[str, float]]]] = {}
+
+
+def _cache_model_pricing(key: Tuple[str, str], pricing: Optional[Dict[str, float]]) -> None:
+    """Store a pricing lookup result, evicting the oldest entry when the cache is full"""
+    if key not in _model_pricing_cache and len(_model_pricing_cache) >= MODEL_PRICING_CACHE_MAXSIZE:
+        _model_pricing_cache.pop(next(iter(_model_pricing_cache)))
+    _model_pricing_cache[key] = (time.monotonic() + MODEL_PRICING_TTL_SECONDS, pricing)
+
+
+@lru_cache(maxsize=64)
+def _parse_duration_string(duration_str: str) -> float:
+    """Parse a duration string such as "30s", "2m" or "1h" to seconds"""
+    duration_str = duration_str.lower().strip()
+    
+    try:
+        if duration_str.endswith('s'):
+            return float(duration_str[:-1])
+        elif duration_str.endswith('m'):
+            return float(duration_str[:-1]) * 60
+        elif duration_str.endswith('h'):
+            return float(duration_str[:-1]) * 3600
+        else:
+            # Assume seconds if no unit
+            return float(duration_str)
+    except ValueError:
+        logger.warning("Invalid duration '%s', using 30 seconds", duration_str)
+        return 30.0
+
 
 class PricingAnnotations:
     """Constants for model pricing annotations"""
@@ -27,6 +63,11 @@ class PricingUnit(Enum):
 class MetricsCalculator:
     def __init__(self, parameters: Dict[str, Any]):
         self.parameters = parameters
+        self._custom_api: Optional[client.CustomObjectsApi] = None
+        
+        # Parameters never change for a calculator, so weights and thresholds are converted on first use
+        self._score_weights: Optional[Dict[str, float]] = None
+        self._thresholds: Dict[Tuple[str, Any], Any] = {}
         
         # Default model pricing (USD per 1K tokens)
         self.model_pricing = {
@@ -36,16 +77,26 @@ class MetricsCalculator:
             "claude-3-sonnet": {"input": 0.003, "output": 0.015},
             "claude-3-haiku": {"input": 0.00025, "output": 0.00125}
         }
+        self._default_pricing_models = tuple(self.model_pricing)
     
-    async def calculate_overall_score(self, metrics: Dict[str, Any]) -> float:
-        """Calculate weighted overall score"""
+    async def calculate_overall_score(self, metrics: Dict[str, Any], use_pricing_annotations: bool = True) -> float:
+        """Calculate weighted overall score, looking up the query cost first if it is not known yet"""
+        if "totalCost" not in metrics:
+            await self._calculate_query_cost(metrics, use_pricing_annotations)
+        return self.calculate_weighted_score(metrics)
+    
+    def calculate_weighted_score(self, metrics: Dict[str, Any]) -> float:
+        """Calculate weighted overall score from metrics that already include the query cost"""
         try:
-            logger.info(f"Calculating overall score from metrics: {metrics}")
+            logger.debug("Calculating overall score from metrics: %s", metrics)
             
-            # Calculate individual metric scores
-            token_score = self._calculate_token_score(metrics)
-            cost_score = self._calculate_cost_score(metrics)
-            performance_score = self._calculate_performance_score(metrics)
+            # Calculate individual metric scores, collecting threshold results to record once
+            violations: List[str] = []
+            passed: List[str] = []
+            token_score = self._calculate_token_score(metrics, violations, passed)
+            cost_score = self._calculate_cost_score(metrics, violations, passed)
+            performance_score = self._calculate_performance_score(metrics, violations, passed)
+            self._record_threshold_results(metrics, violations, passed)
 
             # Weight the scores based on parameters or defaults
             weights = self._get_score_weights()
@@ -56,21 +107,21 @@ class MetricsCalculator:
                 performance_score * weights["performance"]
             )
 
-            # Update metrics with individual scores and violations
+            # Update metrics with individual scores
             self._update_metrics_with_scores(metrics, {
                 "tokenScore": token_score,
                 "costScore": cost_score,
                 "performanceScore": performance_score
             })
             
-            logger.info(f"Calculated overall score: {overall_score:.2f}")
+            logger.info("Calculated overall score: %.2f", overall_score)
             return overall_score
             
         except Exception as e:
-            logger.error(f"Failed to calculate overall score: {e}")
+            logger.error("Failed to calculate overall score: %s", e)
             return 0.0
     
-    def _calculate_token_score(self, metrics: Dict[str, Any]) -> float:
+    def _calculate_token_score(self, metrics: Dict[str, Any], violations: List[str], passed: List[str]) -> float:
         """Calculate token usage score (0.0-1.0)"""
         try:
             total_tokens = metrics.get("totalTokens", 0)
@@ -81,13 +132,13 @@ class MetricsCalculator:
                 
             if total_tokens > max_tokens:
                 # Add to violations
-                metrics.setdefault("threshold_violations", []).append("maxTokens")
+                violations.append("maxTokens")
                 # Return low score but not zero
                 return max(0.1, 1.0 - (total_tokens - max_tokens) / max_tokens)
             
             # Score based on how close to limit
             score = 1.0 - (total_tokens / max_tokens)
-            metrics.setdefault("passed_thresholds", []).append("maxTokens")
+            passed.append("maxTokens")
             
             # Bonus for token efficiency
             token_efficiency = metrics.get("tokenEfficiency", 0)
@@ -95,21 +146,17 @@ class MetricsCalculator:
             
             if token_efficiency >= efficiency_threshold:
                 score = min(1.0, score + 0.1)  # Bonus for efficiency
-                metrics.setdefault("passed_thresholds", []).append("tokenEfficiency")
+                passed.append("tokenEfficiency")
             
             return max(0.0, min(1.0, score))
             
         except Exception as e:
-            logger.warning(f"Failed to calculate token score: {e}")
+            logger.warning("Failed to calculate token score: %s", e)
             return 0.5
     
-    def _calculate_cost_score(self, metrics: Dict[str, Any]) -> float:
+    def _calculate_cost_score(self, metrics: Dict[str, Any], violations: List[str], passed: List[str]) -> float:
         """Calculate cost efficiency score"""
         try:
-            # Calculate actual cost if not already calculated
-            if "totalCost" not in metrics:
-                self._calculate_query_cost(metrics)
-            
             total_cost = metrics.get("totalCost", 0)
             max_cost = self._get_threshold("maxCostPerQuery", 0.10)
             
@@ -117,13 +164,13 @@ class MetricsCalculator:
                 return 1.0  # Perfect score if no cost
                 
             if total_cost > max_cost:
-                metrics.setdefault("threshold_violations", []).append("maxCostPerQuery")
+                violations.append("maxCostPerQuery")
                 # Penalty for exceeding cost but not zero
                 return max(0.1, 1.0 - (total_cost - max_cost) / max_cost)
             
             # Score based on cost efficiency
             score = 1.0 - (total_cost / max_cost)
-            metrics.setdefault("passed_thresholds", []).append("maxCostPerQuery")
+            passed.append("maxCostPerQuery")
             
             # Check cost efficiency threshold
             cost_efficiency = metrics.get("costEfficiency", 0)
@@ -131,15 +178,15 @@ class MetricsCalculator:
             
             if cost_efficiency >= efficiency_threshold:
                 score = min(1.0, score + 0.1)  # Bonus for efficiency
-                metrics.setdefault("passed_thresholds", []).append("costEfficiency")
+                passed.append("costEfficiency")
             
             return max(0.0, min(1.0, score))
             
         except Exception as e:
-            logger.warning(f"Failed to calculate cost score: {e}")
+            logger.warning("Failed to calculate cost score: %s", e)
             return 0.5
     
-    def _calculate_performance_score(self, metrics: Dict[str, Any]) -> float:
+    def _calculate_performance_score(self, metrics: Dict[str, Any], violations: List[str], passed: List[str]) -> float:
         """Calculate execution performance score"""
         try:
             score = 1.0
@@ -150,10 +197,10 @@ class MetricsCalculator:
             
             if duration_seconds > 0:
                 if duration_seconds > max_duration:
-                    metrics.setdefault("threshold_violations", []).append("maxDuration")
+                    violations.append("maxDuration")
                     score *= max(0.1, 1.0 - ((duration_seconds - max_duration) / max_duration))
                 else:
-                    metrics.setdefault("passed_thresholds", []).append("maxDuration")
+                    passed.append("maxDuration")
                     # Bonus for fast execution
                     if duration_seconds < max_duration * 0.5:
                         score = min(1.0, score + 0.1)
@@ -171,38 +218,32 @@ class MetricsCalculator:
             return max(0.0, min(1.0, score))
             
         except Exception as e:
-            logger.warning(f"Failed to calculate performance score: {e}")
+            logger.warning("Failed to calculate performance score: %s", e)
             return 0.5
     
-    def _calculate_query_cost(self, metrics: Dict[str, Any]) -> None:
+    async def _calculate_query_cost(self, metrics: Dict[str, Any], use_pricing_annotations: bool = True) -> None:
         """Calculate query cost based on token usage and model pricing"""
         try:
             total_tokens = metrics.get("totalTokens", 0)
-            prompt_tokens = metrics.get("promptTokens", 0)
-            completion_tokens = metrics.get("completionTokens", 0)
-            model_name = metrics.get("modelName", "gpt-4")  # Default fallback
-            
             if total_tokens == 0:
-                metrics["totalCost"] = 0.0
-                metrics["costPerToken"] = 0.0
+                metrics["totalCost"] = metrics["costPerToken"] = 0.0
                 return
             
             # Get pricing for the model
-            logger.debug(f"Model name for pricing lookup: '{model_name}'")
-            pricing = self._get_model_pricing(model_name)
-            logger.debug(f"Pricing found: {pricing}")
+            model_name = metrics.get("modelName", "gpt-4")  # Default fallback
+            logger.debug("Model name for pricing lookup: '%s'", model_name)
+            pricing = await self._get_model_pricing(model_name, use_annotations=use_pricing_annotations)
+            logger.debug("Pricing found: %s", pricing)
             
             # Calculate cost components
-            input_cost = (prompt_tokens / 1000) * pricing["input"]
-            output_cost = (completion_tokens / 1000) * pricing["output"]
+            input_cost = (metrics.get("promptTokens", 0) / 1000) * pricing["input"]
+            output_cost = (metrics.get("completionTokens", 0) / 1000) * pricing["output"]
             total_cost = input_cost + output_cost
             
-            metrics.update({
-                "totalCost": round(total_cost, 4),
-                "inputCost": round(input_cost, 4),
-                "outputCost": round(output_cost, 4),
-                "costPerToken": round(total_cost / total_tokens, 6) if total_tokens > 0 else 0
-            })
+            metrics["totalCost"] = round(total_cost, 4)
+            metrics["inputCost"] = round(input_cost, 4)
+            metrics["outputCost"] = round(output_cost, 4)
+            metrics["costPerToken"] = round(total_cost / total_tokens, 6)
             
             # Calculate cost efficiency (value per dollar)
             response_length = metrics.get("totalResponseLength", 0)
@@ -210,105 +251,158 @@ class MetricsCalculator:
                 metrics["costEfficiency"] = response_length / total_cost
             
         except Exception as e:
-            logger.warning(f"Failed to calculate query cost: {e}")
+            logger.warning("Failed to calculate query cost: %s", e)
             metrics["totalCost"] = 0.0
     
-    def _get_model_pricing(self, model_name: str) -> Dict[str, float]:
-        """Get pricing for a specific model, checking annotations first"""
+    async def _get_model_pricing(self, model_name: str, use_annotations: bool = True) -> Dict[str, float]:
+        """Get pricing for a specific model, checking annotations first unless disabled"""
         # Try to get pricing from model annotations first
-        annotation_pricing = self._get_model_pricing_from_annotations(model_name)
+        annotation_pricing = await self._get_model_pricing_from_annotations(model_name) if use_annotations else None
         if annotation_pricing:
-            logger.debug(f"Using annotation-based pricing for model '{model_name}': {annotation_pricing}")
+            logger.debug("Using annotation-based pricing for model '%s': %s", model_name, annotation_pricing)
             return annotation_pricing
 
         # Fallback to hardcoded pricing dictionary
-        clean_name = model_name.lower().strip()
+        matched_model = self._match_default_pricing_model(model_name.lower().strip(), self._default_pricing_models)
+        if matched_model is None:
+            # Default to GPT-4 pricing if model not found
+            logger.warning("Unknown model '%s', using GPT-4 pricing", model_name)
+            return self.model_pricing["gpt-4"]
+
+        logger.debug("Using hardcoded pricing for model '%s' (matched '%s'): %s", model_name, matched_model, self.model_pricing[matched_model])
+        return self.model_pricing[matched_model]
 
-        # Check exact match first
-        if clean_name in self.model_pricing:
-            logger.debug(f"Using hardcoded pricing for model '{model_name}': {self.model_pricing[clean_name]}")
-            return self.model_pricing[clean_name]
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _match_default_pricing_model(clean_name: str, known_models: Tuple[str, ...]) -> Optional[str]:
+        """Match a model name against the default pricing table, exact match first, then partial"""
+        if clean_name in known_models:
+            return clean_name
 
-        # Check partial matches
-        for model, pricing in self.model_pricing.items():
+        for model in known_models:
             if model in clean_name or clean_name in model:
-                logger.debug(f"Using partial match pricing for model '{model_name}' (matched '{model}'): {pricing}")
-                return pricing
+                return model
 
-        # Default to GPT-4 pricing if model not found
-        logger.warning(f"Unknown model '{model_name}', using GPT-4 pricing")
-        return self.model_pricing["gpt-4"]
+        return None
 
-    def _get_model_pricing_from_annotations(self, model_name: str) -> Optional[Dict[str, float]]:
+    async def _get_model_pricing_from_annotations(self, model_name: str) -> Optional[Dict[str, float]]:
         """Get pricing from model resource annotations"""
-        try:
-            # Use Custom Objects API to get model resource
-            custom_api = client.CustomObjectsApi()
+        if not await self._ensure_custom_api():
+            logger.debug("Kubernetes client not available, skipping annotation pricing for '%s'", model_name)
+            return None
 
-            # Try default namespace first, then search other namespaces if needed
+        try:
+            # Check the default namespace and ark-system concurrently, preferring default
             namespaces_to_check = ["default", "ark-system"]
+            namespace_pricing = await asyncio.gather(*[
+                self._get_namespaced_model_pricing(namespace, model_name)
+                for namespace in namespaces_to_check
+            ])
 
-            for namespace in namespaces_to_check:
-                try:
-                    model = custom_api.get_namespaced_custom_object(
-                        group="ark.mckinsey.com",
-                        version="v1alpha1",
-                        namespace=namespace,
-                        plural="models",
-                        name=model_name
-                    )
-
-                    # Extract pricing annotations
-                    metadata = model.get('metadata', {})
-                    annotations = metadata.get('annotations', {})
-
-                    input_cost_str = annotations.get(PricingAnnotations.INPUT_COST)
-                    output_cost_str = annotations.get(PricingAnnotations.OUTPUT_COST)
-                    unit = annotations.get(PricingAnnotations.UNIT, PricingUnit.PER_MILLION_TOKENS.value)
-
-                    if input_cost_str is not None and output_cost_str is not None:
-                        input_cost = float(input_cost_str)
-                        output_cost = float(output_cost_str)
-
-                        # Convert to per-1k-tokens (standard format)
-                        if unit == PricingUnit.PER_MILLION_TOKENS.value:
-                            input_cost = input_cost / 1000
-                            output_cost = output_cost / 1000
-                        elif unit == PricingUnit.PER_THOUSAND_TOKENS.value:
-                            # Already in per-1k format, no conversion needed
-                            pass
-                        elif unit == PricingUnit.PER_HUNDRED_TOKENS.value:
-                            input_cost = input_cost * 10
-                            output_cost = output_cost * 10
-                        else:
-                            logger.warning(f"Unknown pricing unit '{unit}' for model '{model_name}', assuming per-thousand-tokens")
-
-                        logger.debug(f"Found model '{model_name}' in namespace '{namespace}' with annotation pricing")
-                        return {"input": input_cost, "output": output_cost}
-
-                except Exception as e:
-                    # Continue to next namespace if not found in this one
-                    logger.debug(f"Model '{model_name}' not found in namespace '{namespace}': {e}")
-                    continue
+            for namespace, pricing in zip(namespaces_to_check, namespace_pricing):
+                if pricing:
+                    logger.debug("Found model '%s' in namespace '%s' with annotation pricing", model_name, namespace)
+                    return pricing
 
             # Model not found in any namespace
-            logger.debug(f"Model '{model_name}' not found in any namespace or missing pricing annotations")
+            logger.debug("Model '%s' not found in any namespace or missing pricing annotations", model_name)
             return None
 
         except Exception as e:
-            logger.warning(f"Failed to lookup model pricing annotations for '{model_name}': {e}")
+            logger.warning("Failed to lookup model pricing annotations for '%s': %s", model_name, e)
             return None
+
+    async def _get_namespaced_model_pricing(self, namespace: str, model_name: str) -> Optional[Dict[str, float]]:
+        """Get annotation pricing for a model in one namespace, using the pricing cache"""
+        key = (namespace, model_name)
+        cached = _model_pricing_cache.get(key)
+        if cached and cached[0] > time.monotonic():
+            return cached[1]
+
+        try:
+            # The Kubernetes client is blocking, so fetch the Model CRD off the event loop
+            model = await _run_k8s_call(self._get_model_resource, namespace, model_name)
+            pricing = self._parse_pricing_annotations(model, model_name)
+        except client.exceptions.ApiException as e:
+            if e.status != 404:
+                logger.debug("Failed to get model '%s' in namespace '%s': %s", model_name, namespace, e)
+                return None
+            pricing = None
+        except Exception as e:
+            logger.debug("Model '%s' not found in namespace '%s': %s", model_name, namespace, e)
+            return None
+
+        _cache_model_pricing(key, pricing)
+        return pricing
+
+    async def _ensure_custom_api(self) -> bool:
+        """Create the Custom Objects API on the shared Kubernetes API client, if one is available"""
+        if self._custom_api is None:
+            api_client = await _run_k8s_call(_get_k8s_client)
+            if api_client is None:
+                return False
+            self._custom_api = client.CustomObjectsApi(api_client)
+        return True
+
+    def _get_model_resource(self, namespace: str, model_name: str) -> Dict[str, Any]:
+        """Fetch a Model CRD (blocking)"""
+        return self._custom_api.get_namespaced_custom_object(
+            group="ark.mckinsey.com",
+            version="v1alpha1",
+            namespace=namespace,
+            plural="models",
+            name=model_name
+        )
+
+    def _parse_pricing_annotations(self, model: Dict[str, Any], model_name: str) -> Optional[Dict[str, float]]:
+        """Extract per-1k-token pricing from a model resource, or None if it has no pricing annotations"""
+        metadata = model.get('metadata', {})
+        annotations = metadata.get('annotations', {})
+
+        input_cost_str = annotations.get(PricingAnnotations.INPUT_COST)
+        output_cost_str = annotations.get(PricingAnnotations.OUTPUT_COST)
+        unit = annotations.get(PricingAnnotations.UNIT, PricingUnit.PER_MILLION_TOKENS.value)
+
+        if input_cost_str is None or output_cost_str is None:
+            return None
+
+        input_cost = float(input_cost_str)
+        output_cost = float(output_cost_str)
+
+        # Convert to per-1k-tokens (standard format)
+        if unit == PricingUnit.PER_MILLION_TOKENS.value:
+            input_cost = input_cost / 1000
+            output_cost = output_cost / 1000
+        elif unit == PricingUnit.PER_THOUSAND_TOKENS.value:
+            # Already in per-1k format, no conversion needed
+            pass
+        elif unit == PricingUnit.PER_HUNDRED_TOKENS.value:
+            input_cost = input_cost * 10
+            output_cost = output_cost * 10
+        else:
+            logger.warning("Unknown pricing unit '%s' for model '%s', assuming per-thousand-tokens", unit, model_name)
+
+        return {"input": input_cost, "output": output_cost}
     
     def _get_score_weights(self) -> Dict[str, float]:
-        """Get scoring weights from parameters or defaults"""
-        return {
-            "token": float(self.parameters.get("tokenWeight", 0.35)),
-            "cost": float(self.parameters.get("costWeight", 0.35)),
-            "performance": float(self.parameters.get("performanceWeight", 0.30))
-        }
+        """Get scoring weights from parameters or defaults, converted once per calculator"""
+        if self._score_weights is None:
+            self._score_weights = {
+                "token": float(self.parameters.get("tokenWeight", 0.35)),
+                "cost": float(self.parameters.get("costWeight", 0.35)),
+                "performance": float(self.parameters.get("performanceWeight", 0.30))
+            }
+        return self._score_weights
     
     def _get_threshold(self, param_name: str, default_value) -> Any:
-        """Get threshold value from parameters with type conversion"""
+        """Get threshold value from parameters with type conversion, converted once per calculator"""
+        key = (param_name, default_value)
+        if key not in self._thresholds:
+            self._thresholds[key] = self._convert_threshold(param_name, default_value)
+        return self._thresholds[key]
+    
+    def _convert_threshold(self, param_name: str, default_value) -> Any:
+        """Convert a threshold parameter to the type of its default value"""
         value = self.parameters.get(param_name, default_value)
         
         # Convert string numbers to appropriate types
@@ -319,7 +413,7 @@ class MetricsCalculator:
                 else:
                     return float(value)
             except ValueError:
-                logger.warning(f"Invalid {param_name} value '{value}', using default {default_value}")
+                logger.warning("Invalid %s value '%s', using default %s", param_name, value, default_value)
                 return default_value
         
         return value
@@ -329,26 +423,14 @@ class MetricsCalculator:
         if isinstance(duration_str, (int, float)):
             return float(duration_str)
             
-        duration_str = str(duration_str).lower().strip()
-        
-        try:
-            if duration_str.endswith('s'):
-                return float(duration_str[:-1])
-            elif duration_str.endswith('m'):
-                return float(duration_str[:-1]) * 60
-            elif duration_str.endswith('h'):
-                return float(duration_str[:-1]) * 3600
-            else:
-                # Assume seconds if no unit
-                return float(duration_str)
-        except ValueError:
-            logger.warning(f"Invalid duration '{duration_str}', using 30 seconds")
-            return 30.0
+        return _parse_duration_string(str(duration_str))
+    
+    def _record_threshold_results(self, metrics: Dict[str, Any], violations: List[str], passed: List[str]) -> None:
+        """Append threshold violations and passed thresholds to the metrics lists, skipping ones already recorded"""
+        for key, results in (("threshold_violations", violations), ("passed_thresholds", passed)):
+            recorded = metrics.setdefault(key, [])
+            recorded.extend(result for result in dict.fromkeys(results) if result not in recorded)
     
     def _update_metrics_with_scores(self, metrics: Dict[str, Any], scores: Dict[str, float]) -> None:
         """Update metrics dict with individual scores"""
-        metrics.update(scores)
-        
-        # Ensure lists exist
-        metrics.setdefault("threshold_violations", [])
-        metrics.setdefault("passed_thresholds", [])
\ No newline at end of file
+        metrics.update(scores)
\ No newline at end of file
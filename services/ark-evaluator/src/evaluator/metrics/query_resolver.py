@@ -5,6 +5,7 @@ from typing import Optional, Dict, Any
 from kubernetes import client, config
 from ark_sdk.models import QueryV1alpha1
 from ..types import QueryRef
+from ..model_resolver import _run_k8s_call
 
 logger = logging.getLogger(__name__)
 
@@ -33,8 +34,8 @@ class QueryResolver:
         try:
             logger.info(f"Resolving query {query_ref.name} in namespace {query_ref.namespace}")
             
-            # Load Query CRD from Kubernetes
-            query_crd = self._load_query_crd(query_ref.name, query_ref.namespace)
+            # Load Query CRD off the event loop since the Kubernetes client is blocking
+            query_crd = await _run_k8s_call(self._load_query_crd, query_ref.name, query_ref.namespace)
             logger.info(f"Loaded query CRD as type: {type(query_crd)}")
             
             # For now, bypass the ARK SDK conversion and work directly with the dict
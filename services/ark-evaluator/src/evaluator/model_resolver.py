@@ -1,6 +1,9 @@
 # services/ark-evaluator/src/evaluator/model_resolver.py
 
+import asyncio
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict, Any
 from kubernetes import client, config
 from .types import ModelRef
@@ -11,6 +14,11 @@ logger = logging.getLogger(__name__)
 _k8s_client_cache = None
 _k8s_client_initialized = False
 
+# Blocking Kubernetes client calls share a small dedicated pool, so concurrent evaluations
+# queue for a bounded number of threads instead of growing the default executor
+K8S_EXECUTOR_MAX_WORKERS = 8
+_k8s_executor = ThreadPoolExecutor(max_workers=K8S_EXECUTOR_MAX_WORKERS, thread_name_prefix="kube-io")
+
 
 class ModelConfig:
     """Simple model configuration container"""
@@ -45,6 +53,12 @@ def _get_k8s_client():
     return _k8s_client_cache
 
 
+async def _run_k8s_call(func, *args, **kwargs):
+    """Run a blocking Kubernetes client call on the shared Kubernetes thread pool"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_k8s_executor, functools.partial(func, *args, **kwargs))
+
+
 class ModelResolver:
     """Resolves Model configurations using direct Kubernetes API"""
     
@@ -72,7 +86,7 @@ class ModelResolver:
             # Option 1: Explicit model reference
             if model_ref:
                 logger.info(f"Resolving from explicit model reference: {model_ref.name}")
-                return self._resolve_from_model_ref(model_ref)
+                return await self._resolve_from_model_ref(model_ref)
             
             # Option 2: From query context
             if query_context and 'spec' in query_context:
@@ -80,29 +94,29 @@ class ModelResolver:
                 if 'modelRef' in query_spec:
                     model_ref_data = query_spec['modelRef']
                     logger.info(f"Resolving from query context modelRef: {model_ref_data}")
-                    return self._resolve_from_query_model_ref(model_ref_data, query_context)
+                    return await self._resolve_from_query_model_ref(model_ref_data, query_context)
             
             # Option 3: Default model
             logger.info("No explicit model reference found, resolving default model")
-            return self._resolve_default_model(query_context)
+            return await self._resolve_default_model(query_context)
             
         except Exception as e:
             logger.error(f"Failed to resolve model: {e}")
             logger.info("Falling back to system default model")
             return self._get_system_default_model()
     
-    def _resolve_from_model_ref(self, model_ref: ModelRef) -> ModelConfig:
+    async def _resolve_from_model_ref(self, model_ref: ModelRef) -> ModelConfig:
         """Resolve model from explicit ModelRef"""
         namespace = model_ref.namespace or "default"
         logger.info(f"Resolving model from ModelRef: {model_ref.name} in namespace {namespace}")
         
         # Load model CRD using direct Kubernetes API
-        model_crd = self._load_model_crd(model_ref.name, namespace)
+        model_crd = await self._load_model_crd(model_ref.name, namespace)
         
         # Extract model configuration from CRD
-        return self._extract_model_config_from_crd(model_crd)
+        return await self._extract_model_config_from_crd(model_crd)
     
-    def _resolve_from_query_model_ref(self, model_ref_data: Dict[str, Any], 
+    async def _resolve_from_query_model_ref(self, model_ref_data: Dict[str, Any], 
                                     query_context: Dict[str, Any]) -> ModelConfig:
         """Resolve model from query's modelRef"""
         model_name = model_ref_data.get('name', 'default')
@@ -110,10 +124,10 @@ class ModelResolver:
         
         logger.info(f"Resolving model from query modelRef: {model_name} in namespace {namespace}")
         
-        model_crd = self._load_model_crd(model_name, namespace)
-        return self._extract_model_config_from_crd(model_crd)
+        model_crd = await self._load_model_crd(model_name, namespace)
+        return await self._extract_model_config_from_crd(model_crd)
     
-    def _resolve_default_model(self, query_context: Optional[Dict[str, Any]] = None) -> ModelConfig:
+    async def _resolve_default_model(self, query_context: Optional[Dict[str, Any]] = None) -> ModelConfig:
         """Resolve default model in namespace"""
         namespace = "default"
         if query_context and 'metadata' in query_context:
@@ -123,21 +137,22 @@ class ModelResolver:
         
         # Try to load 'default' model
         try:
-            model_crd = self._load_model_crd('default', namespace)
+            model_crd = await self._load_model_crd('default', namespace)
             logger.info(f"Found default model CRD in namespace {namespace}")
-            return self._extract_model_config_from_crd(model_crd)
+            return await self._extract_model_config_from_crd(model_crd)
         except Exception as e:
             logger.warning(f"Could not load default model in namespace {namespace}: {e}")
             logger.info("Falling back to system default model")
             # Fall back to system default
             return self._get_system_default_model()
     
-    def _load_model_crd(self, name: str, namespace: str) -> Dict[str, Any]:
+    async def _load_model_crd(self, name: str, namespace: str) -> Dict[str, Any]:
         """Load Model CRD from Kubernetes"""
         custom_api = client.CustomObjectsApi(self.k8s_client)
         
         try:
-            model_crd = custom_api.get_namespaced_custom_object(
+            model_crd = await _run_k8s_call(
+                custom_api.get_namespaced_custom_object,
                 group="ark.mckinsey.com",
                 version="v1alpha1",
                 namespace=namespace,
@@ -153,7 +168,7 @@ class ModelResolver:
             else:
                 raise ValueError(f"Error loading model '{name}': {e}")
     
-    def _extract_model_config_from_crd(self, model_crd: Dict[str, Any]) -> ModelConfig:
+    async def _extract_model_config_from_crd(self, model_crd: Dict[str, Any]) -> ModelConfig:
         """Extract model configuration from Model CRD"""
         spec = model_crd.get('spec', {})
         model_name = spec.get('model', {}).get('value', 'gpt-4')
@@ -166,12 +181,12 @@ class ModelResolver:
         if model_type == 'azure':
             azure_config = config.get('azure', {})
             base_url = azure_config.get('baseUrl', {}).get('value', '')
-            api_key = self._resolve_value_source(azure_config.get('apiKey', {}), model_crd.get('metadata', {}).get('namespace', 'default'))
+            api_key = await self._resolve_value_source(azure_config.get('apiKey', {}), model_crd.get('metadata', {}).get('namespace', 'default'))
             api_version = azure_config.get('apiVersion', {}).get('value', '2024-02-15')
         elif model_type == 'openai':
             openai_config = config.get('openai', {})
             base_url = openai_config.get('baseUrl', {}).get('value', 'https://api.openai.com/v1')
-            api_key = self._resolve_value_source(openai_config.get('apiKey', {}), model_crd.get('metadata', {}).get('namespace', 'default'))
+            api_key = await self._resolve_value_source(openai_config.get('apiKey', {}), model_crd.get('metadata', {}).get('namespace', 'default'))
             api_version = openai_config.get('apiVersion', {}).get('value', '2024-02-15')
         else:
             logger.warning(f"Unknown model type: {model_type}, using default OpenAI config")
@@ -186,21 +201,21 @@ class ModelResolver:
             api_version=api_version
         )
     
-    def _resolve_value_source(self, value_source: Dict[str, Any], namespace: str) -> str:
+    async def _resolve_value_source(self, value_source: Dict[str, Any], namespace: str) -> str:
         """Resolve value from valueSource (direct value, secret, or configmap)"""
         if 'value' in value_source:
             return value_source['value']
         elif 'valueFrom' in value_source:
             value_from = value_source['valueFrom']
             if 'secretKeyRef' in value_from:
-                return self._resolve_secret_key_ref(value_from['secretKeyRef'], namespace)
+                return await self._resolve_secret_key_ref(value_from['secretKeyRef'], namespace)
             elif 'configMapKeyRef' in value_from:
-                return self._resolve_configmap_key_ref(value_from['configMapKeyRef'], namespace)
+                return await self._resolve_configmap_key_ref(value_from['configMapKeyRef'], namespace)
         
         logger.warning("Could not resolve value source, using default")
         return "demo-key"
     
-    def _resolve_secret_key_ref(self, secret_key_ref: Dict[str, Any], namespace: str) -> str:
+    async def _resolve_secret_key_ref(self, secret_key_ref: Dict[str, Any], namespace: str) -> str:
         """Resolve value from Kubernetes Secret"""
         secret_name = secret_key_ref.get('name')
         secret_key = secret_key_ref.get('key')
@@ -215,7 +230,7 @@ class ModelResolver:
         
         try:
             v1 = client.CoreV1Api(self.k8s_client)
-            secret = v1.read_namespaced_secret(name=secret_name, namespace=namespace)
+            secret = await _run_k8s_call(v1.read_namespaced_secret, name=secret_name, namespace=namespace)
             
             if secret.data and secret_key in secret.data:
                 # Secret data is base64 encoded, decode it
@@ -242,7 +257,7 @@ class ModelResolver:
             logger.error(f"Unexpected error resolving secret '{secret_name}.{secret_key}': {e}")
             return "secret-decode-error"
     
-    def _resolve_configmap_key_ref(self, configmap_key_ref: Dict[str, Any], namespace: str) -> str:
+    async def _resolve_configmap_key_ref(self, configmap_key_ref: Dict[str, Any], namespace: str) -> str:
         """Resolve value from Kubernetes ConfigMap"""
         configmap_name = configmap_key_ref.get('name')
         configmap_key = configmap_key_ref.get('key')
@@ -257,7 +272,7 @@ class ModelResolver:
         
         try:
             v1 = client.CoreV1Api(self.k8s_client)
-            configmap = v1.read_namespaced_config_map(name=configmap_name, namespace=namespace)
+            configmap = await _run_k8s_call(v1.read_namespaced_config_map, name=configmap_name, namespace=namespace)
             
             if configmap.data and configmap_key in configmap.data:
                 configmap_value = configmap.data[configmap_key]
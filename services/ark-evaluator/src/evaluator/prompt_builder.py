@@ -6,8 +6,10 @@ Provides a clean, maintainable way to build complex prompts with various section
 """
 
 from typing import Optional, List
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 import logging
+import textwrap
 
 from .types import EvaluationRequest, EvaluationParameters
 from .agent_resolver import AgentInstructions
@@ -15,18 +17,184 @@ from .agent_resolver import AgentInstructions
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class PromptSection:
     """Represents a section of the evaluation prompt"""
     title: str
     content: str
-    order: int = 0
+    rendered: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Sections are immutable, so render once here rather than on every build
+        if not self.content.strip():
+            rendered = ""
+        elif self.title:
+            rendered = f"{self.title}\n{self.content}\n"
+        else:
+            rendered = self.content
+        object.__setattr__(self, "rendered", rendered)
 
     def render(self) -> str:
         """Render the section as formatted text"""
-        if not self.content.strip():
-            return ""
-        return f"{self.title}\n{self.content}\n" if self.title else self.content
+        return self.rendered
+
+
+# Fixed position of each section kind in the built prompt
+(
+    _USER_QUERY_SLOT,
+    _RESPONSE_SLOT,
+    _AGENT_INSTRUCTIONS_SLOT,
+    _CONTEXT_SLOT,
+    _GOLDEN_EXAMPLES_SLOT,
+    _EVALUATION_CRITERIA_SLOT,
+    _SCORING_INSTRUCTIONS_SLOT,
+) = range(7)
+_SECTION_SLOT_COUNT = 7
+
+# Static prompt text, kept at module level so sections only splice in their variable parts.
+# Templates are dedented once at import so the prompt does not carry source indentation.
+_DEFAULT_EVALUATOR_ROLE = (
+    "You are an AI evaluator tasked with assessing the quality of "
+    "responses to user input and provided response."
+)
+
+_AGENT_NAME_LABEL = "\nName: "
+_AGENT_PURPOSE_LABEL = "\nPurpose: "
+_AGENT_SCOPE_GUIDELINES = textwrap.dedent("""
+
+    Expected to handle only query prompts that are aligned with the Agent Instructions and purpose.
+    For example, if an agent's purpose is to assist with mathematical calculations, it should clearly state that scope and refrain from processing USER QUERY that fall outside of it.
+    When it fails to do so, its evaluation score decreases on criteria such as compliance, appropriateness, and refusal handling.
+
+    SCORING GUIDELINES for criteria compliance, appropriateness, and refusal handling:
+        - If USER QUERY IS within agent scope AND agent provides good processing: HIGH score (0.8-1.0)
+        - If USER QUERY IS within agent scope BUT agent refuses unnecessarily: MEDIUM score (0.4-0.7)
+        - If USER QUERY IS outside agent scope AND agent properly refuses with explanation: HIGH score (0.8-1.0)
+        - If USER QUERY IS outside agent scope BUT agent processes it anyway: LOW score (0.0-0.3) - THIS IS CRITICAL
+""")
+
+_CONTEXT_PREFIX = textwrap.dedent("""
+    CRITICAL: GROUND TRUTH CONTEXT PROVIDED
+
+    The following context is the AUTHORITATIVE SOURCE for this evaluation:
+
+""")
+
+_CONTEXT_REQUIREMENTS = textwrap.dedent("""
+
+    STRICT SCORING REQUIREMENTS when context is provided:
+
+    1. ACCURACY: Response MUST be verified against the provided context
+       - HIGH score (0.8-1.0): All facts from response are found in context
+       - MEDIUM score (0.4-0.7): Some facts verified, some unverifiable
+       - LOW score (0.0-0.3): Response contradicts context or adds unverified facts
+
+    2. FAITHFULNESS: Response MUST NOT hallucinate beyond the context
+       - HIGH score (0.8-1.0): Every claim is grounded in context
+       - MEDIUM score (0.4-0.7): Mostly grounded with minor inferences
+       - LOW score (0.0-0.3): Contains information not in context (hallucination)
+
+    3. CONTEXT_RECALL: Response MUST use relevant information from context
+       - HIGH score (0.8-1.0): Uses most/all relevant context information
+       - MEDIUM score (0.4-0.7): Uses some relevant context
+       - LOW score (0.0-0.3): Ignores most context despite relevance
+
+    4. CONTEXT_PRECISION: Retrieved context MUST be relevant to the query
+       - HIGH score (0.8-1.0): Context is highly relevant and useful
+       - MEDIUM score (0.4-0.7): Context is partially relevant
+       - LOW score (0.0-0.3): Context is mostly irrelevant or noisy
+
+    IMPORTANT: If response ignores context or contradicts it, scores for
+    accuracy, faithfulness, and context_recall MUST be LOW (< 0.3).
+""")
+
+
+_GOLDEN_EXAMPLE_TEMPLATE = "Example {index}:\nInput: {input}\nExpected Output: {output}{metadata}"
+_GOLDEN_EXAMPLES_TEMPLATE = textwrap.dedent("""
+    Here are some reference examples to help guide your evaluation:
+    {examples}
+    Use these examples to understand the expected quality and style of responses for similar queries.
+""")
+
+
+def _golden_example_metadata(metadata: Optional[dict]) -> str:
+    """Render golden example metadata as a parenthesised suffix, or nothing when absent"""
+    if not metadata:
+        return ""
+    return f" ({', '.join(f'{k}: {v}' for k, v in metadata.items())})"
+
+
+@lru_cache(maxsize=128)
+def _agent_instructions_content(name: str, description: str) -> str:
+    """Render the agent instructions section, which depends only on the agent it describes"""
+    return "".join((_AGENT_NAME_LABEL, name, _AGENT_PURPOSE_LABEL, description, _AGENT_SCOPE_GUIDELINES))
+
+
+_CRITERIA_DEFINITIONS = textwrap.dedent("""
+    1. Relevance: How well do the responses address the user's query?
+    2. Accuracy: Are the responses factually correct and reliable?
+    3. Completeness: Do the responses provide comprehensive information?
+    4. Conciseness: Do the responses provide a concise information?
+    5. Clarity: Are the responses clear and easy to understand?
+    6. Usefulness: How helpful are the responses to the user?
+    7. Context_Precision: How precise is the retrieved context in relation to the query?
+    8. Context_Recall: How well does the response recall relevant information from the provided context?
+    9. Faithfulness: Does the response stay grounded in the provided context without hallucinations?
+""")
+
+_AGENT_CRITERIA_DEFINITIONS = _CRITERIA_DEFINITIONS + textwrap.dedent("""
+    10. Compliance: Does the response stay within the agent's intended scope and domain?
+    11. Appropriateness: Is the response appropriate given the input type and agent's specialty?
+    12. Refusal Handling: If input is outside scope, does the agent properly refuse with explanation?
+""")
+
+_SCORING_INSTRUCTIONS_TEMPLATE = textwrap.dedent("""\
+    Assessment
+
+    IMPORTANT SCORING INSTRUCTIONS:
+    1. Score each criterion individually on a 0-1 scale
+    2. The OVERALL SCORE must be the AVERAGE of the individual criteria scores
+    3. Only include criteria from {evaluation_scope} in your CRITERIA_SCORES
+    4. Ensure consistency between individual scores and the overall score
+
+    YOU MUST provide your evaluation in EXACTLY this format (all fields are REQUIRED):
+
+    SCORE: [number between 0 and 1, must be average of criteria scores]
+    PASSED: [true or false]
+    REASONING: [brief explanation of your evaluation]
+    CRITERIA_SCORES: [comma-separated criterion=score pairs from {evaluation_scope}]
+
+    CRITICAL REQUIREMENTS:
+    - The SCORE field is MANDATORY - you MUST provide a numeric score
+    - Use exact decimal format (e.g., 0.75, not "75%" or "0.75/1.0")
+    - SCORE must equal the average of all individual criterion scores
+    - Only include the criteria from {evaluation_scope}
+
+    Example with actual numbers:
+    SCORE: 0.75
+    PASSED: true
+    REASONING: Response meets quality standards with good accuracy and completeness.
+    CRITERIA_SCORES: accuracy=0.80, completeness=0.90, usefulness=0.70, compliance=0.60
+
+    Be objective and thorough in your assessment. PRIORITIZE scope compliance over other factors.
+""")
+
+
+@lru_cache(maxsize=128)
+def _evaluation_criteria_content(evaluation_scope: str, has_agent_instructions: bool) -> str:
+    """Render the criteria section, which depends only on the scope and agent criteria"""
+    all_criteria = _AGENT_CRITERIA_DEFINITIONS if has_agent_instructions else _CRITERIA_DEFINITIONS
+
+    return (
+        f"\nConsider all following criteria definition: {all_criteria}"
+        f"\nEvaluate the response only on the following criteria: {evaluation_scope}\n"
+    )
+
+
+@lru_cache(maxsize=128)
+def _scoring_instructions_content(evaluation_scope: str) -> str:
+    """Render the scoring instructions section, which depends only on the scope"""
+    return _SCORING_INSTRUCTIONS_TEMPLATE.format_map({"evaluation_scope": evaluation_scope})
 
 
 class EvaluationPromptBuilder:
@@ -45,7 +213,8 @@ class EvaluationPromptBuilder:
     """
 
     def __init__(self):
-        self._sections: List[PromptSection] = []
+        # One slot per section kind, so build() emits them in order without sorting
+        self._sections: List[Optional[PromptSection]] = [None] * _SECTION_SLOT_COUNT
         self._evaluator_role: Optional[str] = None
         self._evaluation_scope: Optional[str] = None
         self._min_score: float = 0.7
@@ -53,21 +222,17 @@ class EvaluationPromptBuilder:
 
     def set_evaluator_role(self, role: Optional[str]) -> 'EvaluationPromptBuilder':
         """Set the evaluator role/persona"""
-        self._evaluator_role = role or (
-            "You are an AI evaluator tasked with assessing the quality of "
-            "responses to user input and provided response."
-        )
-        logger.info(f"Using evaluator role: {self._evaluator_role[:100]}...")
+        self._evaluator_role = role or _DEFAULT_EVALUATOR_ROLE
+        logger.info("Using evaluator role: %.100s...", self._evaluator_role)
         return self
 
     def add_user_query(self, query: str) -> 'EvaluationPromptBuilder':
         """Add the user query section"""
         section = PromptSection(
             title="USER QUERY:",
-            content=query,
-            order=10
+            content=query
         )
-        self._sections.append(section)
+        self._sections[_USER_QUERY_SLOT] = section
         return self
 
     def add_response(self, request: EvaluationRequest) -> 'EvaluationPromptBuilder':
@@ -79,10 +244,9 @@ class EvaluationPromptBuilder:
 
         section = PromptSection(
             title="RESPONSE TO EVALUATE:",
-            content=response_text,
-            order=20
+            content=response_text
         )
-        self._sections.append(section)
+        self._sections[_RESPONSE_SLOT] = section
         return self
 
     def add_agent_instructions(
@@ -93,28 +257,14 @@ class EvaluationPromptBuilder:
         if not agent_instructions:
             return self
 
-        content = f"""
-                    Name: {agent_instructions.name}
-                    Purpose: {agent_instructions.description}
-
-                    Expected to handle only query prompts that are aligned with the Agent Instructions and purpose.
-                    For example, if an agent's purpose is to assist with mathematical calculations, it should clearly state that scope and refrain from processing USER QUERY that fall outside of it.
-                    When it fails to do so, its evaluation score decreases on criteria such as compliance, appropriateness, and refusal handling.
-
-                    SCORING GUIDELINES for criteria compliance, appropriateness, and refusal handling:
-                        - If USER QUERY IS within agent scope AND agent provides good processing: HIGH score (0.8-1.0)
-                        - If USER QUERY IS within agent scope BUT agent refuses unnecessarily: MEDIUM score (0.4-0.7)
-                        - If USER QUERY IS outside agent scope AND agent properly refuses with explanation: HIGH score (0.8-1.0)
-                        - If USER QUERY IS outside agent scope BUT agent processes it anyway: LOW score (0.0-0.3) - THIS IS CRITICAL
-                """
+        content = _agent_instructions_content(agent_instructions.name, agent_instructions.description)
 
         section = PromptSection(
             title="AGENT INSTRUCTIONS:",
-            content=content,
-            order=30
+            content=content
         )
-        self._sections.append(section)
-        logger.info(f"Adding scope instructions for agent: {agent_instructions.name}")
+        self._sections[_AGENT_INSTRUCTIONS_SLOT] = section
+        logger.info("Adding scope instructions for agent: %s", agent_instructions.name)
         return self
 
     def add_context(self, context: Optional[str]) -> 'EvaluationPromptBuilder':
@@ -124,46 +274,14 @@ class EvaluationPromptBuilder:
 
         self._has_context = True
 
-        content = f"""
-            CRITICAL: GROUND TRUTH CONTEXT PROVIDED
-
-            The following context is the AUTHORITATIVE SOURCE for this evaluation:
-
-            {context}
-
-            STRICT SCORING REQUIREMENTS when context is provided:
-
-            1. ACCURACY: Response MUST be verified against the provided context
-               - HIGH score (0.8-1.0): All facts from response are found in context
-               - MEDIUM score (0.4-0.7): Some facts verified, some unverifiable
-               - LOW score (0.0-0.3): Response contradicts context or adds unverified facts
-
-            2. FAITHFULNESS: Response MUST NOT hallucinate beyond the context
-               - HIGH score (0.8-1.0): Every claim is grounded in context
-               - MEDIUM score (0.4-0.7): Mostly grounded with minor inferences
-               - LOW score (0.0-0.3): Contains information not in context (hallucination)
-
-            3. CONTEXT_RECALL: Response MUST use relevant information from context
-               - HIGH score (0.8-1.0): Uses most/all relevant context information
-               - MEDIUM score (0.4-0.7): Uses some relevant context
-               - LOW score (0.0-0.3): Ignores most context despite relevance
-
-            4. CONTEXT_PRECISION: Retrieved context MUST be relevant to the query
-               - HIGH score (0.8-1.0): Context is highly relevant and useful
-               - MEDIUM score (0.4-0.7): Context is partially relevant
-               - LOW score (0.0-0.3): Context is mostly irrelevant or noisy
-
-            IMPORTANT: If response ignores context or contradicts it, scores for
-            accuracy, faithfulness, and context_recall MUST be LOW (< 0.3).
-        """
+        content = "".join((_CONTEXT_PREFIX, context, _CONTEXT_REQUIREMENTS))
 
         section = PromptSection(
             title="ADDITIONAL CONTEXT:",
-            content=content,
-            order=40
+            content=content
         )
-        self._sections.append(section)
-        logger.info(f"Adding strict context enforcement section, length: {len(context)} characters")
+        self._sections[_CONTEXT_SLOT] = section
+        logger.info("Adding strict context enforcement section, length: %d characters", len(context))
         return self
 
     def add_golden_examples(self, golden_examples: Optional[List]) -> 'EvaluationPromptBuilder':
@@ -171,34 +289,22 @@ class EvaluationPromptBuilder:
         if not golden_examples:
             return self
 
-        examples_list = []
-        for example in golden_examples:
-            metadata_str = ""
-            if hasattr(example, 'metadata') and example.metadata:
-                metadata_items = [f"{k}: {v}" for k, v in example.metadata.items()]
-                metadata_str = f" ({', '.join(metadata_items)})"
-            examples_list.append(
-                f"Input: {example.input}\n"
-                f"Expected Output: {example.expectedOutput}{metadata_str}"
-            )
-
         examples_text = "\n".join(
-            f"Example {i+1}:\n{example}"
-            for i, example in enumerate(examples_list)
+            _GOLDEN_EXAMPLE_TEMPLATE.format_map({
+                "index": index,
+                "input": example.input,
+                "output": example.expectedOutput,
+                "metadata": _golden_example_metadata(getattr(example, 'metadata', None)),
+            })
+            for index, example in enumerate(golden_examples, 1)
         )
-
-        content = f"""
-            Here are some reference examples to help guide your evaluation:
-            {examples_text}
-            Use these examples to understand the expected quality and style of responses for similar queries.
-        """
+        content = _GOLDEN_EXAMPLES_TEMPLATE.format_map({"examples": examples_text})
 
         section = PromptSection(
             title="REFERENCE EXAMPLES:",
-            content=content,
-            order=50
+            content=content
         )
-        self._sections.append(section)
+        self._sections[_GOLDEN_EXAMPLES_SLOT] = section
         return self
 
     def add_evaluation_criteria(
@@ -207,52 +313,25 @@ class EvaluationPromptBuilder:
         has_agent_instructions: bool = False
     ) -> 'EvaluationPromptBuilder':
         """Add evaluation criteria definitions and scope"""
-        scope_list = params.get_scope_list()
+        scope_values = params.scope_values
 
-        if self._has_context and "faithfulness" not in scope_list:
-            scope_list.append("faithfulness")
+        if self._has_context and "faithfulness" not in scope_values:
+            scope_values += ("faithfulness",)
             logger.info("Adding faithfulness criterion due to context presence")
 
-        self._evaluation_scope = ",".join(scope_list)
+        self._evaluation_scope = ",".join(scope_values)
         self._min_score = params.min_score
 
-        base_criteria = """
-            1. Relevance: How well do the responses address the user's query?
-            2. Accuracy: Are the responses factually correct and reliable?
-            3. Completeness: Do the responses provide comprehensive information?
-            4. Conciseness: Do the responses provide a concise information?
-            5. Clarity: Are the responses clear and easy to understand?
-            6. Usefulness: How helpful are the responses to the user?
-            7. Context_Precision: How precise is the retrieved context in relation to the query?
-            8. Context_Recall: How well does the response recall relevant information from the provided context?
-            9. Faithfulness: Does the response stay grounded in the provided context without hallucinations?
-        """
-
-        scope_criteria = ""
         if has_agent_instructions:
-            scope_criteria = """
-                10. Compliance: Does the response stay within the agent's intended scope and domain?
-                11. Appropriateness: Is the response appropriate given the input type and agent's specialty?
-                12. Refusal Handling: If input is outside scope, does the agent properly refuse with explanation?
-            """
             logger.info("Scope instructions added to prompt")
 
-        all_criteria = base_criteria
-        if scope_criteria:
-            all_criteria += "\n" + scope_criteria
-
-        content = f"""
-                    Consider all following criteria definition: {all_criteria}
-
-                    Evaluate the response only on the following criteria: {self._evaluation_scope}
-                """
+        content = _evaluation_criteria_content(self._evaluation_scope, has_agent_instructions)
 
         section = PromptSection(
             title="",
-            content=content,
-            order=60
+            content=content
         )
-        self._sections.append(section)
+        self._sections[_EVALUATION_CRITERIA_SLOT] = section
         return self
 
     def add_scoring_instructions(self) -> 'EvaluationPromptBuilder':
@@ -260,42 +339,13 @@ class EvaluationPromptBuilder:
         if not self._evaluation_scope:
             raise ValueError("Evaluation scope must be set before adding scoring instructions")
 
-        content = f"""Assessment
-
-                        IMPORTANT SCORING INSTRUCTIONS:
-                        1. Score each criterion individually on a 0-1 scale
-                        2. The OVERALL SCORE must be the AVERAGE of the individual criteria scores
-                        3. Only include criteria from {self._evaluation_scope} in your CRITERIA_SCORES
-                        4. Ensure consistency between individual scores and the overall score
-
-                        YOU MUST provide your evaluation in EXACTLY this format (all fields are REQUIRED):
-
-                        SCORE: [number between 0 and 1, must be average of criteria scores]
-                        PASSED: [true or false]
-                        REASONING: [brief explanation of your evaluation]
-                        CRITERIA_SCORES: [comma-separated criterion=score pairs from {self._evaluation_scope}]
-
-                        CRITICAL REQUIREMENTS:
-                        - The SCORE field is MANDATORY - you MUST provide a numeric score
-                        - Use exact decimal format (e.g., 0.75, not "75%" or "0.75/1.0")
-                        - SCORE must equal the average of all individual criterion scores
-                        - Only include the criteria from {self._evaluation_scope}
-
-                        Example with actual numbers:
-                        SCORE: 0.75
-                        PASSED: true
-                        REASONING: Response meets quality standards with good accuracy and completeness.
-                        CRITERIA_SCORES: accuracy=0.80, completeness=0.90, usefulness=0.70, compliance=0.60
-
-                        Be objective and thorough in your assessment. PRIORITIZE scope compliance over other factors.
-                    """
+        content = _scoring_instructions_content(self._evaluation_scope)
 
         section = PromptSection(
             title="",
-            content=content,
-            order=70
+            content=content
         )
-        self._sections.append(section)
+        self._sections[_SCORING_INSTRUCTIONS_SLOT] = section
         return self
 
     def build(self) -> str:
@@ -303,17 +353,14 @@ class EvaluationPromptBuilder:
         if not self._evaluator_role:
             raise ValueError("Evaluator role must be set before building")
 
-        sorted_sections = sorted(self._sections, key=lambda s: s.order)
-
-        sections_text = "\n\n".join(
-            section.render()
-            for section in sorted_sections
-            if section.content.strip()
+        parts = [self._evaluator_role]
+        parts.extend(
+            section.rendered
+            for section in self._sections
+            if section is not None and section.rendered
         )
 
-        prompt = f"{self._evaluator_role}\n\n{sections_text}"
-
-        return prompt
+        return "\n\n".join(parts)
 
 
 def build_evaluation_prompt(
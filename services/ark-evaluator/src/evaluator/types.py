@@ -1,7 +1,9 @@
-from typing import Dict, List, Any, Optional, Union, Literal
+from typing import Dict, List, Any, Optional, Tuple, Union, Literal
 from pydantic import BaseModel, Field, field_validator
 from enum import Enum
+from functools import lru_cache
 import logging
+import sys
 
 logger = logging.getLogger(__name__)
 
@@ -9,6 +11,11 @@ class QueryTarget(BaseModel):
     type: str
     name: str
 
+    @field_validator('type')
+    def intern_type(cls, v):
+        # Target types come from a handful of values and are compared against literals per response
+        return sys.intern(v)
+
 class Response(BaseModel):
     target: QueryTarget
     content: str
@@ -36,12 +43,11 @@ class EvaluationRequest(BaseModel):
             return v
 
         if isinstance(v, list):
-            messages = []
-            for msg in v:
-                if isinstance(msg, dict) and 'content' in msg:
-                    role = msg.get('role', 'unknown')
-                    content = msg.get('content', '')
-                    messages.append(f"{role}: {content}")
+            messages = [
+                f"{msg.get('role', 'unknown')}: {msg['content']}"
+                for msg in v
+                if isinstance(msg, dict) and 'content' in msg
+            ]
 
             if not messages:
                 raise ValueError("Chat message list is empty or malformed")
@@ -74,6 +80,37 @@ class EvaluationScope(str, Enum):
     CONTEXT_ENTITY_RECALL = "context_entity_recall"
     FAITHFULNESS = "faithfulness"
 
+_VALID_SCOPES = frozenset(scope.value for scope in EvaluationScope)
+
+# Scopes evaluated for "all": the base evaluation scopes, excluding "all" itself and RAGAS-specific metrics
+_ALL_SCOPES = (
+    "relevance", "accuracy", "conciseness", "completeness",
+    "clarity", "usefulness", "appropriateness", "compliance",
+    "refusal_handling"
+)
+
+
+@lru_cache(maxsize=128)
+def _split_scope(scope: Optional[str]) -> Tuple[str, ...]:
+    """Split a validated scope string into its individual, interned scope values"""
+    if not scope or scope == "all":
+        return _ALL_SCOPES
+    return tuple(sys.intern(part.strip()) for part in scope.split(","))
+
+
+# Request parameter names are accepted with '-', '.' or '_' separators, plus a few aliases
+_PARAM_SEPARATORS = str.maketrans({"-": "_", ".": "_"})
+_PARAM_ALIASES = {
+    "threshold": "min_score",
+    "evaluation_context": "context",
+    "evaluation_context_source": "context_source",
+}
+_PARAM_FIELDS = frozenset({
+    "scope", "min_score", "max_tokens", "temperature", "evaluation_criteria",
+    "context", "context_source", "evaluator_role", "custom_metadata"
+})
+
+
 class EvaluationParameters(BaseModel):
     scope: Optional[str] = Field(default="all", description="Evaluation scope")
     min_score: float = Field(default=0.7, ge=0.0, le=1.0, description="Minimum score threshold")
@@ -89,6 +126,10 @@ class EvaluationParameters(BaseModel):
     
     @field_validator('scope')
     def validate_scope(cls, v):
+        # The default scope is by far the most common, so accept it without normalizing
+        if v == "all":
+            return v
+        
         if v is None or not v:
             logger.warning("Empty scope provided, defaulting to 'all'")
             return "all"
@@ -96,29 +137,26 @@ class EvaluationParameters(BaseModel):
         scope_str = str(v).lower().strip()
         
         if ',' in scope_str or ' ' in scope_str:
-            scope_parts = [part.strip() for part in scope_str.replace(',', ' ').split()]
+            # split() with no separator already drops surrounding whitespace and empty parts
+            scope_parts = scope_str.replace(',', ' ').split()
             valid_scopes = []
             
             for part in scope_parts:
-                try:
-                    # Validate against enum
-                    EvaluationScope(part)
+                if part in _VALID_SCOPES:
                     valid_scopes.append(part)
-                except ValueError:
-                    logger.warning(f"Unknown scope value '{part}' ignored")
+                else:
+                    logger.warning("Unknown scope value '%s' ignored", part)
             
             if not valid_scopes:
                 logger.warning("No valid scope values found, defaulting to 'all'")
                 return "all"
             
             return ",".join(valid_scopes)
+        elif scope_str in _VALID_SCOPES:
+            return scope_str
         else:
-            try:
-                EvaluationScope(scope_str)
-                return scope_str
-            except ValueError:
-                logger.warning(f"Unknown scope value '{v}', defaulting to 'all'")
-                return "all"
+            logger.warning("Unknown scope value '%s', defaulting to 'all'", v)
+            return "all"
                 
     @classmethod
     def from_request_params(cls, params: Dict[str, Any]) -> "EvaluationParameters":
@@ -130,72 +168,47 @@ class EvaluationParameters(BaseModel):
             return cls()
         
         # Normalize parameter names (handle different naming conventions)
-        param_mapping = {
-            "scope": "scope",
-            "min-score": "min_score",
-            "min_score": "min_score",
-            "threshold": "min_score",
-            "max-tokens": "max_tokens",
-            "max_tokens": "max_tokens",
-            "temperature": "temperature",
-            "evaluation-criteria": "evaluation_criteria",
-            "evaluation_criteria": "evaluation_criteria",
-            "evaluation.context": "context",
-            "evaluation-context": "context",
-            "evaluation_context": "context",
-            "context": "context",
-            "evaluation.context_source": "context_source",
-            "evaluation-context-source": "context_source",
-            "evaluation_context_source": "context_source",
-            "context_source": "context_source",
-            "evaluator-role": "evaluator_role",
-            "evaluator_role": "evaluator_role",
-            "custom-metadata": "custom_metadata",
-            "custom_metadata": "custom_metadata"
-        }
-        
         normalized_params = {}
         for key, value in params.items():
-            if key in param_mapping:
-                normalized_params[param_mapping[key]] = value
-                logger.info(f"Mapped parameter: {key} -> {param_mapping[key]}")
+            field_name = key.translate(_PARAM_SEPARATORS)
+            field_name = _PARAM_ALIASES.get(field_name, field_name)
+            if field_name in _PARAM_FIELDS:
+                normalized_params[field_name] = value
+                logger.info("Mapped parameter: %s -> %s", key, field_name)
             else:
                 # Unknown parameters go to custom_metadata
                 if "custom_metadata" not in normalized_params:
                     normalized_params["custom_metadata"] = {}
                 normalized_params["custom_metadata"][key] = value
-                logger.warning(f"Unknown parameter moved to custom_metadata: {key} = {value}")
+                logger.warning("Unknown parameter moved to custom_metadata: %s = %s", key, value)
         
-        logger.info(f"Normalized parameters: {list(normalized_params.keys())}")
+        logger.info("Normalized parameters: %s", list(normalized_params))
         if "evaluator_role" in normalized_params:
-            logger.info(f"evaluator_role successfully mapped: {normalized_params['evaluator_role'][:50]}...")
+            logger.info("evaluator_role successfully mapped: %.50s...", normalized_params["evaluator_role"])
         
         # Handle evaluation_criteria conversion from string to list
         if "evaluation_criteria" in normalized_params and isinstance(normalized_params["evaluation_criteria"], str):
             criteria_string = normalized_params["evaluation_criteria"]
             normalized_params["evaluation_criteria"] = [c.strip() for c in criteria_string.split(",")]
-            logger.info(f"Converted evaluation_criteria from string to list: {normalized_params['evaluation_criteria']}")
+            logger.info("Converted evaluation_criteria from string to list: %s", normalized_params["evaluation_criteria"])
         
         try:
             result = cls(**normalized_params)
-            logger.info(f"Successfully created EvaluationParameters with evaluator_role: {result.evaluator_role[:50] if result.evaluator_role else 'None'}...")
+            logger.info("Successfully created EvaluationParameters with evaluator_role: %.50s...", result.evaluator_role)
             return result
         except Exception as e:
-            logger.error(f"Invalid parameters provided: {e}. Using defaults.")
-            logger.error(f"Normalized params that failed: {normalized_params}")
+            logger.error("Invalid parameters provided: %s. Using defaults.", e)
+            logger.error("Normalized params that failed: %s", normalized_params)
             return cls()
     
+    @property
+    def scope_values(self) -> Tuple[str, ...]:
+        """Get scope as a tuple of individual scope values, split once per distinct scope"""
+        return _split_scope(self.scope)
+    
     def get_scope_list(self) -> List[str]:
         """Get scope as a list of individual scope values"""
-        if not self.scope or self.scope == "all":
-            # Return only the base evaluation scopes (exclude "all" and RAGAS-specific metrics)
-            base_scopes = [
-                "relevance", "accuracy", "conciseness", "completeness",
-                "clarity", "usefulness", "appropriateness", "compliance",
-                "refusal_handling"
-            ]
-            return base_scopes
-        return [scope.strip() for scope in self.scope.split(",")]
+        return list(self.scope_values)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for downstream use"""
@@ -0,0 +1,174 @@
+"""Test suite for AgentResolver"""
+
+import asyncio
+import dataclasses
+import threading
+import pytest
+from unittest.mock import Mock, patch
+from kubernetes import client
+
+from evaluator import agent_resolver
+from evaluator.agent_resolver import AgentResolver, AgentInstructions
+
+
+class TestAgentResolver:
+    """Test the AgentResolver class"""
+    
+    @pytest.fixture(autouse=True)
+    def clear_agent_cache(self):
+        """Start every test with an empty agent instructions cache"""
+        agent_resolver._agent_instructions_cache.clear()
+        yield
+        agent_resolver._agent_instructions_cache.clear()
+    
+    @pytest.fixture
+    def mock_custom_api(self):
+        """Mock CustomObjectsApi returning a sample Agent CRD"""
+        with patch('evaluator.agent_resolver._get_k8s_client', return_value=Mock()), \
+             patch('evaluator.agent_resolver.client.CustomObjectsApi') as mock_api_class:
+            mock_api = Mock()
+            mock_api.get_namespaced_custom_object.return_value = {
+                "metadata": {"name": "math-agent"},
+                "spec": {"description": "Solves math problems", "prompt": "You are a math tutor."}
+            }
+            mock_api_class.return_value = mock_api
+            yield mock_api
+    
+    @pytest.mark.asyncio
+    async def test_resolve_agent_instructions(self, mock_custom_api):
+        """Test agent instructions are extracted from the Agent CRD"""
+        instructions = await AgentResolver().resolve_agent_instructions("math-agent")
+        
+        assert instructions.name == "math-agent"
+        assert instructions.description == "Solves math problems"
+        assert instructions.system_prompt == "You are a math tutor."
+    
+    @pytest.mark.asyncio
+    async def test_resolve_agent_instructions_cached_across_resolvers(self, mock_custom_api):
+        """Test repeated resolutions reuse the cached result instead of calling the API"""
+        first = await AgentResolver().resolve_agent_instructions("math-agent")
+        second = await AgentResolver().resolve_agent_instructions("math-agent")
+        
+        assert first == second
+        mock_custom_api.get_namespaced_custom_object.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_concurrent_resolutions_share_one_request(self, mock_custom_api):
+        """Test concurrent resolutions of the same agent coalesce into one API call"""
+        resolver = AgentResolver()
+        results = await asyncio.gather(*[
+            resolver.resolve_agent_instructions("math-agent") for _ in range(5)
+        ])
+        
+        assert all(result == results[0] for result in results)
+        mock_custom_api.get_namespaced_custom_object.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_failed_resolution_not_cached(self, mock_custom_api):
+        """Test a missing agent is looked up again on the next resolution"""
+        mock_custom_api.get_namespaced_custom_object.side_effect = client.exceptions.ApiException(status=404)
+        resolver = AgentResolver()
+        
+        assert await resolver.resolve_agent_instructions("missing-agent") is None
+        assert await resolver.resolve_agent_instructions("missing-agent") is None
+        assert mock_custom_api.get_namespaced_custom_object.call_count == 2
+    
+    @pytest.mark.asyncio
+    async def test_client_initialized_once_on_first_resolution(self):
+        """Test the Kubernetes client is loaded lazily and shared by concurrent resolutions"""
+        with patch('evaluator.agent_resolver._get_k8s_client', return_value=None) as mock_get_client:
+            resolver = AgentResolver()
+            mock_get_client.assert_not_called()
+            
+            results = await asyncio.gather(*[
+                resolver.resolve_agent_instructions("math-agent") for _ in range(3)
+            ])
+        
+        assert results == [None, None, None]
+        mock_get_client.assert_called_once()
+    
+    @pytest.mark.asyncio
+    async def test_failed_client_initialization_retried(self, mock_custom_api):
+        """Test a failed client initialization is not replayed to later resolutions"""
+        resolver = AgentResolver()
+        with patch('evaluator.agent_resolver._get_k8s_client', side_effect=RuntimeError("no config")):
+            with pytest.raises(RuntimeError):
+                await resolver.resolve_agent_instructions("math-agent")
+        
+        instructions = await resolver.resolve_agent_instructions("math-agent")
+        
+        assert instructions.name == "math-agent"
+    
+    def test_client_initialized_per_event_loop(self, mock_custom_api):
+        """Test a shared resolver initializes its client on each event loop it is used from"""
+        resolver = AgentResolver()
+        
+        async def resolve():
+            instructions = await resolver.resolve_agent_instructions("math-agent")
+            return instructions, resolver._client_inits[asyncio.get_running_loop()].done()
+        
+        first, first_on_loop = asyncio.run(resolve())
+        agent_resolver._agent_instructions_cache.clear()
+        second, second_on_loop = asyncio.run(resolve())
+        
+        assert first == second
+        assert first_on_loop and second_on_loop
+        assert mock_custom_api.get_namespaced_custom_object.call_count == 2
+    
+    def test_concurrent_resolutions_on_separate_event_loops(self, mock_custom_api):
+        """Test resolutions of the same agent running on two event loops at once do not share a future"""
+        agent_crd = mock_custom_api.get_namespaced_custom_object.return_value
+        both_in_flight = threading.Barrier(2, timeout=5)
+        
+        def get_agent(**kwargs):
+            both_in_flight.wait()
+            return agent_crd
+        mock_custom_api.get_namespaced_custom_object.side_effect = get_agent
+        resolver = AgentResolver()
+        results = []
+        
+        def resolve():
+            results.append(asyncio.run(resolver.resolve_agent_instructions("math-agent")))
+        
+        threads = [threading.Thread(target=resolve) for _ in range(2)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        assert len(results) == 2
+        assert all(result is not None and result.name == "math-agent" for result in results)
+        assert agent_resolver._inflight_resolutions == {}
+    
+    def test_client_initialized_once_per_concurrent_event_loop(self, mock_custom_api):
+        """Test two event loops using the resolver at once each keep their own client initialization"""
+        agent_crd = mock_custom_api.get_namespaced_custom_object.return_value
+        both_in_flight = threading.Barrier(2, timeout=5)
+        
+        def get_agent(**kwargs):
+            both_in_flight.wait()
+            return agent_crd
+        mock_custom_api.get_namespaced_custom_object.side_effect = get_agent
+        resolver = AgentResolver()
+        
+        async def resolve_twice(agent_name):
+            await resolver.resolve_agent_instructions(f"{agent_name}-1")
+            await resolver.resolve_agent_instructions(f"{agent_name}-2")
+        
+        with patch('evaluator.agent_resolver._get_k8s_client', return_value=Mock()) as mock_get_client:
+            threads = [threading.Thread(target=asyncio.run, args=(resolve_twice(name),)) for name in ("math", "code")]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        
+        assert mock_custom_api.get_namespaced_custom_object.call_count == 4
+        assert mock_get_client.call_count == 2
+    
+    def test_agent_instructions_immutable(self):
+        """Test cached agent instructions cannot be modified by a consumer"""
+        instructions = AgentInstructions(name="math-agent", description="", system_prompt="")
+        
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            instructions.system_prompt = "changed"
+        assert not hasattr(instructions, "__dict__")
@@ -1,6 +1,13 @@
+import threading
+import time
 import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from src.evaluator import agent_resolver as agent_resolver_module
+from src.evaluator import evaluator as evaluator_module
+from src.evaluator.agent_resolver import AgentResolver
 from src.evaluator.evaluator import LLMEvaluator
-from src.evaluator.types import EvaluationParameters
+from src.evaluator.model_resolver import ModelResolver
+from src.evaluator.types import EvaluationParameters, EvaluationRequest, QueryTarget, Response, TokenUsage
 
 
 class TestEvaluatorScoreParsing:
@@ -132,6 +139,54 @@ CRITERIA_SCORES: accuracy=0.8, completeness=0.9, usefulness=0.7, compliance=0.8"
         assert metadata.get('score_adjusted') == 'true'
         assert metadata.get('original_score') == '0.5'
 
+    def test_parse_evaluation_result_ignores_surrounding_text(self):
+        """Test fields are found on indented lines between free-form text"""
+        result = """Here is my evaluation.
+
+  SCORE: 0.75  
+  PASSED: TRUE
+The answer mentions SCORE: 0.1 inline, which is not a field.
+REASONING:   Clear and correct: well structured   
+CRITERIA_SCORES: accuracy=0.8, completeness=0.7
+"""
+
+        score, passed, metadata = self.evaluator._parse_evaluation_result(result, self.params)
+
+        assert score == "0.75"
+        assert passed is True
+        assert metadata['reasoning'] == 'Clear and correct: well structured'
+        assert metadata['criteria_scores'] == 'accuracy=0.8, completeness=0.7'
+
+    def test_parse_evaluation_result_last_block_wins(self):
+        """Test fields restated after a complete block override it"""
+        result = """SCORE: 0.9
+PASSED: true
+REASONING: Accurate answer
+CRITERIA_SCORES: accuracy=0.9
+
+On reflection the answer misses a step, so the corrected evaluation is:
+SCORE: 0.4
+PASSED: false
+CRITERIA_SCORES: accuracy=0.4
+"""
+
+        score, passed, metadata = self.evaluator._parse_evaluation_result(result, self.params)
+
+        assert score == "0.40"
+        assert passed is False
+        assert metadata['reasoning'] == 'Accurate answer'
+        assert metadata['criteria_scores'] == 'accuracy=0.4'
+
+    @pytest.mark.parametrize("score_text", ["N/A", "0.8/1", "high", ""])
+    def test_parse_evaluation_result_malformed_score(self, score_text):
+        """Test a SCORE value that is not a plain number falls back to zero"""
+        result = f"SCORE: {score_text}\nPASSED: true\nREASONING: Unclear"
+
+        score, passed, metadata = self.evaluator._parse_evaluation_result(result, self.params)
+
+        assert score == "0.0"
+        assert metadata['reasoning'] == 'Unclear'
+
     def test_calculate_criteria_average_valid(self):
         """Test calculating average from criteria string"""
         criteria_str = "accuracy=0.8, completeness=0.9, usefulness=0.7, compliance=0.6"
@@ -154,6 +209,14 @@ CRITERIA_SCORES: accuracy=0.8, completeness=0.9, usefulness=0.7, compliance=0.8"
 
         assert avg is None
 
+    def test_calculate_criteria_average_skips_non_numeric(self):
+        """Test non-numeric scores are skipped like in individual score parsing"""
+        criteria_str = "accuracy=high, completeness=0.9, usefulness=0.7"
+
+        avg = self.evaluator._calculate_criteria_average(criteria_str)
+
+        assert avg == 0.8
+
     def test_calculate_criteria_average_out_of_range(self):
         """Test scores outside 0-1 range are excluded from average"""
         criteria_str = "accuracy=1.5, completeness=0.9, usefulness=0.7"
@@ -162,6 +225,19 @@ CRITERIA_SCORES: accuracy=0.8, completeness=0.9, usefulness=0.7, compliance=0.8"
 
         assert avg == 0.8
 
+    def test_repeated_criteria_scores_parsed_once(self):
+        """Test identical CRITERIA_SCORES strings reuse the parsed scores across evaluators"""
+        criteria_str = "accuracy=0.6, clarity=0.8"
+        metadata = {}
+        evaluator_module._parse_criteria_scores.cache_clear()
+
+        self.evaluator._parse_individual_criteria_scores(criteria_str, metadata)
+        avg = LLMEvaluator()._calculate_criteria_average(criteria_str)
+
+        assert metadata == {'accuracy': '0.6', 'clarity': '0.8'}
+        assert avg == pytest.approx(0.7)
+        assert evaluator_module._parse_criteria_scores.cache_info().misses == 1
+
     def test_parse_evaluation_result_all_ones(self):
         """Test the specific case from the bug: all 1.0 scores with SCORE:0"""
         result = """SCORE: 0
@@ -181,5 +257,81 @@ CRITERIA_SCORES: accuracy=1.0, completeness=1.0, usefulness=1.0, compliance=1.0"
         assert metadata.get('original_score') == '0.0'
 
 
+class TestEvaluatorResolution:
+    """Test suite for model and agent resolution in evaluate"""
+
+    @pytest.mark.parametrize("scope, expected", [
+        ("accuracy,relevance", False),
+        ("accuracy,Compliance", True),
+        ("refusal_handling", True),
+        ("", False),
+        (None, False),
+    ])
+    def test_requires_agent_instructions(self, scope, expected):
+        """Test agent instructions are required only for agent-aware criteria"""
+        params = EvaluationParameters(scope=scope)
+
+        assert LLMEvaluator()._requires_agent_instructions(params) is expected
+
+    @pytest.mark.asyncio
+    async def test_model_and_agent_resolution_run_concurrently(self):
+        """Test the blocking model and agent CRD reads overlap instead of running one after the other"""
+        active = 0
+        max_active = 0
+        lock = threading.Lock()
+
+        def blocking_read(resource):
+            def read(**kwargs):
+                nonlocal active, max_active
+                with lock:
+                    active += 1
+                    max_active = max(max_active, active)
+                time.sleep(0.2)
+                with lock:
+                    active -= 1
+                return resource
+            return read
+
+        model_crd = {
+            "metadata": {"namespace": "default"},
+            "spec": {"type": "openai", "model": {"value": "gpt-4"}, "config": {"openai": {"apiKey": {"value": "key"}}}},
+        }
+        agent_crd = {"metadata": {"name": "overlap-agent"}, "spec": {"description": "Math", "prompt": "p"}}
+
+        model_resolver = ModelResolver()
+        model_resolver.k8s_client = Mock()
+        agent_resolver = AgentResolver()
+        agent_resolver._ensure_client = AsyncMock()
+        agent_resolver.k8s_client = Mock()
+        agent_resolver.custom_api = Mock(get_namespaced_custom_object=blocking_read(agent_crd))
+        agent_resolver_module._agent_instructions_cache.clear()
+
+        evaluator = LLMEvaluator()
+        evaluator.model_resolver = model_resolver
+        evaluator.agent_resolver = agent_resolver
+        evaluator.llm_client.evaluate = AsyncMock(return_value=("SCORE: 0.9\nPASSED: true", TokenUsage()))
+
+        request = EvaluationRequest(
+            queryId="test-query",
+            input="What is 2+2?",
+            responses=[Response(target=QueryTarget(type="agent", name="overlap-agent"), content="4")],
+            query={}
+        )
+        model_api = Mock(get_namespaced_custom_object=blocking_read(model_crd))
+        with patch('src.evaluator.model_resolver.client.CustomObjectsApi', return_value=model_api):
+            response = await evaluator.evaluate(request, EvaluationParameters(scope="accuracy,compliance"))
+
+        assert response.error is None
+        assert response.score == "0.90"
+        assert max_active == 2
+
+    def test_evaluators_share_resolvers(self):
+        """Test resolvers are created once and shared by every evaluator"""
+        first, second = LLMEvaluator(), LLMEvaluator()
+
+        assert first.model_resolver is second.model_resolver
+        assert first.agent_resolver is second.agent_resolver
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,325 @@
+"""Test suite for MetricEvaluator"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from evaluator.metrics import evaluator as metric_evaluator
+from evaluator.metrics.evaluator import MetricEvaluator
+from evaluator.metrics.metric_types import DirectRequest
+from evaluator.types import MetricEvaluationRequest, MetricEvaluationResponse, QueryRef
+
+
+class TestMetricEvaluatorBatch:
+    """Test batch metric evaluation"""
+
+    def setup_method(self):
+        with patch('evaluator.metrics.evaluator._get_shared_ark_client'):
+            self.evaluator = MetricEvaluator({})
+
+    @pytest.mark.asyncio
+    async def test_batch_preserves_request_order(self):
+        """Test responses are returned in request order even when queries finish out of order"""
+        async def evaluate_query_metrics(query_ref):
+            await asyncio.sleep(0.01 if query_ref.name == "first" else 0)
+            return MetricEvaluationResponse(score="0.50", passed=False, metadata={"query": query_ref.name})
+        self.evaluator.evaluate_query_metrics = evaluate_query_metrics
+
+        query_refs = [QueryRef(name=name, namespace="default") for name in ("first", "second")]
+        responses = await self.evaluator.evaluate_metrics_batch(query_refs)
+
+        assert [response.metadata["query"] for response in responses] == ["first", "second"]
+
+    @pytest.mark.asyncio
+    async def test_batch_bounded_by_max_concurrency(self):
+        """Test no more than max_concurrency queries are evaluated at once"""
+        in_flight = 0
+        peak = 0
+
+        async def evaluate_query_metrics(query_ref):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return MetricEvaluationResponse(score="1.00", passed=True)
+        self.evaluator.evaluate_query_metrics = evaluate_query_metrics
+
+        query_refs = [QueryRef(name=f"query-{i}", namespace="default") for i in range(10)]
+        responses = await self.evaluator.evaluate_metrics_batch(query_refs, max_concurrency=3)
+
+        assert len(responses) == 10
+        assert peak == 3
+
+
+class TestMetricEvaluatorDirect:
+    """Test direct metric evaluation from input and output text"""
+
+    def setup_method(self):
+        with patch('evaluator.metrics.evaluator._get_shared_ark_client'):
+            self.evaluator = MetricEvaluator({})
+
+    @pytest.mark.asyncio
+    async def test_direct_evaluation_skips_annotation_pricing(self):
+        """Test synthetic metrics are priced without looking up Model annotations"""
+        with patch.object(self.evaluator.metrics_calculator, '_get_model_pricing_from_annotations') as lookup:
+            response = await self.evaluator.evaluate_direct(
+                DirectRequest(input="What is 2+2? " * 20, output="2+2 equals 4. " * 20)
+            )
+
+        assert response.error is None
+        assert float(response.metadata["cost"]) > 0
+        lookup.assert_not_called()
+
+    def test_synthetic_metrics_do_not_share_state(self):
+        """Test synthetic metrics are independent copies of the shared template"""
+        first = self.evaluator._create_synthetic_metrics_from_direct(DirectRequest(input="a" * 40, output="b" * 80))
+        first["threshold_violations"] = ["maxTokens"]
+        second = self.evaluator._create_synthetic_metrics_from_direct(DirectRequest(input="", output=""))
+
+        assert (first["promptTokens"], first["completionTokens"], first["totalTokens"]) == (10, 20, 30)
+        assert first["tokenEfficiency"] == 2.0
+        assert second["totalTokens"] == 0
+        assert "threshold_violations" not in second
+        assert second["queryPhase"] == "direct-evaluation"
+        assert "skipCostLookup" not in second
+
+
+class TestMetricEvaluatorMetadata:
+    """Test metadata built from calculated metrics"""
+
+    def setup_method(self):
+        with patch('evaluator.metrics.evaluator._get_shared_ark_client'):
+            self.evaluator = MetricEvaluator({})
+
+    @pytest.mark.parametrize("overall_score, expected", [
+        (0.95, "excellent scores"),
+        (0.8, "excellent scores"),
+        (0.7, "good scores"),
+        (0.2, "could be improved"),
+        (-0.1, "could be improved"),
+    ])
+    def test_unified_reasoning_by_score(self, overall_score, expected):
+        """Test reasoning reflects the overall score bucket"""
+        metadata = self.evaluator._build_unified_metadata({}, overall_score)
+
+        assert metadata["reasoning"].endswith(expected)
+
+    def test_unified_metadata_formats_scores(self):
+        """Test individual scores are included with two decimals and violations are reported"""
+        metrics = {
+            "totalTokens": 120,
+            "totalCost": 0.0042,
+            "tokenScore": 0.876,
+            "performanceScore": 1,
+            "threshold_violations": ["maxDuration"],
+        }
+
+        metadata = self.evaluator._build_unified_metadata(metrics, 0.9)
+
+        assert metadata["reasoning"].endswith("threshold violations: maxDuration")
+        assert metadata["token_score"] == "0.88"
+        assert metadata["performance_score"] == "1.00"
+        assert "cost_score" not in metadata
+        assert metadata["total_tokens"] == "120"
+        assert metadata["cost"] == "0.0042"
+
+
+class TestMetricEvaluatorPassStatus:
+    """Test pass/fail decisions from score and threshold violations"""
+
+    def setup_method(self):
+        with patch('evaluator.metrics.evaluator._get_shared_ark_client'):
+            self.evaluator = MetricEvaluator({"minScore": "0.6"})
+
+    @pytest.mark.parametrize("overall_score, violations, expected", [
+        (0.9, [], True),
+        (0.5, [], False),
+        (0.9, ["tokenEfficiency"], True),
+        (0.9, ["costEfficiency", "maxDuration"], False),
+        (0.9, ["maxTokens"], False),
+    ])
+    def test_determine_pass_status(self, overall_score, violations, expected):
+        """Test only critical violations or a low score fail the evaluation"""
+        metrics = {"threshold_violations": violations}
+
+        assert self.evaluator._determine_pass_status(overall_score, metrics) is expected
+
+
+class TestQueryRefParsing:
+    """Test parsing query IDs into query references"""
+
+    def setup_method(self):
+        with patch('evaluator.metrics.evaluator._get_shared_ark_client'):
+            self.evaluator = MetricEvaluator({})
+
+    @pytest.mark.parametrize("query_id, namespace, name", [
+        ("my-query", "default", "my-query"),
+        ("team-a/my-query", "team-a", "my-query"),
+        ("team-a/nested/query", "team-a", "nested/query"),
+    ])
+    def test_parse_query_ref_string(self, query_id, namespace, name):
+        """Test namespace-qualified and bare query IDs"""
+        query_ref = self.evaluator._parse_query_ref_string(query_id)
+
+        assert (query_ref.namespace, query_ref.name) == (namespace, name)
+
+
+class TestQueryMetricsCache:
+    """Test loaded query metrics are shared between evaluations of the same query"""
+
+    @pytest.fixture(autouse=True)
+    def clear_query_metrics_cache(self):
+        """Start every test with an empty query metrics cache"""
+        metric_evaluator._query_metrics_cache.clear()
+        yield
+        metric_evaluator._query_metrics_cache.clear()
+
+    def setup_method(self):
+        with patch('evaluator.metrics.evaluator._get_shared_ark_client'):
+            self.evaluator = MetricEvaluator({})
+        self.evaluator.ark_client.load_query = AsyncMock(return_value={"metadata": {"name": "my-query"}})
+        self.evaluator.ark_client.extract_metrics = AsyncMock(
+            side_effect=lambda query_config: {"totalTokens": 100, "threshold_violations": []}
+        )
+
+    @pytest.mark.asyncio
+    async def test_repeat_evaluation_served_from_cache(self):
+        """Test re-evaluating a query within the TTL does not reload it"""
+        first = await self.evaluator.evaluate_metrics(MetricEvaluationRequest(queryId="team-a/my-query", input="", output=""))
+        second = await self.evaluator.evaluate_metrics(MetricEvaluationRequest(queryId="team-a/my-query", input="", output=""))
+
+        assert first.score == second.score
+        assert second.metrics["threshold_violations"] == first.metrics["threshold_violations"]
+        self.evaluator.ark_client.load_query.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_coalesced(self):
+        """Test concurrent evaluations of the same query share one load"""
+        async def load_query(query_ref):
+            await asyncio.sleep(0.01)
+            return {"metadata": {"name": query_ref.name}}
+        self.evaluator.ark_client.load_query = AsyncMock(side_effect=load_query)
+
+        results = await asyncio.gather(*(
+            self.evaluator._load_query_metrics(QueryRef(name="my-query", namespace="default")) for _ in range(5)
+        ))
+
+        assert self.evaluator.ark_client.load_query.await_count == 1
+        assert all(result == results[0] for result in results)
+        assert len({id(result) for result in results}) == 5
+
+    @pytest.mark.asyncio
+    async def test_cached_metrics_not_mutated_by_scoring(self):
+        """Test scoring results added to a returned copy do not leak into the cache"""
+        metrics = await self.evaluator._load_query_metrics(QueryRef(name="my-query", namespace="default"))
+        metrics["threshold_violations"].append("maxTokens")
+
+        cached = await self.evaluator._load_query_metrics(QueryRef(name="my-query", namespace="default"))
+
+        assert cached["threshold_violations"] == []
+
+    @pytest.mark.asyncio
+    async def test_expired_entry_reloaded(self):
+        """Test metrics are reloaded once the cached entry expires"""
+        query_ref = QueryRef(name="my-query", namespace="default")
+        await self.evaluator._load_query_metrics(query_ref)
+
+        with patch('evaluator.metrics.evaluator.time.monotonic', return_value=float("inf")):
+            await self.evaluator._load_query_metrics(query_ref)
+
+        assert self.evaluator.ark_client.load_query.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_load_not_cached(self):
+        """Test a failed load is reported to every waiter and retried next time"""
+        async def load_query(query_ref):
+            await asyncio.sleep(0.01)
+            raise RuntimeError("not found")
+        self.evaluator.ark_client.load_query = AsyncMock(side_effect=load_query)
+        query_ref = QueryRef(name="my-query", namespace="default")
+
+        results = await asyncio.gather(
+            self.evaluator._load_query_metrics(query_ref),
+            self.evaluator._load_query_metrics(query_ref),
+            return_exceptions=True,
+        )
+        with pytest.raises(RuntimeError):
+            await self.evaluator._load_query_metrics(query_ref)
+
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert self.evaluator.ark_client.load_query.await_count == 2
+        assert metric_evaluator._query_metrics_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_cancelled_load_reported_as_error_to_waiters(self):
+        """Test cancelling the loading evaluation gives waiting evaluations an error response"""
+        loading = asyncio.Event()
+        async def load_query(query_ref):
+            loading.set()
+            await asyncio.sleep(10)
+        self.evaluator.ark_client.load_query = AsyncMock(side_effect=load_query)
+        request = MetricEvaluationRequest(queryId="team-a/my-query", input="", output="")
+
+        leader = asyncio.create_task(self.evaluator.evaluate_metrics(request))
+        await loading.wait()
+        waiter = asyncio.create_task(self.evaluator.evaluate_metrics(request))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        response = await waiter
+        assert response.passed is False
+        assert "cancelled" in response.error
+        assert metric_evaluator._inflight_query_loads == {}
+
+    @pytest.mark.asyncio
+    async def test_missing_namespace_shares_default_entry(self):
+        """Test a query ref without a namespace is loaded and cached as the default namespace"""
+        await self.evaluator._load_query_metrics(QueryRef(name="my-query"))
+        await self.evaluator._load_query_metrics(QueryRef(name="my-query", namespace="default"))
+
+        self.evaluator.ark_client.load_query.assert_awaited_once()
+        assert self.evaluator.ark_client.load_query.await_args.args[0].namespace == "default"
+
+
+class TestSharedDependencies:
+    """Test evaluators share the ARK client and calculators instead of building their own"""
+
+    def setup_method(self):
+        metric_evaluator._shared_ark_client = None
+
+    def teardown_method(self):
+        metric_evaluator._shared_ark_client = None
+
+    def test_ark_client_created_once(self):
+        """Test every evaluator reuses the first ARK client"""
+        with patch('evaluator.metrics.evaluator.ArkClient') as ark_client_class:
+            evaluators = [MetricEvaluator({}), MetricEvaluator({"minScore": "0.5"})]
+
+        ark_client_class.assert_called_once()
+        assert evaluators[0].ark_client is evaluators[1].ark_client
+
+    def test_ark_client_retried_after_failure(self):
+        """Test a failed client creation is not remembered"""
+        with patch('evaluator.metrics.evaluator.ArkClient', side_effect=[RuntimeError("no kubeconfig"), "client"]):
+            with pytest.raises(RuntimeError):
+                MetricEvaluator({})
+
+            assert MetricEvaluator({}).ark_client == "client"
+
+    def test_calculator_shared_by_parameters(self):
+        """Test evaluators with equal parameters share a calculator"""
+        with patch('evaluator.metrics.evaluator.ArkClient'):
+            first = MetricEvaluator({"maxTokens": "1000", "minScore": "0.5"})
+            second = MetricEvaluator({"minScore": "0.5", "maxTokens": "1000"})
+            other = MetricEvaluator({"maxTokens": "2000"})
+
+        assert first.metrics_calculator is second.metrics_calculator
+        assert first.metrics_calculator is not other.metrics_calculator
+
+    def test_unhashable_parameters_get_own_calculator(self):
+        """Test parameters that cannot be cached still build a calculator"""
+        with patch('evaluator.metrics.evaluator.ArkClient'):
+            evaluator = MetricEvaluator({"tags": ["a", "b"]})
+
+        assert evaluator.metrics_calculator.parameters == {"tags": ["a", "b"]}
@@ -5,7 +5,8 @@ from unittest.mock import Mock, patch, AsyncMock
 from fastapi.testclient import TestClient
 
 from evaluator.app import create_app
-from evaluator.metrics.metric_types import DirectRequest, QueryRefRequest
+from evaluator.metrics.metric_types import DirectRequest, QueryRefRequest, MAX_BATCH_QUERIES
+from evaluator.types import MetricEvaluationResponse
 
 
 class TestUnifiedEndpoints:
@@ -149,6 +150,54 @@ class TestUnifiedEndpoints:
         assert response.status_code == 501
         assert "not yet implemented" in response.json()["detail"].lower()
     
+    def test_evaluate_metrics_batch_endpoint(self, client):
+        """Test /evaluate-metrics/batch scores every query with the shared parameters"""
+        mock_evaluator = Mock()
+        mock_evaluator.evaluate_metrics_batch = AsyncMock(return_value=[
+            MetricEvaluationResponse(score="0.90", passed=True),
+            MetricEvaluationResponse(score="0.0", passed=False, error="Query not found"),
+        ])
+
+        request_data = {
+            "queryRefs": [
+                {"name": "query-a", "namespace": "default"},
+                {"name": "query-b", "namespace": "default"},
+            ],
+            "parameters": {"maxTokens": "1000"}
+        }
+
+        with patch('evaluator.metrics.app.MetricEvaluator') as mock_evaluator_class:
+            mock_evaluator_class.return_value = mock_evaluator
+            response = client.post("/evaluate-metrics/batch", json=request_data)
+
+        assert response.status_code == 200
+        result = response.json()
+        assert [item["score"] for item in result] == ["0.90", "0.0"]
+        assert result[1]["error"] == "Query not found"
+        mock_evaluator_class.assert_called_once_with({"maxTokens": "1000"})
+        batch = mock_evaluator.evaluate_metrics_batch.call_args[0][0]
+        assert [query_ref.name for query_ref in batch] == ["query-a", "query-b"]
+
+    def test_evaluate_metrics_batch_rejects_oversized_batch(self, client, mock_evaluator):
+        """Test /evaluate-metrics/batch rejects more queries than MAX_BATCH_QUERIES"""
+        request_data = {
+            "queryRefs": [{"name": f"query-{i}"} for i in range(MAX_BATCH_QUERIES + 1)]
+        }
+
+        response = client.post("/evaluate-metrics/batch", json=request_data)
+
+        assert response.status_code == 422
+        mock_evaluator.evaluate_metrics_batch.assert_not_called()
+
+    def test_evaluate_metrics_batch_error_handling(self, client, mock_evaluator):
+        """Test /evaluate-metrics/batch reports unexpected failures as a server error"""
+        mock_evaluator.evaluate_metrics_batch = AsyncMock(side_effect=RuntimeError("evaluator unavailable"))
+
+        response = client.post("/evaluate-metrics/batch", json={"queryRefs": [{"name": "query-a"}]})
+
+        assert response.status_code == 500
+        assert response.json()["detail"] == "evaluator unavailable"
+    
     def test_evaluate_endpoint_with_invalid_type(self, client):
         """Test /evaluate endpoint with invalid type"""
         request_data = {
@@ -0,0 +1,299 @@
+"""Test suite for MetricsCalculator"""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+from kubernetes import client
+
+from evaluator.metrics import metrics
+from evaluator.metrics.metrics import MetricsCalculator, PricingAnnotations
+
+
+def model_resource(input_cost="3", output_cost="15", unit="per-million-tokens"):
+    """Build a Model CRD carrying pricing annotations"""
+    return {
+        "metadata": {
+            "name": "priced-model",
+            "annotations": {
+                PricingAnnotations.INPUT_COST: input_cost,
+                PricingAnnotations.OUTPUT_COST: output_cost,
+                PricingAnnotations.UNIT: unit,
+            }
+        }
+    }
+
+
+class TestModelPricingLookup:
+    """Test model pricing resolution from Model annotations"""
+
+    @pytest.fixture(autouse=True)
+    def clear_pricing_cache(self):
+        """Start every test with an empty pricing cache"""
+        metrics._model_pricing_cache.clear()
+        yield
+        metrics._model_pricing_cache.clear()
+
+    def setup_method(self):
+        self.calculator = MetricsCalculator({})
+        self.custom_api = Mock()
+        self.calculator._custom_api = self.custom_api
+
+    @pytest.mark.parametrize("unit, expected", [
+        ("per-million-tokens", {"input": 0.003, "output": 0.015}),
+        ("per-thousand-tokens", {"input": 3.0, "output": 15.0}),
+        ("per-hundred-tokens", {"input": 30.0, "output": 150.0}),
+    ])
+    @pytest.mark.asyncio
+    async def test_annotation_pricing_converted_to_per_thousand(self, unit, expected):
+        """Test annotation pricing is normalized to cost per 1k tokens"""
+        self.custom_api.get_namespaced_custom_object.return_value = model_resource(unit=unit)
+
+        pricing = await self.calculator._get_model_pricing_from_annotations("priced-model")
+
+        assert pricing == pytest.approx(expected)
+
+    @pytest.mark.asyncio
+    async def test_annotation_pricing_cached_across_calculators(self):
+        """Test repeated lookups for the same model are served from the cache"""
+        self.custom_api.get_namespaced_custom_object.return_value = model_resource()
+
+        first = await self.calculator._get_model_pricing_from_annotations("priced-model")
+        other = MetricsCalculator({})
+        other._custom_api = Mock()
+        second = await other._get_model_pricing_from_annotations("priced-model")
+
+        assert first == second
+        assert self.custom_api.get_namespaced_custom_object.call_count == 2
+        other._custom_api.get_namespaced_custom_object.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_missing_model_cached_as_negative_lookup(self):
+        """Test a model absent from every namespace is not looked up again"""
+        self.custom_api.get_namespaced_custom_object.side_effect = client.exceptions.ApiException(status=404)
+
+        assert await self.calculator._get_model_pricing_from_annotations("gpt-4") is None
+        assert await self.calculator._get_model_pricing_from_annotations("gpt-4") is None
+        assert self.custom_api.get_namespaced_custom_object.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_api_errors_not_cached(self):
+        """Test lookups failing for reasons other than not found are retried"""
+        self.custom_api.get_namespaced_custom_object.side_effect = client.exceptions.ApiException(status=500)
+
+        await self.calculator._get_model_pricing_from_annotations("gpt-4")
+        await self.calculator._get_model_pricing_from_annotations("gpt-4")
+
+        assert self.custom_api.get_namespaced_custom_object.call_count == 4
+        assert metrics._model_pricing_cache == {}
+
+    @pytest.mark.asyncio
+    async def test_default_namespace_preferred(self):
+        """Test pricing from the default namespace wins over ark-system"""
+        def get_model(namespace, **kwargs):
+            return model_resource(input_cost="1" if namespace == "default" else "2")
+        self.custom_api.get_namespaced_custom_object.side_effect = get_model
+
+        pricing = await self.calculator._get_model_pricing_from_annotations("priced-model")
+
+        assert pricing["input"] == pytest.approx(0.001)
+
+    @pytest.mark.asyncio
+    async def test_overall_score_uses_annotation_pricing(self):
+        """Test the cost score is computed from awaited annotation pricing"""
+        self.custom_api.get_namespaced_custom_object.return_value = model_resource()
+        query_metrics = {"totalTokens": 2000, "promptTokens": 1000, "completionTokens": 1000, "modelName": "priced-model"}
+
+        score = await self.calculator.calculate_overall_score(query_metrics)
+
+        assert query_metrics["totalCost"] == pytest.approx(0.018)
+        assert 0.0 < score <= 1.0
+
+
+class TestDefaultModelPricing:
+    """Test the fallback pricing table used when a model has no annotations"""
+
+    @pytest.mark.parametrize("model_name, expected_model", [
+        ("gpt-4", "gpt-4"),
+        (" GPT-3.5-Turbo ", "gpt-3.5-turbo"),
+        ("gpt-4-turbo", "gpt-4-turbo"),
+        ("claude-3-haiku-20240307", "claude-3-haiku"),
+        ("unknown-model", "gpt-4"),
+    ])
+    @pytest.mark.asyncio
+    async def test_fallback_pricing_match(self, model_name, expected_model):
+        """Test exact, partial and unknown model names resolve to the expected default pricing"""
+        calculator = MetricsCalculator({})
+        calculator._get_model_pricing_from_annotations = AsyncMock(return_value=None)
+
+        pricing = await calculator._get_model_pricing(model_name)
+
+        assert pricing == calculator.model_pricing[expected_model]
+
+
+class TestKubernetesClientReuse:
+    """Test pricing lookups reuse the process-wide Kubernetes API client"""
+
+    @pytest.mark.asyncio
+    async def test_calculators_share_api_client(self):
+        """Test every calculator builds its Custom Objects API on the cached ApiClient"""
+        api_client = Mock()
+        with patch('evaluator.metrics.metrics._get_k8s_client', return_value=api_client):
+            calculators = [MetricsCalculator({}), MetricsCalculator({})]
+            for calculator in calculators:
+                assert await calculator._ensure_custom_api() is True
+
+        assert all(calculator._custom_api.api_client is api_client for calculator in calculators)
+
+    @pytest.mark.asyncio
+    async def test_no_lookup_without_kubernetes(self):
+        """Test annotation pricing is skipped when no Kubernetes configuration is available"""
+        with patch('evaluator.metrics.metrics._get_k8s_client', return_value=None):
+            calculator = MetricsCalculator({})
+
+            assert await calculator._get_model_pricing_from_annotations("gpt-4") is None
+            assert calculator._custom_api is None
+
+
+class TestQueryCost:
+    """Test query cost calculation"""
+
+    def setup_method(self):
+        self.calculator = MetricsCalculator({})
+        self.calculator._get_model_pricing_from_annotations = AsyncMock(return_value=None)
+
+    @pytest.mark.asyncio
+    async def test_zero_tokens_skips_pricing(self):
+        """Test no pricing lookup happens when no tokens were used"""
+        query_metrics = {"totalTokens": 0}
+
+        await self.calculator._calculate_query_cost(query_metrics)
+
+        assert query_metrics["totalCost"] == 0.0
+        self.calculator._get_model_pricing_from_annotations.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cost_without_annotations_uses_default_pricing(self):
+        """Test costs calculated without pricing annotations use the default table and no Kubernetes lookup"""
+        query_metrics = {"totalTokens": 2000, "promptTokens": 1000, "completionTokens": 1000}
+
+        await self.calculator._calculate_query_cost(query_metrics, use_pricing_annotations=False)
+
+        assert query_metrics["totalCost"] == pytest.approx(0.09)
+        self.calculator._get_model_pricing_from_annotations.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_cost_breakdown(self):
+        """Test input, output, per-token cost and cost efficiency are recorded"""
+        self.calculator._get_model_pricing_from_annotations.return_value = {"input": 0.01, "output": 0.02}
+        query_metrics = {"totalTokens": 3000, "promptTokens": 2000, "completionTokens": 1000, "totalResponseLength": 400}
+
+        await self.calculator._calculate_query_cost(query_metrics)
+
+        assert query_metrics["inputCost"] == pytest.approx(0.02)
+        assert query_metrics["outputCost"] == pytest.approx(0.02)
+        assert query_metrics["totalCost"] == pytest.approx(0.04)
+        assert query_metrics["costPerToken"] == pytest.approx(0.000013)
+        assert query_metrics["costEfficiency"] == pytest.approx(10000)
+
+
+class TestDurationParsing:
+    """Test threshold duration parsing"""
+
+    @pytest.mark.parametrize("duration, expected", [
+        ("30s", 30.0),
+        (" 2M ", 120.0),
+        ("1h", 3600.0),
+        ("45", 45.0),
+        (12, 12.0),
+        (1.5, 1.5),
+        ("soon", 30.0),
+    ])
+    def test_parse_duration(self, duration, expected):
+        """Test durations with and without units parse to seconds"""
+        assert MetricsCalculator({})._parse_duration(duration) == expected
+
+
+class TestScoringParameters:
+    """Test weights and thresholds read from evaluator parameters"""
+
+    def test_threshold_converted_to_default_type(self):
+        """Test string parameters are converted like their defaults, falling back when invalid"""
+        calculator = MetricsCalculator({"maxTokens": "1000", "maxCostPerQuery": "0.05", "minTokensPerSecond": "fast"})
+
+        assert calculator._get_threshold("maxTokens", 5000) == 1000
+        assert calculator._get_threshold("maxCostPerQuery", 0.10) == 0.05
+        assert calculator._get_threshold("minTokensPerSecond", 10.0) == 10.0
+        assert calculator._get_threshold("maxDuration", "30s") == "30s"
+
+    def test_thresholds_and_weights_converted_once(self):
+        """Test repeated reads reuse the converted values"""
+        calculator = MetricsCalculator({"tokenWeight": "0.5"})
+
+        weights = calculator._get_score_weights()
+        calculator.parameters = {}
+
+        assert calculator._get_score_weights() is weights
+        assert weights["token"] == 0.5
+
+    @pytest.mark.asyncio
+    async def test_invalid_weight_scores_zero(self):
+        """Test an unparseable weight still fails the score calculation rather than construction"""
+        calculator = MetricsCalculator({"tokenWeight": "heavy"})
+
+        assert await calculator.calculate_overall_score({"totalTokens": 0}) == 0.0
+
+    def test_weighted_score_without_cost_lookup(self):
+        """Test metrics with a known cost are scored synchronously without a pricing lookup"""
+        calculator = MetricsCalculator({})
+        calculator._get_model_pricing = AsyncMock()
+
+        score = calculator.calculate_weighted_score({"totalTokens": 0, "totalCost": 0.0})
+
+        assert score == pytest.approx(1.0)
+        calculator._get_model_pricing.assert_not_called()
+
+
+class TestOverallScore:
+    """Test the weighted overall score and the threshold results it records"""
+
+    def setup_method(self):
+        self.calculator = MetricsCalculator({"maxTokens": "1000", "maxDuration": "10s"})
+        self.calculator._get_model_pricing_from_annotations = AsyncMock(return_value=None)
+
+    @pytest.mark.asyncio
+    async def test_threshold_results_recorded(self):
+        """Test violations and passed thresholds from every score are appended to the metrics"""
+        query_metrics = {
+            "totalTokens": 1500,
+            "promptTokens": 1000,
+            "completionTokens": 500,
+            "executionDurationSeconds": 2,
+            "threshold_violations": [],
+            "passed_thresholds": [],
+        }
+
+        await self.calculator.calculate_overall_score(query_metrics)
+
+        assert query_metrics["threshold_violations"] == ["maxTokens"]
+        assert query_metrics["passed_thresholds"] == ["maxCostPerQuery", "maxDuration"]
+        assert {"tokenScore", "costScore", "performanceScore"} <= query_metrics.keys()
+
+    @pytest.mark.asyncio
+    async def test_threshold_lists_created_when_missing(self):
+        """Test synthetic metrics without threshold lists get them"""
+        query_metrics = {"totalTokens": 0}
+
+        await self.calculator.calculate_overall_score(query_metrics)
+
+        assert query_metrics["threshold_violations"] == []
+        assert query_metrics["passed_thresholds"] == []
+
+    @pytest.mark.asyncio
+    async def test_rescoring_does_not_duplicate_threshold_results(self):
+        """Test scoring the same metrics twice records each threshold result once"""
+        query_metrics = {"totalTokens": 1500, "promptTokens": 1000, "completionTokens": 500}
+
+        await self.calculator.calculate_overall_score(query_metrics)
+        await self.calculator.calculate_overall_score(query_metrics)
+
+        assert query_metrics["threshold_violations"] == ["maxTokens"]
+        assert query_metrics["passed_thresholds"] == ["maxCostPerQuery"]
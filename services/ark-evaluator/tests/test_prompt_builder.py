@@ -5,52 +5,73 @@ Following TDD principles to ensure no regressions when refactoring prompt buildi
 """
 
 import unittest
-from unittest.mock import Mock
+from types import SimpleNamespace
 
 from src.evaluator.prompt_builder import (
     EvaluationPromptBuilder,
     build_evaluation_prompt,
     PromptSection
 )
-from src.evaluator.types import EvaluationRequest, EvaluationParameters
+from src.evaluator.types import EvaluationParameters, GoldenExample
 from src.evaluator.agent_resolver import AgentInstructions
 
 
+def added_sections(builder):
+    """Sections added to a builder, in prompt order"""
+    return [section for section in builder._sections if section is not None]
+
+
 class TestPromptSection(unittest.TestCase):
     """Test PromptSection dataclass"""
 
     def test_render_with_title(self):
-        section = PromptSection(title="TEST:", content="test content", order=1)
+        section = PromptSection(title="TEST:", content="test content")
         result = section.render()
         self.assertIn("TEST:", result)
         self.assertIn("test content", result)
 
     def test_render_without_title(self):
-        section = PromptSection(title="", content="test content", order=1)
+        section = PromptSection(title="", content="test content")
         result = section.render()
         self.assertEqual("test content", result)
 
     def test_render_empty_content(self):
-        section = PromptSection(title="TEST:", content="", order=1)
+        section = PromptSection(title="TEST:", content="")
         result = section.render()
         self.assertEqual("", result)
 
+    def test_section_is_immutable_without_instance_dict(self):
+        section = PromptSection(title="TEST:", content="test content")
+        self.assertFalse(hasattr(section, "__dict__"))
+        with self.assertRaises(AttributeError):
+            section.content = "changed"
+
+    def test_rendered_once_at_construction(self):
+        section = PromptSection(title="TEST:", content="test content")
+        blank = PromptSection(title="TEST:", content="   \n")
+        self.assertEqual("TEST:\ntest content\n", section.rendered)
+        self.assertIs(section.rendered, section.render())
+        self.assertEqual("", blank.rendered)
+        self.assertEqual(section, PromptSection(title="TEST:", content="test content"))
+
 
 class TestEvaluationPromptBuilder(unittest.TestCase):
     """Test EvaluationPromptBuilder class"""
 
     def setUp(self):
         self.builder = EvaluationPromptBuilder()
-        self.mock_request = Mock(spec=EvaluationRequest)
-        self.mock_request.input = "Test query"
-        self.mock_request.responses = [
-            Mock(target=Mock(type="agent", name="test-agent"), content="Test response")
-        ]
-        self.mock_params = Mock(spec=EvaluationParameters)
-        self.mock_params.evaluator_role = "Test evaluator"
-        self.mock_params.min_score = 0.7
-        self.mock_params.context = None
-        self.mock_params.get_scope_list = Mock(return_value=["accuracy", "relevance"])
+        self.mock_request = SimpleNamespace(
+            input="Test query",
+            responses=[
+                SimpleNamespace(target=SimpleNamespace(type="agent", name="test-agent"), content="Test response")
+            ]
+        )
+        self.mock_params = SimpleNamespace(
+            evaluator_role="Test evaluator",
+            min_score=0.7,
+            context=None,
+            scope_values=("accuracy", "relevance")
+        )
 
     def test_builder_fluent_interface(self):
         """Test that builder methods return self for chaining"""
@@ -73,72 +94,95 @@ class TestEvaluationPromptBuilder(unittest.TestCase):
     def test_add_user_query(self):
         """Test adding user query section"""
         self.builder.add_user_query("Test query")
-        self.assertEqual(len(self.builder._sections), 1)
-        self.assertEqual(self.builder._sections[0].title, "USER QUERY:")
-        self.assertEqual(self.builder._sections[0].content, "Test query")
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        self.assertEqual(added_sections(self.builder)[0].title, "USER QUERY:")
+        self.assertEqual(added_sections(self.builder)[0].content, "Test query")
 
     def test_add_response(self):
         """Test adding response section"""
         self.builder.add_response(self.mock_request)
-        self.assertEqual(len(self.builder._sections), 1)
-        self.assertEqual(self.builder._sections[0].title, "RESPONSE TO EVALUATE:")
-        self.assertIn("test-agent", self.builder._sections[0].content)
-        self.assertIn("Test response", self.builder._sections[0].content)
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        self.assertEqual(added_sections(self.builder)[0].title, "RESPONSE TO EVALUATE:")
+        self.assertIn("Response from agent 'test-agent':\nTest response", added_sections(self.builder)[0].content)
 
     def test_add_agent_instructions(self):
         """Test adding agent instructions"""
-        agent_instructions = Mock(spec=AgentInstructions)
-        agent_instructions.name = "test-agent"
-        agent_instructions.description = "Test description"
+        agent_instructions = SimpleNamespace(name="test-agent", description="Test description")
 
         self.builder.add_agent_instructions(agent_instructions)
-        self.assertEqual(len(self.builder._sections), 1)
-        self.assertEqual(self.builder._sections[0].title, "AGENT INSTRUCTIONS:")
-        self.assertIn("test-agent", self.builder._sections[0].content)
-        self.assertIn("Test description", self.builder._sections[0].content)
-        self.assertIn("SCORING GUIDELINES", self.builder._sections[0].content)
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        self.assertEqual(added_sections(self.builder)[0].title, "AGENT INSTRUCTIONS:")
+        self.assertIn("test-agent", added_sections(self.builder)[0].content)
+        self.assertIn("Test description", added_sections(self.builder)[0].content)
+        self.assertIn("SCORING GUIDELINES", added_sections(self.builder)[0].content)
 
     def test_add_agent_instructions_none(self):
         """Test that None agent instructions are skipped"""
         self.builder.add_agent_instructions(None)
-        self.assertEqual(len(self.builder._sections), 0)
+        self.assertEqual(len(added_sections(self.builder)), 0)
+
+    def test_agent_instructions_reused_for_same_agent(self):
+        """Test the agent instructions section is rendered once per agent"""
+        agent_instructions = AgentInstructions(name="test-agent", description="Test description", system_prompt="")
+        first = EvaluationPromptBuilder().add_agent_instructions(agent_instructions)
+        second = EvaluationPromptBuilder().add_agent_instructions(agent_instructions)
+        self.assertIs(added_sections(first)[0].content, added_sections(second)[0].content)
+
+        other = AgentInstructions(name="other-agent", description="Other description", system_prompt="")
+        self.assertIn("other-agent", added_sections(EvaluationPromptBuilder().add_agent_instructions(other))[0].content)
 
     def test_add_context(self):
         """Test adding additional context"""
         self.builder.add_context("Additional context here")
-        self.assertEqual(len(self.builder._sections), 1)
-        self.assertEqual(self.builder._sections[0].title, "ADDITIONAL CONTEXT:")
-        self.assertIn("Additional context here", self.builder._sections[0].content)
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        self.assertEqual(added_sections(self.builder)[0].title, "ADDITIONAL CONTEXT:")
+        self.assertIn("Additional context here", added_sections(self.builder)[0].content)
 
     def test_add_context_none(self):
         """Test that None context is skipped"""
         self.builder.add_context(None)
-        self.assertEqual(len(self.builder._sections), 0)
+        self.assertEqual(len(added_sections(self.builder)), 0)
 
     def test_add_golden_examples(self):
         """Test adding golden examples"""
-        example1 = Mock()
-        example1.input = "Example input"
-        example1.expectedOutput = "Example output"
-        example1.metadata = {"key": "value"}
+        example1 = SimpleNamespace(input="Example input", expectedOutput="Example output", metadata={"key": "value"})
 
         self.builder.add_golden_examples([example1])
-        self.assertEqual(len(self.builder._sections), 1)
-        self.assertEqual(self.builder._sections[0].title, "REFERENCE EXAMPLES:")
-        self.assertIn("Example 1:", self.builder._sections[0].content)
-        self.assertIn("Example input", self.builder._sections[0].content)
-        self.assertIn("Example output", self.builder._sections[0].content)
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        self.assertEqual(added_sections(self.builder)[0].title, "REFERENCE EXAMPLES:")
+        self.assertIn("Example 1:", added_sections(self.builder)[0].content)
+        self.assertIn("Example input", added_sections(self.builder)[0].content)
+        self.assertIn("Example output", added_sections(self.builder)[0].content)
+
+    def test_add_golden_examples_metadata(self):
+        """Test example metadata is listed after the expected output, and examples without it are accepted"""
+        with_metadata = GoldenExample(input="in", expectedOutput="out", metadata={"difficulty": "easy", "topic": "math"})
+        without_metadata = type("Example", (), {"input": "plain in", "expectedOutput": "plain out"})()
+
+        self.builder.add_golden_examples([with_metadata, without_metadata])
+        content = added_sections(self.builder)[0].content
+
+        self.assertIn("Expected Output: out (difficulty: easy, topic: math)", content)
+        self.assertIn("Expected Output: plain out\n", content)
+
+    def test_add_golden_examples_braces_kept(self):
+        """Test braces in example text are inserted verbatim rather than treated as template fields"""
+        example = GoldenExample(input="Format {name}", expectedOutput="{'key': 1}")
+
+        self.builder.add_golden_examples([example])
+
+        self.assertIn("Example 1:\nInput: Format {name}\nExpected Output: {'key': 1}\n", added_sections(self.builder)[0].content)
 
     def test_add_golden_examples_none(self):
         """Test that None golden examples are skipped"""
         self.builder.add_golden_examples(None)
-        self.assertEqual(len(self.builder._sections), 0)
+        self.assertEqual(len(added_sections(self.builder)), 0)
 
     def test_add_evaluation_criteria_without_agent(self):
         """Test adding evaluation criteria without agent instructions"""
         self.builder.add_evaluation_criteria(self.mock_params, has_agent_instructions=False)
-        self.assertEqual(len(self.builder._sections), 1)
-        content = self.builder._sections[0].content
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        content = added_sections(self.builder)[0].content
         self.assertIn("Relevance", content)
         self.assertIn("Accuracy", content)
         self.assertNotIn("Compliance", content)
@@ -147,8 +191,8 @@ class TestEvaluationPromptBuilder(unittest.TestCase):
     def test_add_evaluation_criteria_with_agent(self):
         """Test adding evaluation criteria with agent instructions"""
         self.builder.add_evaluation_criteria(self.mock_params, has_agent_instructions=True)
-        self.assertEqual(len(self.builder._sections), 1)
-        content = self.builder._sections[0].content
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        content = added_sections(self.builder)[0].content
         self.assertIn("Relevance", content)
         self.assertIn("Compliance", content)
         self.assertIn("Appropriateness", content)
@@ -160,8 +204,8 @@ class TestEvaluationPromptBuilder(unittest.TestCase):
         self.builder._min_score = 0.8
         self.builder.add_scoring_instructions()
 
-        self.assertEqual(len(self.builder._sections), 1)
-        content = self.builder._sections[0].content
+        self.assertEqual(len(added_sections(self.builder)), 1)
+        content = added_sections(self.builder)[0].content
         self.assertIn("Assessment", content)
         self.assertIn("SCORE:", content)
         self.assertIn("PASSED:", content)
@@ -169,6 +213,42 @@ class TestEvaluationPromptBuilder(unittest.TestCase):
         self.assertIn("CRITERIA_SCORES:", content)
         self.assertIn("0.8", content)
 
+    def test_context_adds_faithfulness_without_changing_params(self):
+        """Test context adds faithfulness to the evaluated scope but not to the parameters"""
+        params = EvaluationParameters(scope="accuracy,relevance")
+
+        builder = EvaluationPromptBuilder().add_context("Context").add_evaluation_criteria(params)
+
+        self.assertEqual(builder._evaluation_scope, "accuracy,relevance,faithfulness")
+        self.assertEqual(params.scope_values, ("accuracy", "relevance"))
+
+    def test_static_sections_reused_for_same_scope(self):
+        """Test criteria and scoring sections are rendered once per scope"""
+        first = EvaluationPromptBuilder().add_evaluation_criteria(self.mock_params).add_scoring_instructions()
+        second = EvaluationPromptBuilder().add_evaluation_criteria(self.mock_params).add_scoring_instructions()
+        for first_section, second_section in zip(added_sections(first), added_sections(second)):
+            self.assertIs(first_section.content, second_section.content)
+
+        other_params = SimpleNamespace(min_score=0.7, scope_values=("clarity",))
+        other = EvaluationPromptBuilder().add_evaluation_criteria(other_params)
+        self.assertIn("clarity", added_sections(other)[0].content)
+        self.assertNotIn("accuracy,relevance", added_sections(other)[0].content)
+
+    def test_static_sections_not_indented(self):
+        """Test template sections do not carry source code indentation into the prompt"""
+        agent_instructions = AgentInstructions(name="test-agent", description="Test description", system_prompt="")
+        builder = (EvaluationPromptBuilder()
+            .add_agent_instructions(agent_instructions)
+            .add_context("Context")
+            .add_golden_examples([GoldenExample(input="in", expectedOutput="out")])
+            .add_evaluation_criteria(self.mock_params, has_agent_instructions=True)
+            .add_scoring_instructions()
+        )
+
+        for section in added_sections(builder):
+            for line in section.content.splitlines():
+                self.assertFalse(line.startswith(" " * 8), f"{section.title or 'section'} line is indented: {line!r}")
+
     def test_add_scoring_instructions_without_scope_raises_error(self):
         """Test that adding scoring instructions without scope raises error"""
         with self.assertRaises(ValueError) as ctx:
@@ -197,11 +277,22 @@ class TestEvaluationPromptBuilder(unittest.TestCase):
         self.assertLess(query_pos, response_pos)
         self.assertLess(response_pos, context_pos)
 
+    def test_build_sections_ordered_regardless_of_add_order(self):
+        """Test that sections added out of order still render in prompt order"""
+        prompt = (self.builder
+            .set_evaluator_role("Test role")
+            .add_context("Context")
+            .add_response(self.mock_request)
+            .add_user_query("Query")
+            .build()
+        )
+
+        self.assertLess(prompt.find("USER QUERY:"), prompt.find("RESPONSE TO EVALUATE:"))
+        self.assertLess(prompt.find("RESPONSE TO EVALUATE:"), prompt.find("ADDITIONAL CONTEXT:"))
+
     def test_build_complete_prompt(self):
         """Test building a complete prompt with all sections"""
-        agent_instructions = Mock(spec=AgentInstructions)
-        agent_instructions.name = "test-agent"
-        agent_instructions.description = "Test description"
+        agent_instructions = SimpleNamespace(name="test-agent", description="Test description")
 
         prompt = (self.builder
             .set_evaluator_role("Test evaluator")
@@ -226,17 +317,19 @@ class TestBuildEvaluationPromptFunction(unittest.TestCase):
     """Test the convenience function build_evaluation_prompt"""
 
     def setUp(self):
-        self.request = Mock(spec=EvaluationRequest)
-        self.request.input = "Test query"
-        self.request.responses = [
-            Mock(target=Mock(type="agent", name="test-agent"), content="Test response")
-        ]
-
-        self.params = Mock(spec=EvaluationParameters)
-        self.params.evaluator_role = "Test evaluator"
-        self.params.min_score = 0.7
-        self.params.context = None
-        self.params.get_scope_list = Mock(return_value=["accuracy", "relevance"])
+        self.request = SimpleNamespace(
+            input="Test query",
+            responses=[
+                SimpleNamespace(target=SimpleNamespace(type="agent", name="test-agent"), content="Test response")
+            ]
+        )
+
+        self.params = SimpleNamespace(
+            evaluator_role="Test evaluator",
+            min_score=0.7,
+            context=None,
+            scope_values=("accuracy", "relevance")
+        )
 
     def test_build_basic_prompt(self):
         """Test building basic prompt without optional parameters"""
@@ -252,9 +345,7 @@ class TestBuildEvaluationPromptFunction(unittest.TestCase):
 
     def test_build_prompt_with_agent_instructions(self):
         """Test building prompt with agent instructions"""
-        agent_instructions = Mock(spec=AgentInstructions)
-        agent_instructions.name = "test-agent"
-        agent_instructions.description = "Test description"
+        agent_instructions = SimpleNamespace(name="test-agent", description="Test description")
 
         prompt = build_evaluation_prompt(
             request=self.request,
@@ -281,10 +372,7 @@ class TestBuildEvaluationPromptFunction(unittest.TestCase):
 
     def test_build_prompt_with_golden_examples(self):
         """Test building prompt with golden examples"""
-        example = Mock()
-        example.input = "Example input"
-        example.expectedOutput = "Example output"
-        example.metadata = None
+        example = SimpleNamespace(input="Example input", expectedOutput="Example output", metadata=None)
 
         prompt = build_evaluation_prompt(
             request=self.request,
@@ -298,9 +386,7 @@ class TestBuildEvaluationPromptFunction(unittest.TestCase):
 
     def test_build_prompt_requires_agent_instructions_false(self):
         """Test that agent instructions are not added when requires_agent_instructions=False"""
-        agent_instructions = Mock(spec=AgentInstructions)
-        agent_instructions.name = "test-agent"
-        agent_instructions.description = "Test description"
+        agent_instructions = SimpleNamespace(name="test-agent", description="Test description")
 
         prompt = build_evaluation_prompt(
             request=self.request,
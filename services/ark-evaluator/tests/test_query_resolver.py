@@ -1,5 +1,6 @@
 """Test suite for QueryResolver"""
 
+import threading
 import pytest
 from unittest.mock import Mock, patch, MagicMock
 from kubernetes import client, config
@@ -92,6 +93,21 @@ class TestQueryResolver:
                 name="test-query"
             )
     
+    @pytest.mark.asyncio
+    async def test_resolve_query_loads_off_event_loop(self, query_resolver, sample_query_ref, sample_query_crd):
+        """Test the blocking CRD fetch runs on the shared Kubernetes thread pool"""
+        loading_threads = []
+
+        def load_query_crd(name, namespace):
+            loading_threads.append(threading.current_thread().name)
+            return sample_query_crd
+
+        with patch.object(query_resolver, '_load_query_crd', side_effect=load_query_crd):
+            result = await query_resolver.resolve_query(sample_query_ref)
+
+        assert result == sample_query_crd
+        assert loading_threads[0].startswith("kube-io")
+
     @pytest.mark.asyncio
     async def test_resolve_query_not_found(self, query_resolver, sample_query_ref):
         """Test query resolution when query not found"""
@@ -1,7 +1,8 @@
 import pytest
 import logging
+import sys
 from typing import Dict, Any
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 from src.evaluator.types import EvaluationParameters, EvaluationScope, EvaluationRequest, Response, QueryTarget
 
@@ -87,6 +88,20 @@ class TestEvaluationParameters:
             params = EvaluationParameters(scope=None)
             assert params.scope == "all"
 
+    def test_default_scope_accepted_without_scope_lookup(self):
+        """Test that the default 'all' scope skips the valid scope lookup used for other scopes"""
+        valid_scopes = MagicMock()
+        valid_scopes.__contains__.return_value = True
+
+        with patch('src.evaluator.types._VALID_SCOPES', valid_scopes):
+            params = EvaluationParameters(scope="all")
+            valid_scopes.__contains__.assert_not_called()
+
+            EvaluationParameters(scope="clarity")
+            valid_scopes.__contains__.assert_called_once_with("clarity")
+
+        assert params.scope == "all"
+
     def test_get_scope_list_method(self):
         """Test the get_scope_list method"""
         # Single scope
@@ -102,6 +117,43 @@ class TestEvaluationParameters:
         expected_all = ["relevance", "accuracy", "conciseness", "completeness", "clarity", "usefulness", "appropriateness", "compliance", "refusal_handling"]
         assert set(params.get_scope_list()) == set(expected_all)
 
+    def test_scope_values_shared_and_list_copied(self):
+        """Test scope values are split once per scope while get_scope_list returns independent lists"""
+        first = EvaluationParameters(scope="relevance,accuracy")
+        second = EvaluationParameters(scope="relevance,accuracy")
+        assert first.scope_values == ("relevance", "accuracy")
+        assert first.scope_values is second.scope_values
+
+        scope_list = first.get_scope_list()
+        scope_list.append("faithfulness")
+        assert first.get_scope_list() == ["relevance", "accuracy"]
+
+        first.scope = "clarity"
+        assert first.scope_values == ("clarity",)
+
+    def test_scope_values_interned(self):
+        """Test scope values parsed from a request are the interned scope strings"""
+        scope = "".join(["relevance, ", "faithfulness"])
+        params = EvaluationParameters(scope=scope)
+
+        assert params.scope_values[1] is sys.intern("faithfulness")
+        assert QueryTarget(type="".join(["ag", "ent"]), name="a").type is sys.intern("agent")
+
+    @pytest.mark.parametrize("key, field, value", [
+        ("min-score", "min_score", 0.8),
+        ("threshold", "min_score", 0.8),
+        ("max-tokens", "max_tokens", 100),
+        ("evaluation.context", "context", "ctx"),
+        ("evaluation-context-source", "context_source", "retrieval"),
+        ("evaluator-role", "evaluator_role", "judge"),
+    ])
+    def test_from_request_params_name_variants(self, key, field, value):
+        """Test parameter names with different separators and aliases map to the same field"""
+        params = EvaluationParameters.from_request_params({key: value})
+
+        assert getattr(params, field) == value
+        assert params.custom_metadata is None
+
     def test_from_request_params_method(self):
         """Test the from_request_params class method"""
         # Valid parameters